@@ -0,0 +1,5 @@
+"""Offline benchmarks of the geetools library.
+
+The benchmarks never reach the Earth Engine servers: the API is initialized with the static list of
+algorithms shipped with ``earthengine-api`` so that only the client-side work is measured.
+"""
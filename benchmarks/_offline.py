@@ -0,0 +1,46 @@
+"""Initialize the Earth Engine API without credentials nor network access."""
+from __future__ import annotations
+
+import ee
+import ee.data
+import requests
+from ee import apitestcase
+
+
+class ServerCallError(RuntimeError):
+    """Raised when a benchmarked method tries to reach a server."""
+
+
+def _blocked(*args, **kwargs):
+    """Replacement of every function reaching a server."""
+    raise ServerCallError("Server calls are not allowed in offline benchmarks")
+
+
+def initialize() -> None:
+    """Initialize the Earth Engine API offline.
+
+    The algorithm signatures are loaded from the static copy shipped with ``earthengine-api`` and every
+    function reaching a server (value computation, asset management, tasks, ``requests`` and the geetools transport) raises a
+    :py:class:`ServerCallError` so that methods relying on server calls are detected instead of hanging.
+    """
+    ee.Reset()
+    ee.data._install_cloud_api_resource = lambda: None
+    ee.data.getAlgorithms = apitestcase.GetAlgorithms
+    ee.Initialize(None, "", project="geetools-benchmarks")
+
+    for name in [
+        "computeValue",
+        "computeFeatures",
+        "getAsset",
+        "getInfo",
+        "listAssets",
+        "listImages",
+        "getList",
+    ]:
+        setattr(ee.data, name, _blocked)
+    requests.get = requests.post = _blocked
+
+    # the HTTP transport of geetools bypasses ``requests.get`` once enabled
+    from geetools import ee_transport
+
+    ee_transport.Transport.get = ee_transport._Http.request = _blocked
@@ -0,0 +1,443 @@
+"""An in-process stand-in of the Earth Engine server to benchmark geetools without credentials.
+
+The :py:class:`FakeBackend` context manager replaces the asset, operation and compute-value endpoints
+of :py:mod:`ee.data` by local implementations working on an in-memory asset tree. The export tasks
+follow a simulated lifecycle (pending, running and then succeeded or failed) advanced at each status
+check, and every endpoint can be slowed down or made to fail to reproduce the behaviour of the server.
+Everything is driven by a seeded random generator and a simulated clock so that runs are reproducible.
+
+.. code-block:: python
+
+    from benchmarks import _offline
+    from benchmarks.backend import FakeBackend
+
+    _offline.initialize()
+
+    import ee
+    import geetools
+
+    with FakeBackend(latency={"getAsset": 0.05}, failures=0.2) as backend:
+        backend.add_asset("projects/geetools-benchmarks/assets/folder/image", "IMAGE")
+        ee.Asset("projects/geetools-benchmarks/assets/folder").iterdir(recursive=True)
+
+    backend.calls
+"""
+from __future__ import annotations
+
+import copy
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import PurePosixPath
+from typing import Any, Callable
+
+import ee
+import ee.data
+
+ENDPOINTS = [
+    "getAsset",
+    "getInfo",
+    "listAssets",
+    "createAsset",
+    "createFolder",
+    "copyAsset",
+    "renameAsset",
+    "deleteAsset",
+    "updateAsset",
+    "newTaskId",
+    "exportImage",
+    "exportTable",
+    "exportMap",
+    "exportVideo",
+    "getOperation",
+    "listOperations",
+    "cancelOperation",
+    "computeValue",
+]
+"The :py:mod:`ee.data` functions replaced by the fake backend."
+
+TASK_ERRORS = [
+    "User memory limit exceeded.",
+    "Computation timed out.",
+    "Internal error.",
+]
+"The error messages of the tasks failing randomly, one per category of :py:data:`geetools.ee_export.ERROR_CATEGORIES`."
+
+
+def _get(dictionary: dict, key: str, defaultValue: Any = None) -> Any:
+    """Get a value from a dictionary, raising like the server when the key is missing."""
+    if key not in dictionary and defaultValue is None:
+        raise ee.EEException(f"Dictionary.get: Dictionary does not contain key: '{key}'.")
+    return dictionary.get(key, defaultValue)
+
+
+FUNCTIONS: dict[str, Callable] = {
+    "Number.add": lambda left, right: left + right,
+    "Number.subtract": lambda left, right: left - right,
+    "Number.multiply": lambda left, right: left * right,
+    "Number.divide": lambda left, right: left / right,
+    "List.size": lambda list: len(list),
+    "List.get": lambda list, index: list[index],
+    "Dictionary.get": _get,
+    "String.cat": lambda string1, string2: string1 + string2,
+}
+"The server algorithms evaluated by default by the fake ``computeValue`` endpoint."
+
+
+CONTAINERS = ["FOLDER", "IMAGE_COLLECTION"]
+"The asset types that can contain other assets."
+
+LEGACY_TYPES = {"Folder": "FOLDER", "ImageCollection": "IMAGE_COLLECTION", "Image": "IMAGE"}
+"The legacy asset type names accepted by the asset endpoints."
+
+
+class FakeBackend:
+    """A context manager replacing the Earth Engine server by an in-memory implementation.
+
+    Parameters:
+        latency: The delay in seconds added to each call, either the same for all the endpoints or a dictionary of delays by endpoint name.
+        errors: The probability of each endpoint (by name) to raise an :py:class:`ee.EEException`.
+        failures: The probability of each export task to fail with one of the :py:data:`TASK_ERRORS`.
+        running: The number of status checks an export task stays in the ``RUNNING`` state.
+        eecu: The mean number of EECU seconds consumed by an export task.
+        tick: The number of seconds the simulated clock advances at each call.
+        seed: The seed of the random generator.
+        project: The project owning the assets and the operations.
+    """
+
+    assets: dict[str, dict]
+    "The asset tree as a dictionary of asset descriptions indexed by asset id."
+
+    operations: dict[str, dict]
+    "The operations created by the export tasks indexed by name."
+
+    functions: dict[str, Callable]
+    "The server algorithms evaluated by ``computeValue`` indexed by name, defaults to :py:data:`FUNCTIONS`."
+
+    calls: Counter
+    "The number of calls made to each endpoint."
+
+    def __init__(
+        self,
+        latency: float | dict[str, float] = 0.0,
+        errors: dict[str, float] | None = None,
+        failures: float = 0.0,
+        running: int = 2,
+        eecu: float = 10.0,
+        tick: float = 1.0,
+        seed: int = 0,
+        project: str = "geetools-benchmarks",
+    ):
+        """Initialize the backend with an empty asset tree."""
+        self.latency = latency
+        self.errors = errors or {}
+        self.failures = failures
+        self.running = running
+        self.eecu = eecu
+        self.tick = tick
+        self.project = project
+        self.assets, self.operations = {}, {}
+        self.functions = dict(FUNCTIONS)
+        self.calls = Counter()
+        self.clock = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self._random = random.Random(seed)
+        self._injected: dict[str, list[str]] = {}
+        self._lock = threading.RLock()
+        self._originals: dict[str, Any] = {}
+
+    def __enter__(self):
+        """Replace the :py:mod:`ee.data` endpoints by the local ones."""
+        # the asset helpers build the root of the user assets from the project
+        self._originals["_cloud_api_user_project"] = getattr(
+            ee.data, "_cloud_api_user_project", None
+        )
+        ee.data._cloud_api_user_project = self.project
+        for name in ENDPOINTS:
+            self._originals[name] = getattr(ee.data, name, None)
+            setattr(ee.data, name, self._endpoint(name))
+        return self
+
+    def __exit__(self, *args):
+        """Restore the original endpoints."""
+        for name, func in self._originals.items():
+            if func is None:
+                delattr(ee.data, name)
+            else:
+                setattr(ee.data, name, func)
+        self._originals = {}
+
+    # -- configuration ---------------------------------------------------------
+    def add_asset(self, asset_id: str, type: str = "IMAGE", **properties) -> dict:
+        """Add an asset to the tree, creating the missing parent folders.
+
+        Parameters:
+            asset_id: The id of the asset (e.g. ``projects/<project>/assets/folder/image``).
+            type: The type of the asset (``IMAGE``, ``TABLE``, ``FOLDER``, ``IMAGE_COLLECTION``...).
+            properties: The properties of the asset.
+
+        Returns:
+            The description of the created asset.
+        """
+        with self._lock:
+            path = PurePosixPath(asset_id)
+            parents = [p for p in path.parents if len(p.parts) > 3]
+            missing = [p for p in parents if self._is_missing(p.as_posix())]
+            for parent in reversed(missing):
+                self._create(parent.as_posix(), "FOLDER")
+            return self._create(asset_id, type, properties)
+
+    def inject(self, endpoint: str, message: str, times: int = 1):
+        """Make the next calls to an endpoint fail with a specific message.
+
+        Use ``"task"`` as endpoint name to make the next export tasks fail instead of raising an error.
+
+        Parameters:
+            endpoint: The name of the endpoint or ``"task"``.
+            message: The error message.
+            times: The number of consecutive calls to fail.
+        """
+        with self._lock:
+            self._injected.setdefault(endpoint, []).extend([message] * times)
+
+    # -- plumbing --------------------------------------------------------------
+    def _endpoint(self, name: str) -> Callable:
+        """Wrap the local implementation of an endpoint with the accounting, latency and errors."""
+        func = getattr(self, f"_{name}")
+
+        def endpoint(*args, **kwargs):
+            with self._lock:
+                self.calls[name] += 1
+                self.clock += timedelta(seconds=self.tick)
+                injected = self._injected.get(name, [])
+                message = injected.pop(0) if injected else None
+                if message is None and self._random.random() < self.errors.get(name, 0):
+                    message = f"Service unavailable, try again ({name})."
+            latency = (
+                self.latency
+                if isinstance(self.latency, (int, float))
+                else self.latency.get(name, 0)
+            )
+            if latency:
+                time.sleep(latency)
+            if message is not None:
+                raise ee.EEException(message)
+            with self._lock:
+                return func(*args, **kwargs)
+
+        endpoint.__name__ = name
+        return endpoint
+
+    def _now(self) -> str:
+        """Return the simulated time formatted as in the server responses."""
+        return self.clock.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def _is_missing(self, asset_id: str) -> bool:
+        """Return True if the asset is neither in the tree nor the root of the project."""
+        asset_id = PurePosixPath(asset_id).as_posix()
+        return asset_id not in self.assets and not self._is_root(asset_id)
+
+    def _is_root(self, asset_id: str) -> bool:
+        """Return True if the id is the root folder of a project or a path above it."""
+        parts = PurePosixPath(asset_id).parts
+        return parts[:1] == ("projects",) and len(parts) > 1 and parts[2:] in [(), ("assets",)]
+
+    def _get(self, asset_id: str) -> dict:
+        """Return the stored description of an asset or raise the server error."""
+        asset_id = PurePosixPath(asset_id).as_posix()
+        if asset_id not in self.assets:
+            raise ee.EEException(
+                f"Asset '{asset_id}' does not exist or doesn't allow this operation."
+            )
+        return self.assets[asset_id]
+
+    def _create(self, asset_id: str, type: str, properties: dict | None = None) -> dict:
+        """Create an asset in the tree checking that its parent exists."""
+        asset_id = PurePosixPath(asset_id).as_posix()
+        if asset_id in self.assets:
+            raise ee.EEException(f"Cannot overwrite asset '{asset_id}'.")
+        if self._is_missing(PurePosixPath(asset_id).parent.as_posix()):
+            raise ee.EEException(f"Parent of asset '{asset_id}' does not exist.")
+        type = LEGACY_TYPES.get(type, type).upper()
+        asset = {"type": type, "name": asset_id, "id": asset_id, "updateTime": self._now()}
+        asset["properties"] = dict(properties or {})
+        if type not in CONTAINERS:
+            asset["sizeBytes"] = str(self._random.randint(1e3, 1e8))
+        self.assets[asset_id] = asset
+        return copy.deepcopy(asset)
+
+    def _children(self, asset_id: str) -> list[str]:
+        """Return the ids of the direct children of an asset."""
+        parent = PurePosixPath(asset_id)
+        if self._is_root(asset_id):
+            parent = PurePosixPath(*parent.parts[:2], "assets")
+        return sorted(a for a in self.assets if PurePosixPath(a).parent == parent)
+
+    # -- assets ----------------------------------------------------------------
+    def _getAsset(self, asset_id: str) -> dict:
+        return copy.deepcopy(self._get(asset_id))
+
+    def _getInfo(self, asset_id: str) -> dict | None:
+        asset = self.assets.get(PurePosixPath(asset_id).as_posix())
+        return copy.deepcopy(asset)
+
+    def _listAssets(self, params: str | dict) -> dict:
+        params = {"parent": params} if isinstance(params, str) else params
+        parent = params["parent"]
+        if self._is_missing(parent):
+            self._get(parent)
+        children = self._children(parent)
+        start = int(params.get("pageToken", 0))
+        end = start + int(params.get("pageSize", len(children)))
+        result = {"assets": [copy.deepcopy(self.assets[a]) for a in children[start:end]]}
+        if end < len(children) and "pageSize" in params:
+            result["nextPageToken"] = str(end)
+        return result
+
+    def _createAsset(self, value: dict, path: str | None = None, properties: dict | None = None):
+        asset_id = value.get("name", path)
+        return self._create(asset_id, value["type"], value.get("properties", properties))
+
+    def _createFolder(self, path: str) -> dict:
+        return self._create(path, "FOLDER")
+
+    def _copyAsset(self, sourceId: str, destinationId: str, allowOverwrite: bool = False):
+        source = self._get(sourceId)
+        destinationId = PurePosixPath(destinationId).as_posix()
+        if source["type"] in CONTAINERS:
+            raise ee.EEException(f"Cannot copy the container '{sourceId}'.")
+        if destinationId in self.assets and allowOverwrite is False:
+            raise ee.EEException(f"Cannot overwrite asset '{destinationId}'.")
+        self.assets.pop(destinationId, None)
+        self._create(destinationId, source["type"], source["properties"])
+
+    def _renameAsset(self, sourceId: str, destinationId: str):
+        self._copyAsset(sourceId, destinationId)
+        self._deleteAsset(sourceId)
+
+    def _deleteAsset(self, assetId: str):
+        self._get(assetId)
+        if self._children(assetId):
+            raise ee.EEException(f"Cannot delete the non-empty container '{assetId}'.")
+        del self.assets[PurePosixPath(assetId).as_posix()]
+
+    def _updateAsset(self, asset_id: str, asset: dict, update_mask: list[str]):
+        stored = self._get(asset_id)
+        for field in update_mask:
+            if field.startswith("properties."):
+                key = field.split(".", 1)[1]
+                stored["properties"][key] = asset.get("properties", {}).get(key)
+            else:
+                stored[field] = asset.get(field)
+        stored["updateTime"] = self._now()
+
+    # -- operations ------------------------------------------------------------
+    def _newTaskId(self, count: int = 1) -> list[str]:
+        return [f"{self._random.getrandbits(96):024X}" for _ in range(count)]
+
+    def _export(self, request_id: str | list, params: dict, type: str) -> dict:
+        """Create the operation of an export task."""
+        request_id = request_id[0] if isinstance(request_id, list) else request_id
+        if isinstance(params.get("expression"), ee.encodable.Encodable):
+            params["expression"] = ee.serializer.encode(params["expression"], for_cloud_api=True)
+        name = f"projects/{self.project}/operations/{request_id}"
+        metadata = {
+            "@type": "type.googleapis.com/google.earthengine.v1alpha.OperationMetadata",
+            "state": "PENDING",
+            "description": params.get("description", ""),
+            "type": type,
+            "createTime": self._now(),
+            "updateTime": self._now(),
+        }
+        injected = self._injected.get("task", [])
+        error = injected.pop(0) if injected else None
+        if error is None and self._random.random() < self.failures:
+            error = self._random.choice(TASK_ERRORS)
+        destination = params.get("assetExportOptions", {}).get("earthEngineDestination", {})
+        self.operations[name] = {
+            "operation": {"name": name, "metadata": metadata, "done": False},
+            "polls": 0,
+            "error": error,
+            "destination": destination.get("name"),
+        }
+        return copy.deepcopy(self.operations[name]["operation"])
+
+    def _exportImage(self, request_id: str, params: dict) -> dict:
+        return self._export(request_id, params, "EXPORT_IMAGE")
+
+    def _exportTable(self, request_id: str, params: dict) -> dict:
+        return self._export(request_id, params, "EXPORT_FEATURES")
+
+    def _exportMap(self, request_id: str, params: dict) -> dict:
+        return self._export(request_id, params, "EXPORT_TILES")
+
+    def _exportVideo(self, request_id: str, params: dict) -> dict:
+        return self._export(request_id, params, "EXPORT_VIDEO")
+
+    def _getOperation(self, operation_name: str) -> dict:
+        if operation_name not in self.operations:
+            raise ee.EEException(f"Operation '{operation_name}' not found.")
+        stored = self.operations[operation_name]
+        self._advance(stored)
+        return copy.deepcopy(stored["operation"])
+
+    def _advance(self, stored: dict):
+        """Move an operation to its next state of the lifecycle."""
+        operation, metadata = stored["operation"], stored["operation"]["metadata"]
+        if operation["done"]:
+            return
+        stored["polls"] += 1
+        metadata["updateTime"] = self._now()
+        if metadata["state"] == "PENDING":
+            metadata["state"], metadata["startTime"] = "RUNNING", self._now()
+        elif stored["polls"] > self.running:
+            operation["done"] = True
+            metadata["endTime"] = self._now()
+            metadata["batchEecuUsageSeconds"] = self._random.uniform(0.5, 1.5) * self.eecu
+            if stored["error"] is not None:
+                metadata["state"] = "FAILED"
+                operation["error"] = {"code": 3, "message": stored["error"]}
+            else:
+                metadata["state"] = "SUCCEEDED"
+                if stored["destination"] is not None:
+                    type = "IMAGE" if metadata["type"] == "EXPORT_IMAGE" else "TABLE"
+                    self.assets.pop(stored["destination"], None)
+                    self._create(stored["destination"], type)
+
+    def _listOperations(self, project: str | None = None) -> list[dict]:
+        return [copy.deepcopy(s["operation"]) for s in self.operations.values()]
+
+    def _cancelOperation(self, operation_name: str):
+        if operation_name not in self.operations:
+            raise ee.EEException(f"Operation '{operation_name}' not found.")
+        operation = self.operations[operation_name]["operation"]
+        if not operation["done"]:
+            operation["done"] = True
+            operation["metadata"].update(state="CANCELLED", endTime=self._now())
+            operation["error"] = {"code": 1, "message": "Cancelled."}
+
+    # -- computation -----------------------------------------------------------
+    def _computeValue(self, obj: ee.ComputedObject) -> Any:
+        graph = ee.serializer.encode(obj, for_cloud_api=True)
+        return self._evaluate({"valueReference": graph["result"]}, graph["values"])
+
+    def _evaluate(self, node: dict, values: dict) -> Any:
+        """Evaluate a node of a serialized expression graph with the registered functions."""
+        if "constantValue" in node:
+            return node["constantValue"]
+        if "valueReference" in node:
+            return self._evaluate(values[node["valueReference"]], values)
+        if "arrayValue" in node:
+            return [self._evaluate(v, values) for v in node["arrayValue"]["values"]]
+        if "dictionaryValue" in node:
+            items = node["dictionaryValue"]["values"].items()
+            return {k: self._evaluate(v, values) for k, v in items}
+        if "functionInvocationValue" in node:
+            invocation = node["functionInvocationValue"]
+            name = invocation.get("functionName")
+            if name not in self.functions:
+                raise ee.EEException(f"Algorithm '{name}' is not implemented by the fake backend.")
+            arguments = invocation.get("arguments", {}).items()
+            return self.functions[name](**{k: self._evaluate(v, values) for k, v in arguments})
+        raise ee.EEException(f"Cannot evaluate the node {node} in the fake backend.")
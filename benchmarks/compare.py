@@ -0,0 +1,68 @@
+"""Compare 2 benchmark reports and list the regressions.
+
+.. code-block:: console
+
+    python -m benchmarks.compare main.json branch.json --threshold 0.2
+
+The command exits with a non-zero status if any measurement of the new report is more than
+``threshold`` above the reference one, so it can be used as a CI gate.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+METRICS = ["build", "encode", "bytes", "nodes", "depth", "time", "calls"]
+"The metrics compared between the 2 reports."
+
+
+def compare(reference: dict, new: dict, threshold: float, min_time: float = 1e-3) -> list[dict]:
+    """Return the measurements of the new report that regressed compared to the reference.
+
+    Parameters:
+        reference: The reference report.
+        new: The new report.
+        threshold: The relative increase from which a measurement is a regression (e.g. ``0.2`` for 20%).
+        min_time: Timings below this value in seconds are ignored as they are too noisy.
+
+    Returns:
+        The list of regressions with the case name, the size, the metric and both values.
+    """
+    regressions = []
+    for name, rows in new["results"].items():
+        reference_rows = {r["size"]: r for r in reference["results"].get(name, [])}
+        for row in rows:
+            ref = reference_rows.get(row["size"], {})
+            for metric in METRICS:
+                old, value = ref.get(metric), row.get(metric)
+                if old is None or value is None:
+                    continue
+                if metric in ["build", "encode", "time"] and value < min_time:
+                    continue
+                if value > old * (1 + threshold):
+                    regression = {"case": name, "size": row["size"], "metric": metric}
+                    regressions.append({**regression, "reference": old, "new": value})
+    return regressions
+
+
+def main():
+    """Compare 2 reports from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("reference", help="the reference json report")
+    parser.add_argument("new", help="the new json report")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with open(args.reference) as r, open(args.new) as n:
+        regressions = compare(json.load(r), json.load(n), args.threshold)
+
+    for r in regressions:
+        print(
+            f"{r['case']:<55} n={r['size']:<5} {r['metric']:<7} {r['reference']:.4g} -> {r['new']:.4g}"
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
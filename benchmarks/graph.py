@@ -0,0 +1,440 @@
+"""Benchmark the client-side graph construction of every public accessor method.
+
+For each method and each input size, the benchmark measures the time spent building the expression
+graph in Python, the time spent serializing it with :py:func:`ee.serializer.encode` and the size
+metrics of the graph (see :py:meth:`ee.ComputedObject.geetools_graph_stats`). The size drives the
+number of bands of the images, the number of labels and the number of regions of the inputs.
+
+Run it from the root of the repository:
+
+.. code-block:: console
+
+    python -m benchmarks.graph --sizes 4 32 128 --output .benchmarks/graph.json
+
+Methods that need to reach the server (e.g. the ``plot_*`` family) are reported in the ``server``
+section of the output, the cases failing are reported in the ``errors`` section and the public
+methods without a benchmark case are reported in the ``missing`` section so that new methods are
+not forgotten.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from . import _offline
+
+_offline.initialize()
+
+import ee  # noqa: E402
+
+import geetools  # noqa: E402
+
+ACCESSORS = [
+    "ImageAccessor",
+    "ImageCollectionAccessor",
+    "FeatureCollectionAccessor",
+    "FeatureAccessor",
+    "ListAccessor",
+    "DictionaryAccessor",
+    "StringAccessor",
+    "NumberAccessor",
+    "DateAccessor",
+    "DateRangeAccessor",
+    "GeometryAccessor",
+    "FilterAccessor",
+    "JoinAccessor",
+    "ArrayAccessor",
+]
+"The accessor classes whose public methods are benchmarked."
+
+
+# -- inputs --------------------------------------------------------------------
+def bands(n: int) -> list[str]:
+    """Return n band names."""
+    return [f"B{i}" for i in range(n)]
+
+
+def labels(n: int) -> list[str]:
+    """Return n labels."""
+    return [f"label_{i}" for i in range(n)]
+
+
+def image(n: int) -> ee.Image:
+    """Return a constant image with n bands."""
+    return ee.Image.constant(list(range(n))).rename(bands(n)).set("system:time_start", 0)
+
+
+def collection(n: int) -> ee.ImageCollection:
+    """Return an asset image collection selecting n bands."""
+    ic = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").filterDate("2020-01-01", "2020-02-01")
+    return ic.select(bands(n))
+
+
+def regions(n: int) -> ee.FeatureCollection:
+    """Return a feature collection of n buffered points with a label and a value."""
+    features = [
+        ee.Feature(ee.Geometry.Point([i * 0.01, 0]).buffer(100), {"label": f"r{i}", "value": i})
+        for i in range(n)
+    ]
+    return ee.FeatureCollection(features)
+
+
+def region() -> ee.Geometry:
+    """Return a small region of interest."""
+    return ee.Geometry.Point([0, 0]).buffer(1000)
+
+
+# -- benchmark cases -----------------------------------------------------------
+# each case builds the graph of one method for an input of size n
+CASES: dict[str, Callable[[int], object]] = {
+    # ee.Image
+    "ImageAccessor.addDate": lambda n: image(n).geetools.addDate(),
+    "ImageAccessor.addPrefix": lambda n: image(n).geetools.addPrefix("pre_", bands(n)),
+    "ImageAccessor.addSuffix": lambda n: image(n).geetools.addSuffix("_suf", bands(n)),
+    "ImageAccessor.bufferMask": lambda n: image(n).geetools.bufferMask(),
+    "ImageAccessor.byBands": lambda n: image(n).geetools.byBands(
+        regions(n), bands=bands(n), labels=labels(n), regionId="label", scale=30
+    ),
+    "ImageAccessor.byRegions": lambda n: image(n).geetools.byRegions(
+        regions(n), bands=bands(n), labels=labels(n), regionId="label", scale=30
+    ),
+    "ImageAccessor.clipOnCollection": lambda n: image(n).geetools.clipOnCollection(regions(n)),
+    "ImageAccessor.distance": lambda n: image(n).geetools.distance(image(n)),
+    "ImageAccessor.distanceToMask": lambda n: image(n).geetools.distanceToMask(image(1)),
+    "ImageAccessor.doyToDate": lambda n: image(n).geetools.doyToDate(2020),
+    "ImageAccessor.format": lambda n: image(n).geetools.format("{system:time_start}_{foo}"),
+    "ImageAccessor.fromList": lambda n: ee.Image.geetools.fromList([image(1)] * n),
+    "ImageAccessor.full": lambda n: ee.Image.geetools.full(list(range(n)), bands(n)),
+    "ImageAccessor.fullLike": lambda n: image(n).geetools.fullLike(0),
+    "ImageAccessor.gauss": lambda n: image(n).geetools.gauss("B0"),
+    "ImageAccessor.getValues": lambda n: image(n).geetools.getValues(ee.Geometry.Point([0, 0])),
+    "ImageAccessor.interpolateBands": lambda n: image(n).geetools.interpolateBands([0, 1], [0, 10]),
+    "ImageAccessor.isletMask": lambda n: image(n).geetools.isletMask(10),
+    "ImageAccessor.maskCover": lambda n: image(n).geetools.maskCover(scale=30),
+    "ImageAccessor.maskCoverRegion": lambda n: image(n).geetools.maskCoverRegion(region(), 30),
+    "ImageAccessor.maskCoverRegions": lambda n: image(n).geetools.maskCoverRegions(regions(n), 30),
+    "ImageAccessor.matchHistogram": lambda n: image(n).geetools.matchHistogram(
+        image(n), dict(zip(bands(n), bands(n))), region()
+    ),
+    "ImageAccessor.merge": lambda n: image(1).geetools.merge([image(1)] * n),
+    "ImageAccessor.minScale": lambda n: image(n).geetools.minScale(),
+    "ImageAccessor.negativeClip": lambda n: image(n).geetools.negativeClip(regions(n)),
+    "ImageAccessor.reduceBands": lambda n: image(n).geetools.reduceBands("mean", bands(n)),
+    "ImageAccessor.remove": lambda n: image(n).geetools.remove(bands(n)[: n // 2]),
+    "ImageAccessor.removeProperties": lambda n: image(n).geetools.removeProperties(labels(n)),
+    "ImageAccessor.removeZeros": lambda n: image(n).geetools.removeZeros(),
+    "ImageAccessor.rename": lambda n: image(n).geetools.rename(dict(zip(bands(n), labels(n)))),
+    "ImageAccessor.repeat": lambda n: image(1).geetools.repeat("B0", n),
+    "ImageAccessor.toGrid": lambda n: image(n).geetools.toGrid(1, "B0", region()),
+    # ee.ImageCollection
+    "ImageCollectionAccessor.aggregateArray": lambda n: collection(n).geetools.aggregateArray(
+        labels(n)
+    ),
+    "ImageCollectionAccessor.append": lambda n: collection(n).geetools.append(image(n)),
+    "ImageCollectionAccessor.closest": lambda n: collection(n).geetools.closest("2020-01-15"),
+    "ImageCollectionAccessor.closestDate": lambda n: collection(n).geetools.closestDate(),
+    "ImageCollectionAccessor.collectionMask": lambda n: collection(n).geetools.collectionMask(),
+    "ImageCollectionAccessor.containsAllBands": lambda n: collection(n).geetools.containsAllBands(
+        bands(n)
+    ),
+    "ImageCollectionAccessor.containsAnyBands": lambda n: collection(n).geetools.containsAnyBands(
+        bands(n)
+    ),
+    "ImageCollectionAccessor.containsBandNames": lambda n: collection(n).geetools.containsBandNames(
+        bands(n), "ALL"
+    ),
+    "ImageCollectionAccessor.datesByBands": lambda n: collection(n).geetools.datesByBands(
+        region(), bands=bands(n), labels=labels(n), scale=30
+    ),
+    "ImageCollectionAccessor.datesByRegions": lambda n: collection(n).geetools.datesByRegions(
+        "B0", regions(n), "label", scale=30
+    ),
+    "ImageCollectionAccessor.doyByBands": lambda n: collection(n).geetools.doyByBands(
+        region(), bands=bands(n), labels=labels(n), scale=30
+    ),
+    "ImageCollectionAccessor.doyByRegions": lambda n: collection(n).geetools.doyByRegions(
+        "B0", regions(n), "label", scale=30
+    ),
+    "ImageCollectionAccessor.doyBySeasons": lambda n: collection(n).geetools.doyBySeasons(
+        "B0", region(), 100, 200, scale=30
+    ),
+    "ImageCollectionAccessor.doyByYears": lambda n: collection(n).geetools.doyByYears(
+        "B0", region(), scale=30
+    ),
+    "ImageCollectionAccessor.groupInterval": lambda n: collection(n).geetools.groupInterval(),
+    "ImageCollectionAccessor.iloc": lambda n: collection(n).geetools.iloc(0),
+    "ImageCollectionAccessor.integral": lambda n: collection(n).geetools.integral("B0"),
+    "ImageCollectionAccessor.medoid": lambda n: collection(n).geetools.medoid(),
+    "ImageCollectionAccessor.outliers": lambda n: collection(n).geetools.outliers(bands(n)),
+    "ImageCollectionAccessor.reduceBy": lambda n: collection(n).geetools.reduceBy(
+        "SENSING_ORBIT_NUMBER"
+    ),
+    "ImageCollectionAccessor.reduceInterval": lambda n: collection(n).geetools.reduceInterval(),
+    "ImageCollectionAccessor.reduceRegion": lambda n: collection(n).geetools.reduceRegion(
+        "mean", region(), scale=30
+    ),
+    "ImageCollectionAccessor.reduceRegions": lambda n: collection(n).geetools.reduceRegions(
+        "mean", regions(n), scale=30
+    ),
+    "ImageCollectionAccessor.validPixel": lambda n: collection(n).geetools.validPixel("B0"),
+    # ee.FeatureCollection
+    "FeatureCollectionAccessor.addId": lambda n: regions(n).geetools.addId(),
+    "FeatureCollectionAccessor.byFeatures": lambda n: regions(n).geetools.byFeatures(
+        "label", ["value"]
+    ),
+    "FeatureCollectionAccessor.byProperties": lambda n: regions(n).geetools.byProperties(
+        "label", ["value"]
+    ),
+    "FeatureCollectionAccessor.fromGeoInterface": lambda n: ee.FeatureCollection.geetools.fromGeoInterface(
+        {"type": "FeatureCollection", "features": regions_geojson(n)}
+    ),
+    "FeatureCollectionAccessor.mergeGeometries": lambda n: regions(n).geetools.mergeGeometries(),
+    "FeatureCollectionAccessor.toDictionary": lambda n: regions(n).geetools.toDictionary("label"),
+    "FeatureCollectionAccessor.toImage": lambda n: regions(n).geetools.toImage(),
+    "FeatureCollectionAccessor.toPolygons": lambda n: regions(n).geetools.toPolygons(),
+    # ee.Feature
+    "FeatureAccessor.removeProperties": lambda n: ee.Feature(
+        None, dict.fromkeys(labels(n), 1)
+    ).geetools.removeProperties(labels(n)),
+    "FeatureAccessor.toFeatureCollection": lambda n: ee.Feature(
+        ee.Geometry.MultiPoint([[i, i] for i in range(n)])
+    ).geetools.toFeatureCollection(),
+    # ee.List
+    "ListAccessor.complement": lambda n: ee.List(labels(n)).geetools.complement(labels(n // 2)),
+    "ListAccessor.delete": lambda n: ee.List(labels(n)).geetools.delete(0),
+    "ListAccessor.intersection": lambda n: ee.List(labels(n)).geetools.intersection(labels(n)),
+    "ListAccessor.join": lambda n: ee.List(labels(n)).geetools.join(),
+    "ListAccessor.product": lambda n: ee.List(labels(n)).geetools.product(labels(n)),
+    "ListAccessor.replaceMany": lambda n: ee.List(labels(n)).geetools.replaceMany(
+        dict(zip(labels(n), bands(n)))
+    ),
+    "ListAccessor.sequence": lambda n: ee.List.geetools.sequence(0, n),
+    "ListAccessor.toStrings": lambda n: ee.List(list(range(n))).geetools.toStrings(),
+    "ListAccessor.union": lambda n: ee.List(labels(n)).geetools.union(bands(n)),
+    "ListAccessor.zip": lambda n: ee.List([labels(n), bands(n)]).geetools.zip(),
+    # ee.Dictionary
+    "DictionaryAccessor.fromPairs": lambda n: ee.Dictionary.geetools.fromPairs(
+        [list(p) for p in zip(labels(n), range(n))]
+    ),
+    "DictionaryAccessor.getMany": lambda n: ee.Dictionary(
+        dict(zip(labels(n), range(n)))
+    ).geetools.getMany(labels(n)),
+    "DictionaryAccessor.sort": lambda n: ee.Dictionary(
+        dict(zip(labels(n), range(n)))
+    ).geetools.sort(),
+    # ee.String
+    "StringAccessor.eq": lambda n: ee.String("foo").geetools.eq("bar"),
+    "StringAccessor.format": lambda n: ee.String(
+        " ".join(f"{{{lbl}}}" for lbl in labels(n))
+    ).geetools.format(dict(zip(labels(n), range(n)))),
+    # ee.Number
+    "NumberAccessor.truncate": lambda n: ee.Number(3.14159).geetools.truncate(n % 10),
+    # ee.Date
+    "DateAccessor.check_unit": lambda n: ee.Date.geetools.check_unit("day"),
+    "DateAccessor.fromDOY": lambda n: ee.Date.geetools.fromDOY(n, 2020),
+    "DateAccessor.fromEpoch": lambda n: ee.Date.geetools.fromEpoch(n),
+    "DateAccessor.getUnitSinceEpoch": lambda n: ee.Date("2020-01-01").geetools.getUnitSinceEpoch(),
+    "DateAccessor.isLeap": lambda n: ee.Date("2020-01-01").geetools.isLeap(),
+    "DateAccessor.now": lambda n: ee.Date.geetools.now(),
+    # ee.DateRange
+    "DateRangeAccessor.check_unit": lambda n: ee.DateRange.geetools.check_unit("day"),
+    "DateRangeAccessor.split": lambda n: ee.DateRange("2020-01-01", "2021-01-01").geetools.split(n),
+    "DateRangeAccessor.unitMillis": lambda n: ee.DateRange.geetools.unitMillis("day"),
+    # ee.Geometry
+    "GeometryAccessor.keepType": lambda n: ee.Geometry.MultiPoint(
+        [[i, i] for i in range(n)]
+    ).geetools.keepType("Point"),
+    # ee.Filter
+    "FilterAccessor.dateRange": lambda n: ee.Filter.geetools.dateRange(
+        ee.DateRange("2020-01-01", "2021-01-01")
+    ),
+    # ee.Join
+    "JoinAccessor.byProperty": lambda n: ee.Join.geetools.byProperty(
+        regions(n), regions(n), "label"
+    ),
+    # ee.Array
+    "ArrayAccessor.full": lambda n: ee.Array.geetools.full(n, n, 0),
+    "ArrayAccessor.set": lambda n: ee.Array([[0] * n] * n).geetools.set(0, 0, 1),
+}
+"The benchmark cases indexed by ``<Accessor>.<method>``."
+
+
+# methods that are expected to reach the server, they are only checked to do so
+S2 = "COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM"
+CASES.update(
+    {
+        "DateAccessor.to_datetime": lambda n: ee.Date("2020-01-01").geetools.to_datetime(),
+        "FeatureCollectionAccessor.plot": lambda n: regions(n).geetools.plot(property="value"),
+        "FeatureCollectionAccessor.plot_by_features": lambda n: regions(
+            n
+        ).geetools.plot_by_features(featureId="label", properties=["value"]),
+        "FeatureCollectionAccessor.plot_by_properties": lambda n: regions(
+            n
+        ).geetools.plot_by_properties(featureId="label", properties=["value"]),
+        "FeatureCollectionAccessor.plot_hist": lambda n: regions(n).geetools.plot_hist("value"),
+        "FeatureCollectionAccessor.toGeoDataFrame": lambda n: regions(n).geetools.toGeoDataFrame(),
+        "ImageAccessor.getCitation": lambda n: ee.Image(S2).geetools.getCitation(),
+        "ImageAccessor.getDOI": lambda n: ee.Image(S2).geetools.getDOI(),
+        "ImageAccessor.getOffsetParams": lambda n: ee.Image(S2).geetools.getOffsetParams(),
+        "ImageAccessor.getSTAC": lambda n: ee.Image(S2).geetools.getSTAC(),
+        "ImageAccessor.getScaleParams": lambda n: ee.Image(S2).geetools.getScaleParams(),
+        "ImageAccessor.index_list": lambda n: ee.Image.geetools.index_list(),
+        "ImageAccessor.maskClouds": lambda n: ee.Image(S2).geetools.maskClouds(),
+        "ImageAccessor.panSharpen": lambda n: ee.Image(S2).geetools.panSharpen(),
+        "ImageAccessor.plot": lambda n: image(3).geetools.plot(bands(3), region()),
+        "ImageAccessor.plot_by_bands": lambda n: image(n).geetools.plot_by_bands(
+            "bar", regions(n), bands=bands(n), regionId="label", scale=30
+        ),
+        "ImageAccessor.plot_by_regions": lambda n: image(n).geetools.plot_by_regions(
+            "bar", regions(n), bands=bands(n), regionId="label", scale=30
+        ),
+        "ImageAccessor.plot_hist": lambda n: image(n).geetools.plot_hist(region=region()),
+        "ImageAccessor.preprocess": lambda n: ee.Image(S2).geetools.preprocess(),
+        "ImageAccessor.scaleAndOffset": lambda n: ee.Image(S2).geetools.scaleAndOffset(),
+        "ImageAccessor.spectralIndices": lambda n: ee.Image(S2).geetools.spectralIndices(),
+        "ImageAccessor.tasseledCap": lambda n: ee.Image(S2).geetools.tasseledCap(),
+        "ImageCollectionAccessor.getCitation": lambda n: collection(n).geetools.getCitation(),
+        "ImageCollectionAccessor.getDOI": lambda n: collection(n).geetools.getDOI(),
+        "ImageCollectionAccessor.getOffsetParams": lambda n: collection(
+            n
+        ).geetools.getOffsetParams(),
+        "ImageCollectionAccessor.getSTAC": lambda n: collection(n).geetools.getSTAC(),
+        "ImageCollectionAccessor.getScaleParams": lambda n: collection(n).geetools.getScaleParams(),
+        "ImageCollectionAccessor.maskClouds": lambda n: collection(n).geetools.maskClouds(),
+        "ImageCollectionAccessor.panSharpen": lambda n: collection(n).geetools.panSharpen(),
+        "ImageCollectionAccessor.plot_dates_by_bands": lambda n: collection(
+            n
+        ).geetools.plot_dates_by_bands(region(), bands=bands(n), scale=30),
+        "ImageCollectionAccessor.plot_dates_by_regions": lambda n: collection(
+            n
+        ).geetools.plot_dates_by_regions("B0", regions(n), "label", scale=30),
+        "ImageCollectionAccessor.plot_doy_by_bands": lambda n: collection(
+            n
+        ).geetools.plot_doy_by_bands(region(), bands=bands(n), scale=30),
+        "ImageCollectionAccessor.plot_doy_by_regions": lambda n: collection(
+            n
+        ).geetools.plot_doy_by_regions("B0", regions(n), "label", scale=30),
+        "ImageCollectionAccessor.plot_doy_by_seasons": lambda n: collection(
+            n
+        ).geetools.plot_doy_by_seasons("B0", region(), 100, 200, scale=30),
+        "ImageCollectionAccessor.plot_doy_by_years": lambda n: collection(
+            n
+        ).geetools.plot_doy_by_years("B0", region(), scale=30),
+        "ImageCollectionAccessor.preprocess": lambda n: collection(n).geetools.preprocess(),
+        "ImageCollectionAccessor.scaleAndOffset": lambda n: collection(n).geetools.scaleAndOffset(),
+        "ImageCollectionAccessor.schema": lambda n: collection(n).geetools.schema(),
+        "ImageCollectionAccessor.spectralIndices": lambda n: collection(
+            n
+        ).geetools.spectralIndices(),
+        "ImageCollectionAccessor.tasseledCap": lambda n: collection(n).geetools.tasseledCap(),
+        "ImageCollectionAccessor.to_xarray": lambda n: collection(n).geetools.to_xarray(),
+    }
+)
+
+
+def regions_geojson(n: int) -> list[dict]:
+    """Return n GeoJSON point features."""
+    point = lambda i: {"type": "Point", "coordinates": [i * 0.01, 0]}  # noqa: E731
+    return [{"type": "Feature", "geometry": point(i), "properties": {"v": i}} for i in range(n)]
+
+
+# -- runner --------------------------------------------------------------------
+def public_methods() -> list[str]:
+    """Return the name of all the public methods of the benchmarked accessors."""
+    names = []
+    for accessor in ACCESSORS:
+        klass = getattr(geetools, accessor)
+        members = inspect.getmembers(klass, callable)
+        names += [f"{accessor}.{n}" for n, _ in members if not n.startswith("_")]
+    return names
+
+
+def run_case(case: Callable, size: int, repeat: int) -> dict:
+    """Time the graph construction and serialization of a case and measure the graph."""
+    build, encode = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        obj = case(size)
+        build.append(time.perf_counter() - start)
+        if not isinstance(obj, ee.ComputedObject):
+            encode.append(0.0)
+            continue
+        start = time.perf_counter()
+        ee.serializer.encode(obj, for_cloud_api=True)
+        encode.append(time.perf_counter() - start)
+
+    result = {"size": size, "build": statistics.median(build), "encode": statistics.median(encode)}
+    if isinstance(obj, ee.ComputedObject):
+        result.update(obj.geetools_graph_stats())
+    return result
+
+
+def run(sizes: list[int], repeat: int = 5, select: str = "") -> dict:
+    """Run all the benchmark cases.
+
+    Parameters:
+        sizes: The input sizes to benchmark.
+        repeat: The number of repetitions of each measurement, the median is kept.
+        select: Only run the cases whose name contains this string.
+
+    Returns:
+        The benchmark report.
+    """
+    results, server, errors = {}, [], {}
+    for name, case in CASES.items():
+        if select not in name:
+            continue
+        try:
+            results[name] = [run_case(case, size, repeat) for size in sizes]
+        except _offline.ServerCallError:
+            server.append(name)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    return {
+        "metadata": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "geetools": geetools.__version__,
+            "earthengine-api": ee.__version__,
+            "python": platform.python_version(),
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+        "server": server,
+        "errors": errors,
+        "missing": sorted(set(public_methods()) - set(CASES)),
+    }
+
+
+def main():
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 32, 128])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--select", default="", help="only run the cases containing this string")
+    parser.add_argument("--output", default=".benchmarks/graph.json", help="the json file to write")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat, args.select)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    for name, rows in report["results"].items():
+        last = rows[-1]
+        print(f"{name:<55} build {last['build'] * 1000:8.2f}ms  {last.get('bytes', 0):>9}B")
+    for name, error in report["errors"].items():
+        print(f"{name:<55} failed with {error}")
+    print(f"{len(report['server'])} methods call the server, {len(report['missing'])} have no case")
+
+
+if __name__ == "__main__":
+    main()
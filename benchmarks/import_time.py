@@ -0,0 +1,100 @@
+"""Benchmark the time spent importing geetools in a fresh interpreter.
+
+The heavy dependencies (plotting, xarray, geopandas, STAC helpers...) are only imported when the
+methods using them are first called so that short-lived workers only pay for the Earth Engine API.
+The benchmark imports ``ee`` and then ``geetools`` in several fresh interpreters, reports the
+median time of both and checks that none of the heavy modules are loaded by ``import geetools``.
+
+Run it from the root of the repository:
+
+.. code-block:: console
+
+    python -m benchmarks.import_time --repeat 5 --budget 0.3
+
+The command exits with a non-zero status if the median time spent importing geetools on top of
+``ee`` is above the budget or if a heavy module is loaded.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = [
+    "ee_extra",
+    "geopandas",
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "pyproj",
+    "xarray",
+    "xee",
+]
+"The modules that should not be loaded by ``import geetools``."
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import ee
+middle = time.perf_counter()
+import geetools
+end = time.perf_counter()
+heavy = [m for m in {heavy} if m in sys.modules]
+print(json.dumps({{"ee": middle - start, "geetools": end - middle, "heavy": heavy}}))
+"""
+"The script run in each fresh interpreter."
+
+
+def measure() -> dict:
+    """Import ee and geetools in a fresh interpreter and return the timings and loaded modules."""
+    script = SCRIPT.format(heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+    return json.loads(output.stdout)
+
+
+def run(repeat: int = 5) -> dict:
+    """Run the benchmark.
+
+    Parameters:
+        repeat: The number of fresh interpreters to start, the median time is kept.
+
+    Returns:
+        The median time spent importing ee and geetools and the heavy modules loaded by geetools.
+    """
+    runs = [measure() for _ in range(repeat)]
+    return {
+        "ee": statistics.median(r["ee"] for r in runs),
+        "geetools": statistics.median(r["geetools"] for r in runs),
+        "heavy": sorted({m for r in runs for m in r["heavy"]}),
+    }
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters")
+    parser.add_argument("--budget", type=float, default=0.3, help="max import time of geetools (s)")
+    parser.add_argument("--output", help="json file to save the results")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    print(f"import ee:       {results['ee']:.3f}s")
+    print(f"import geetools: {results['geetools']:.3f}s (budget {args.budget:.3f}s)")
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({**results, "budget": args.budget}, f, indent=2)
+
+    errors = []
+    if results["geetools"] > args.budget:
+        errors.append(f"importing geetools takes {results['geetools']:.3f}s, over the budget")
+    if results["heavy"]:
+        errors.append(f"importing geetools loads heavy modules: {', '.join(results['heavy'])}")
+    for error in errors:
+        print(error, file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
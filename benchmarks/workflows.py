@@ -0,0 +1,172 @@
+"""Benchmark the asset, export and monitoring workflows of geetools against the fake backend.
+
+Each scenario is run in a fresh :py:class:`FakeBackend <benchmarks.backend.FakeBackend>`: the
+asset tree and the tasks are first prepared and then the workflow is timed while counting the
+calls made to each endpoint. The size drives the number of assets or tasks of the scenario. With
+the default seed the backend is deterministic so the number of calls can be compared between 2
+branches, and the latency options simulate the round trips to the server.
+
+Run it from the root of the repository:
+
+.. code-block:: console
+
+    python -m benchmarks.workflows --sizes 8 64 --latency 0.01 --output .benchmarks/workflows.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from . import _offline
+
+_offline.initialize()
+
+import ee  # noqa: E402
+import pandas  # noqa: E402, F401 (imported lazily by geetools, loaded here to not time it)
+
+import geetools  # noqa: E402
+
+from .backend import FakeBackend  # noqa: E402
+
+ROOT = "projects/geetools-benchmarks/assets"
+"The root folder of the assets created by the scenarios."
+
+
+# -- setups --------------------------------------------------------------------
+def tree(backend: FakeBackend, n: int) -> ee.Asset:
+    """Create a folder of n images dispatched in sub-folders of 8 images."""
+    for i in range(n):
+        backend.add_asset(f"{ROOT}/tree/folder{i // 8}/image{i}", "IMAGE", index=i)
+    return ee.Asset(f"{ROOT}/tree")
+
+
+def tasks(backend: FakeBackend, n: int) -> list[ee.batch.Task]:
+    """Create and start n table exports."""
+    table = ee.FeatureCollection([ee.Feature(None, {"index": i}) for i in range(8)])
+    tasks = [
+        ee.batch.Export.table.toAsset(table, f"export_{i % 4}_{i}", f"{ROOT}/table{i}")
+        for i in range(n)
+    ]
+    [t.start() for t in tasks]
+    return tasks
+
+
+def wait(tasks: list[ee.batch.Task]) -> list[ee.batch.Task]:
+    """Poll the operations of the tasks until they are all finished."""
+    while ee.batch.Export.geetools.operations(tasks).state.isin(["PENDING", "RUNNING"]).any():
+        pass
+    return tasks
+
+
+def jobs(backend: FakeBackend, n: int) -> list[dict]:
+    """Create the parameters of n export jobs."""
+    return [{"index": i, "tileScale": 1, "shardSize": 256} for i in range(n)]
+
+
+def factory(index: int, tileScale: float, shardSize: int) -> ee.batch.Task:
+    """Create the export task of a job."""
+    table = ee.FeatureCollection([ee.Feature(None, {"index": index, "tileScale": tileScale})])
+    return ee.batch.Export.table.toAsset(table, f"job_{index}", f"{ROOT}/job{index}")
+
+
+# -- scenarios -----------------------------------------------------------------
+SCENARIOS: dict[str, tuple[Callable, Callable]] = {
+    "Asset.iterdir": (tree, lambda a: a.iterdir(recursive=True)),
+    "Asset.glob": (tree, lambda a: a.glob("**/image1*")),
+    "Asset.copy": (tree, lambda a: a.copy(ee.Asset(f"{ROOT}/copy"))),
+    "Asset.move": (tree, lambda a: a.move(ee.Asset(f"{ROOT}/moved"))),
+    "Asset.delete": (tree, lambda a: a.delete(recursive=True, dry_run=False)),
+    "Export.operations": (tasks, wait),
+    "Export.report": (lambda b, n: wait(tasks(b, n)), ee.batch.Export.geetools.report),
+    "Export.startWithRetry": (
+        jobs,
+        lambda p: ee.batch.Export.geetools.startWithRetry(factory, p, backoff=0, poll=0),
+    ),
+}
+"The scenarios as (setup, workflow) pairs, the workflow is called with the output of the setup."
+
+
+def run_scenario(name: str, size: int, **options) -> dict:
+    """Run a scenario in a fresh backend and return its time and number of calls."""
+    setup, workflow = SCENARIOS[name]
+    with FakeBackend(**options) as backend:
+        inputs = setup(backend, size)
+        before = backend.calls.copy()
+        start = time.perf_counter()
+        workflow(inputs)
+        elapsed = time.perf_counter() - start
+    endpoints = dict(backend.calls - before)
+    return {"size": size, "time": elapsed, "calls": sum(endpoints.values()), "endpoints": endpoints}
+
+
+def run(sizes: list[int], select: str = "", **options) -> dict:
+    """Run all the scenarios.
+
+    Parameters:
+        sizes: The number of assets or tasks of each scenario.
+        select: Only run the scenarios whose name contains this string.
+        options: The options of the :py:class:`FakeBackend <benchmarks.backend.FakeBackend>`.
+
+    Returns:
+        The benchmark report.
+    """
+    results, errors = {}, {}
+    for name in SCENARIOS:
+        if select not in name:
+            continue
+        try:
+            results[name] = [run_scenario(name, size, **options) for size in sizes]
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    return {
+        "metadata": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "geetools": geetools.__version__,
+            "earthengine-api": ee.__version__,
+            "python": platform.python_version(),
+            "sizes": sizes,
+            "backend": options,
+        },
+        "results": results,
+        "errors": errors,
+    }
+
+
+def main():
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 64])
+    parser.add_argument(
+        "--select", default="", help="only run the scenarios containing this string"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of each call (s)")
+    parser.add_argument("--failures", type=float, default=0.2, help="probability of task failure")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", default=".benchmarks/workflows.json", help="the json file to write"
+    )
+    args = parser.parse_args()
+
+    options = {"latency": args.latency, "failures": args.failures, "seed": args.seed}
+    report = run(args.sizes, args.select, **options)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    for name, rows in report["results"].items():
+        last = rows[-1]
+        print(
+            f"{name:<25} n={last['size']:<5} {last['time'] * 1000:10.2f}ms {last['calls']:>6} calls"
+        )
+    for name, error in report["errors"].items():
+        print(f"{name:<25} failed with {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,13 @@ from .ee_array import ArrayAccessor
 from .ee_date_range import DateRangeAccessor
 from .ee_export import ExportAccessor
 from .ee_profiler import Profiler
+from .ee_tracer import Tracer
+from .ee_limiter import Limiter
+from .ee_cache import Cache
+from .ee_evaluate import Evaluator, evaluate_many
+from .ee_escalate import escalate
+from .ee_session import SessionPool
+from .ee_transport import Transport
 
 __title__ = "geetools"
 __summary__ = "A set of useful tools to use with Google Earth Engine Python" "API"
@@ -9,6 +9,7 @@ from tempfile import TemporaryDirectory
 import ee
 
 from .accessors import register_function_accessor
+from .ee_initialize import _token_cache
 
 
 @register_function_accessor(ee.Authenticate, "geetools")
@@ -79,6 +80,12 @@ class AuthenticateAccessor:
         with suppress(FileNotFoundError):
             (credential_path / name).unlink()
 
+        # drop the access token cached for this user if any
+        cache = _token_cache(credential_path, name)
+        for file in [cache, cache.with_suffix(".lock")]:
+            with suppress(FileNotFoundError):
+                file.unlink()
+
     @staticmethod
     def list_user(credential_pathname: str = "") -> list[str]:
         """return all the available users in the set folder.
@@ -130,3 +137,5 @@ class AuthenticateAccessor:
         credential_path = Path(credential_pathname).parent
         with suppress(FileNotFoundError):
             (credential_path / old).rename(credential_path / new)
+        with suppress(FileNotFoundError):
+            _token_cache(credential_path, old).rename(_token_cache(credential_path, new))
@@ -0,0 +1,252 @@
+"""Cache and coalesce the values computed by the Earth Engine servers."""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import ee
+
+from .accessors import _register_extention
+from .ee_limiter import _limited
+
+DEFAULT_CACHE = Path.home() / ".cache" / "geetools"
+"The default folder where the cached values are stored."
+
+_inflight: dict[str, Future] = {}
+"The requests being evaluated indexed by the hash of their expression graph, account and project."
+
+_inflight_lock = threading.Lock()
+
+
+@_register_extention(ee.geetools)
+class Cache:
+    """A persistent cache of the values returned by :py:meth:`ee.ComputedObject.getInfo`.
+
+    The values are stored on disk as json files named after the hash of the serialized expression graph
+    of the object and of the account and project of the active session, so identical graphs evaluated
+    by the same account and project in different sessions or processes share the same entry.
+    When the size of the folder goes above ``max_size``, the least recently used entries are removed.
+
+    The cache is opt-in: it is used by :py:func:`cached_getInfo <geetools.ee_cache.cached_getInfo>` and by
+    the client-side methods of geetools (the ``plot_*`` methods, ``to_datetime``, ``getSTAC``...) only
+    within its context or once :py:meth:`enable <geetools.ee_cache.Cache.enable>` is called.
+
+    Warning:
+        The key does not depend on the time of evaluation. Graphs depending on the time of evaluation
+        (e.g. :py:meth:`ee.Date.now`) or on assets that can be updated should be cached with a ``ttl``.
+
+    Parameters:
+        path: The folder where the values are stored. Default to ``~/.cache/geetools``.
+        max_size: The maximum size of the folder in bytes. Default to 100MB.
+        ttl: The number of seconds after which an entry expires. If ``None``, entries never expire.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            normClim = ee.ImageCollection('OREGONSTATE/PRISM/Norm91m').toBands()
+            region = ee.Geometry.Rectangle(-123.41, 40.43, -116.38, 45.14)
+
+            # the second call is read from the disk
+            with ee.geetools.Cache(ttl=3600):
+                normClim.geetools.plot_hist(region=region)
+                normClim.geetools.plot_hist(region=region)
+    """
+
+    current: Cache | None = None
+    "The cache used by :py:func:`cached_getInfo <geetools.ee_cache.cached_getInfo>` when none is provided."
+
+    def __init__(
+        self,
+        path: os.PathLike = DEFAULT_CACHE,
+        max_size: int = 100 * 2**20,
+        ttl: float | None = None,
+    ):
+        """Initialize the cache."""
+        self.path = Path(path).expanduser()
+        self.max_size, self.ttl = max_size, ttl
+        self._previous: list[Cache | None] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Use this cache within the context."""
+        self._previous.append(Cache.current)
+        Cache.current = self
+        return self
+
+    def __exit__(self, *args):
+        """Restore the previous cache."""
+        Cache.current = self._previous.pop()
+
+    def enable(self) -> Cache:
+        """Use this cache for the rest of the session.
+
+        Returns:
+            The cache itself.
+        """
+        Cache.current = self
+        return self
+
+    @staticmethod
+    def disable():
+        """Stop caching the values for the rest of the session."""
+        Cache.current = None
+
+    @property
+    def size(self) -> int:
+        """The size of the cached values in bytes."""
+        return sum(f.stat().st_size for f in self.path.glob("*.json"))
+
+    def key(self, obj: ee.ComputedObject) -> str:
+        """Return the key of an object: the sha256 hash of its serialized expression graph, account and project.
+
+        Parameters:
+            obj: The object to hash.
+
+        Returns:
+            The hexadecimal digest of the hash.
+        """
+        return _hash(obj)
+
+    def getInfo(self, obj: ee.ComputedObject) -> Any:
+        """Return the value of an object from the cache or from the server if missing or expired.
+
+        Parameters:
+            obj: The object to evaluate.
+
+        Returns:
+            The value of the object.
+        """
+        key = self.key(obj)
+        file = self.path / f"{key}.json"
+        try:
+            entry = json.loads(file.read_text())
+            if self.ttl is None or time.time() - entry["created"] < self.ttl:
+                os.utime(file)  # mark the entry as recently used
+                return entry["value"]
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        value = _coalesced_getInfo(obj, key)
+        self._write(file, {"created": time.time(), "value": value})
+        self._evict()
+        return value
+
+    def clear(self):
+        """Remove all the cached values."""
+        for file in self.path.glob("*.json"):
+            file.unlink(missing_ok=True)
+
+    def _write(self, file: Path, entry: dict):
+        """Write an entry atomically so that concurrent readers never see a partial file."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, file)
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache fits in its maximum size."""
+        with self._lock:
+            files = []
+            for file in self.path.glob("*.json"):
+                try:
+                    files.append((file.stat().st_mtime, file.stat().st_size, file))
+                except FileNotFoundError:
+                    continue
+            size = sum(s for _, s, _ in files)
+            for _, file_size, file in sorted(files):
+                if size <= self.max_size:
+                    break
+                file.unlink(missing_ok=True)
+                size -= file_size
+
+
+@_register_extention(ee.geetools)
+def cached_getInfo(obj: ee.ComputedObject, cache: Cache | None = None) -> Any:
+    """Evaluate an object using a persistent cache.
+
+    Equivalent to :py:meth:`ee.ComputedObject.getInfo` when no cache is provided nor active except that
+    concurrent evaluations of the same expression graph, from different threads, share a single request.
+
+    Parameters:
+        obj: The object to evaluate.
+        cache: The cache to use. Default to the active one (see :py:class:`Cache <geetools.ee_cache.Cache>`).
+
+    Returns:
+        The value of the object.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            cache = ee.geetools.Cache("my_cache", ttl=24 * 3600)
+            size = ee.geetools.cached_getInfo(ee.ImageCollection("COPERNICUS/S2").size(), cache)
+    """
+    cache = cache or Cache.current
+    return _coalesced_getInfo(obj) if cache is None else cache.getInfo(obj)
+
+
+def _hash(obj: ee.ComputedObject) -> str:
+    """Return the sha256 hash of the serialized expression graph of an object and of the active session.
+
+    The account and project are part of the hash so that the values are never shared between credentials
+    that may not have access to the same assets, nor billed to another project than the one requesting them.
+    """
+    graph = json.dumps(ee.serializer.encode(obj, for_cloud_api=True), sort_keys=True)
+    return hashlib.sha256(f"{_identity()}\n{graph}".encode()).hexdigest()
+
+
+def _identity() -> str:
+    """Return the project and the account used by the requests of the current thread or task."""
+    state = ee.data._get_state()
+    credentials, project = state.credentials, state.cloud_api_user_project
+    account = (
+        getattr(credentials, "service_account_email", None)
+        or getattr(credentials, "refresh_token", None)
+        or getattr(credentials, "token", None)
+        or ""
+    )
+    return f"{project}\n{account}"
+
+
+def _coalesced_getInfo(obj: ee.ComputedObject, key: str = "") -> Any:
+    """Evaluate an object, sharing the request already in flight for the same graph if any.
+
+    The first caller sends the request and the concurrent callers wait for its result, they receive
+    a copy of the value (or the same error) so they can modify it independently.
+    """
+    key = key or _hash(obj)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+
+    if not owner:
+        return copy.deepcopy(future.result())
+
+    try:
+        value = _limited("computeValue", obj.getInfo)
+        future.set_result(value)
+        return value
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
@@ -3,7 +3,12 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
+import warnings
+import zipfile
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Iterator
 
 import ee
 
@@ -112,6 +117,210 @@ def open(path: os.PathLike) -> ee.ComputedObject:
     return ee.deserializer.decode(json.loads(path.read_text()))
 
 
+@staticmethod  # type: ignore
+@_register_extention(ee.ComputedObject)  # type: ignore
+def save_many(objs: dict[str, ee.ComputedObject], path: os.PathLike) -> Path:
+    """Save many :py:class:`ee.ComputedObject` in a single compressed .geez archive.
+
+    The archive is a zip file with one compressed JSON member per object, named after its key. The index of
+    the members is stored at the end of the file so :py:meth:`open_many <ee.ComputedObject.open_many>` can
+    read a single object without decompressing the others.
+
+    Parameters:
+        objs: The objects to save indexed by their names.
+        path: The path to save the archive to.
+
+    Returns:
+        The path to the saved archive.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            img = ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM")
+            ndvi = img.normalizedDifference(["B8", "B4"])
+            ee.ComputedObject.save_many({"image": img, "ndvi": ndvi}, "checkpoint.geez")
+    """
+    path = Path(path).with_suffix(".geez")
+
+    # write a temporary archive first so an interrupted checkpoint never replaces a valid one
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, obj in objs.items():
+                graph = json.dumps(ee.serializer.encode(obj), separators=(",", ":"))
+                archive.writestr(f"{name}.json", graph)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+    return path
+
+
+@staticmethod  # type: ignore
+@_register_extention(ee.ComputedObject)  # type: ignore
+def open_many(path: os.PathLike) -> GeeArchive:
+    """Open a .geez archive written by :py:meth:`save_many <ee.ComputedObject.save_many>`.
+
+    Only the index of the archive is read, each object is decompressed and decoded when it's accessed.
+
+    Parameters:
+        path: The path to the archive to open.
+
+    Returns:
+        A read-only mapping of the objects indexed by their names.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            with ee.ComputedObject.open_many("checkpoint.geez") as archive:
+                print(list(archive))
+                ndvi = ee.Image(archive["ndvi"])
+    """
+    if (path := Path(path)).suffix != ".geez":
+        raise ValueError("File must be a .geez file")
+
+    return GeeArchive(path)
+
+
+class GeeArchive(Mapping):
+    """A read-only mapping of the objects stored in a .geez archive, decoded lazily.
+
+    The archive file stays open until :py:meth:`close` is called or the context is exited.
+    """
+
+    def __init__(self, path: Path):
+        """Open the archive and read its index."""
+        self.path = path
+        self._archive = zipfile.ZipFile(path)
+        self._members = {n[: -len(".json")]: n for n in self._archive.namelist()}
+
+    def __getitem__(self, name: str) -> ee.ComputedObject:
+        """Decompress and decode a single object."""
+        if name not in self._members:
+            raise KeyError(name)
+        return ee.deserializer.decode(json.loads(self._archive.read(self._members[name])))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the objects."""
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        """Return the number of objects."""
+        return len(self._members)
+
+    def __enter__(self):
+        """Return the archive."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive."""
+        self.close()
+
+    def close(self):
+        """Close the archive file."""
+        self._archive.close()
+
+
+# -- graph metrics -------------------------------------------------------------
+@_register_extention(ee.ComputedObject)  # type: ignore
+def geetools_graph_stats(
+    self,
+    max_nodes: int | None = None,
+    max_depth: int | None = None,
+    max_bytes: int | None = None,
+) -> dict:
+    """Compute the size and depth metrics of the expression graph of the object.
+
+    The metrics are computed client-side by walking the output of :py:func:`ee.serializer.encode`, no request is sent to the server:
+
+    - ``nodes``: the number of nodes of the fully expanded expression tree, i.e. what the server would evaluate if nothing was shared.
+    - ``distinct_nodes``: the number of nodes once the identical sub-expressions are shared, i.e. what is actually sent.
+    - ``depth``: the maximum nesting depth of the expression.
+    - ``bytes``: the size of the serialized request payload.
+
+    If any threshold is provided and exceeded, a :py:class:`UserWarning` is raised so that graph blow-ups are caught before reaching the server.
+
+    Parameters:
+        max_nodes: The maximum number of expanded nodes before raising a warning.
+        max_depth: The maximum depth before raising a warning.
+        max_bytes: The maximum size of the payload in bytes before raising a warning.
+
+    Returns:
+        A dictionary with the ``nodes``, ``distinct_nodes``, ``depth`` and ``bytes`` keys.
+
+    Examples:
+        .. jupyter-execute::
+
+            import ee, geetools
+            from geetools.utils import initialize_documentation
+
+            initialize_documentation()
+
+            n = ee.Number(1).add(2)
+            n.multiply(n).geetools_graph_stats()
+    """
+    encoded = ee.serializer.encode(self, for_cloud_api=True)
+    values, cache = encoded["values"], {}
+
+    def walk_reference(ref: str) -> tuple:
+        # each shared value is walked once and its metrics reused for every reference
+        if ref not in cache:
+            cache[ref] = walk(values[ref])
+        return cache[ref]
+
+    def walk(node) -> tuple:
+        """Return the (expanded nodes, distinct nodes, depth) of a node."""
+        if not isinstance(node, dict):
+            return 0, 0, 0
+        if "valueReference" in node:
+            nodes, _, depth = walk_reference(node["valueReference"])
+            return nodes, 0, depth
+        if "functionInvocationValue" in node:
+            invocation = node["functionInvocationValue"]
+            children = [walk(a) for a in invocation.get("arguments", {}).values()]
+            if "functionReference" in invocation:
+                nodes, _, depth = walk_reference(invocation["functionReference"])
+                children.append((nodes, 0, depth))
+        elif "functionDefinitionValue" in node:
+            nodes, _, depth = walk_reference(node["functionDefinitionValue"]["body"])
+            children = [(nodes, 0, depth)]
+        elif "arrayValue" in node:
+            children = [walk(v) for v in node["arrayValue"]["values"]]
+        elif "dictionaryValue" in node:
+            children = [walk(v) for v in node["dictionaryValue"]["values"].values()]
+        else:  # leaves: constantValue, argumentReference, integerValue, bytesValue, nullValue
+            children = []
+        nodes = 1 + sum(c[0] for c in children)
+        distinct = 1 + sum(c[1] for c in children)
+        depth = 1 + max((c[2] for c in children), default=0)
+        return nodes, distinct, depth
+
+    nodes, _, depth = walk_reference(encoded["result"])
+    stats = {
+        "nodes": nodes,
+        "distinct_nodes": sum(walk_reference(ref)[1] for ref in values),
+        "depth": depth,
+        "bytes": len(json.dumps(encoded)),
+    }
+
+    thresholds = {"nodes": max_nodes, "depth": max_depth, "bytes": max_bytes}
+    exceeded = [k for k, v in thresholds.items() if v is not None and stats[k] > v]
+    if exceeded:
+        details = ", ".join(f"{k}={stats[k]} > {thresholds[k]}" for k in exceeded)
+        warnings.warn(f"The expression graph exceeds its thresholds: {details}", stacklevel=2)
+
+    return stats
+
+
 # placeholder classes for the isInstance method --------------------------------
 @_register_extention(ee)
 class Float:
@@ -0,0 +1,71 @@
+"""Read the client-side value of the Earth Engine objects built from Python literals."""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+import ee
+
+_UNKNOWN = object()
+"The value returned for the objects that can only be computed by the Earth Engine servers."
+
+MAX_FOLDED_SIZE = 1000
+"The maximum number of items of a list computed client-side, above it the server expression is smaller."
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d{3})?)?)?")
+"The date strings parsed the same way by Python and the Earth Engine servers."
+
+
+def _constant(obj: Any) -> Any:
+    """Return the Python value of an object built only from literals or ``_UNKNOWN``.
+
+    Python primitives, lists and dictionaries are returned as is and the Earth Engine objects wrapping
+    a literal (e.g. ``ee.Number(1)`` or ``ee.List(["a", "b"])``) are unwrapped. Anything else
+    (a computed object, a variable of a mapped function...) is ``_UNKNOWN``.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        values = [_constant(o) for o in obj]
+        return _UNKNOWN if any(v is _UNKNOWN for v in values) else values
+    if isinstance(obj, dict):
+        values = {k: _constant(v) for k, v in obj.items()}
+        valid = all(isinstance(k, str) for k in values)
+        return values if valid and all(v is not _UNKNOWN for v in values.values()) else _UNKNOWN
+    if isinstance(obj, ee.ComputedObject) and obj.func is None and obj.varName is None:
+        for attr in ["_number", "_string", "_list", "_dictionary"]:
+            if getattr(obj, attr, None) is not None:
+                return _constant(getattr(obj, attr))
+    return _UNKNOWN
+
+
+def _constants(*objs: Any) -> list | None:
+    """Return the Python values of all the objects or None if one of them needs the servers."""
+    values = [_constant(o) for o in objs]
+    return None if any(v is _UNKNOWN for v in values) else values
+
+
+def _is_number(value: Any) -> bool:
+    """Check if a constant is a number (booleans are not numbers for the servers)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _millis(date: Any) -> int | float | None:
+    """Return the timestamp in milliseconds of a constant date or None if it needs the servers.
+
+    Numbers are already timestamps, ISO strings without time zone are read in UTC and
+    :py:class:`ee.Date` built from one of them without a ``timeZone`` are unwrapped.
+    """
+    if isinstance(date, ee.Date):
+        func = date.func.getSignature()["name"] if date.func else None
+        if func != "Date" or set(date.args) != {"value"}:
+            return None
+        date = date.args["value"]
+    date = _constant(date)
+    if _is_number(date):
+        return date
+    if isinstance(date, str) and _ISO_DATE.fullmatch(date):
+        dt = datetime.fromisoformat(date).replace(tzinfo=timezone.utc)
+        return round(dt.timestamp() * 1000)
+    return None
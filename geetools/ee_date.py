@@ -6,6 +6,7 @@ from datetime import datetime
 import ee
 
 from .accessors import register_class_accessor
+from .ee_cache import cached_getInfo
 
 EE_EPOCH = datetime(1970, 1, 1, 0, 0, 0)
 
@@ -106,7 +107,7 @@ class DateAccessor:
                 d.strftime('%Y-%m-%d')
 
         """
-        return datetime.fromtimestamp(self._obj.millis().getInfo() / 1000.0)
+        return datetime.fromtimestamp(cached_getInfo(self._obj.millis()) / 1000.0)
 
     def getUnitSinceEpoch(self, unit: str = "day") -> ee.Number:
         """Get the number of units since epoch (1970-01-01).
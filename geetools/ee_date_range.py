@@ -4,6 +4,17 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_constant import MAX_FOLDED_SIZE, _constants, _is_number, _millis
+
+UNIT_MILLIS = {
+    "second": 1000,
+    "minute": 1000 * 60,
+    "hour": 1000 * 60 * 60,
+    "day": 1000 * 60 * 60 * 24,
+    "month": 1000 * 60 * 60 * 24 * 30,
+    "year": 1000 * 60 * 60 * 24 * 365,
+}
+"The number of milliseconds in each unit."
 
 
 @register_class_accessor(ee.DateRange, "geetools")
@@ -40,6 +51,13 @@ class DateRangeAccessor:
                 dateList.getInfo()
         """
         self.check_unit(unit)
+        if (bounds := self._constant_bounds()) and (values := _constants(interval)):
+            start, end = bounds
+            step = int(values[0]) * UNIT_MILLIS[unit] if _is_number(values[0]) else 0
+            if step > 0 and (end - start) / step < MAX_FOLDED_SIZE:
+                timestamps = [*range(start, end, step), end]
+                return ee.List([ee.DateRange(a, b) for a, b in zip(timestamps, timestamps[1:])])
+
         interval = ee.Number(interval).toInt().multiply(self.unitMillis(unit))
         start, end = self._obj.start().millis(), self._obj.end().millis()
 
@@ -52,6 +70,15 @@ class DateRangeAccessor:
         )
 
     # -- utils -----------------------------------------------------------------
+    def _constant_bounds(self) -> tuple[int, int] | None:
+        """Return the start and end timestamps of a DateRange built from literals in UTC or None."""
+        func = self._obj.func.getSignature()["name"] if self._obj.func else None
+        if func != "DateRange" or set(self._obj.args) != {"start", "end"}:
+            return None
+        start, end = _millis(self._obj.args["start"]), _millis(self._obj.args["end"])
+        valid = isinstance(start, int) and isinstance(end, int) and start < end
+        return (start, end) if valid else None
+
     @staticmethod
     def check_unit(unit: str) -> None:
         """Check if the unit is valid."""
@@ -68,12 +95,4 @@ class DateRangeAccessor:
         Returns:
             The number of milliseconds in the unit
         """
-        millis = {
-            "second": 1000,
-            "minute": 1000 * 60,
-            "hour": 1000 * 60 * 60,
-            "day": 1000 * 60 * 60 * 24,
-            "month": 1000 * 60 * 60 * 24 * 30,
-            "year": 1000 * 60 * 60 * 24 * 365,
-        }
-        return ee.Number(millis[unit])
+        return ee.Number(UNIT_MILLIS[unit])
@@ -1,9 +1,12 @@
 """Extra methods for the :py:class:`ee.Dictionary` class."""
 from __future__ import annotations
 
+from typing import Any
+
 import ee
 
 from .accessors import register_class_accessor
+from .ee_constant import _constants
 
 
 @register_class_accessor(ee.Dictionary, "geetools")
@@ -35,6 +38,9 @@ class DictionaryAccessor:
                 d = ee.Dictionary.geetools.fromPairs([["foo", 1], ["bar", 2]])
                 d.getInfo()
         """
+        if (values := _constants(list)) and (pairs := _from_pairs(values[0])) is not None:
+            return ee.Dictionary(pairs)
+
         list = ee.List(list)
         keys = list.map(lambda pair: ee.List(pair).get(0))
         values = list.map(lambda pair: ee.List(pair).get(1))
@@ -58,6 +64,9 @@ class DictionaryAccessor:
                 d = ee.Dictionary({"foo": 1, "bar": 2}).geetools.sort()
                 d.getInfo()
         """
+        if values := _constants(self._obj):
+            return ee.Dictionary(dict(sorted(values[0].items())))
+
         orderededKeys = self._obj.keys().sort()
         values = orderededKeys.map(lambda key: self._obj.get(key))
         return ee.Dictionary.fromLists(orderededKeys, values)
@@ -84,3 +93,13 @@ class DictionaryAccessor:
                 d.getInfo()
         """
         return ee.List(list).map(lambda key: self._obj.get(key))
+
+
+def _from_pairs(pairs: Any) -> dict | None:
+    """Return the dictionary of constant ``[key, value]`` pairs or None if the servers are needed."""
+    valid = isinstance(pairs, list) and all(
+        isinstance(p, list) and len(p) == 2 and isinstance(p[0], str) for p in pairs
+    )
+    if not valid or len({p[0] for p in pairs}) != len(pairs):
+        return None
+    return dict(pairs)
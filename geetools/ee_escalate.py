@@ -0,0 +1,182 @@
+"""Retry the reductions failing on the server with escalated parameters."""
+from __future__ import annotations
+
+import re
+import warnings
+from typing import Any, Callable
+
+import ee
+
+from .accessors import _register_extention
+from .ee_cache import cached_getInfo
+
+ESCALATION_ERRORS = {
+    "memory": [
+        r"memory limit exceeded",
+        r"out of memory",
+        r"too many concurrent aggregations",
+    ],
+    "pixels": [r"too many pixels"],
+    "timeout": [r"timed out", r"deadline exceeded"],
+}
+"The regex patterns of the errors that can be solved by escalating the parameters of a reduction."
+
+SETTINGS = ["tileScale", "bestEffort", "scale"]
+"The parameters changed by the escalation."
+
+
+@_register_extention(ee.geetools)
+def escalate(
+    func: Callable[..., ee.ComputedObject],
+    params: dict,
+    budget: int = 3,
+    split: str = "",
+    maxTileScale: float = 16,
+) -> tuple[Any, list[dict]]:
+    """Evaluate a reduction, retrying it with escalated parameters when it fails on the server.
+
+    ``func`` is called with ``params`` and the output is evaluated. When the server raises one of the
+    errors of :py:data:`ESCALATION_ERRORS <geetools.ee_escalate.ESCALATION_ERRORS>`, the parameters
+    present in ``params`` are escalated and the reduction is sent again:
+
+    - ``"memory"`` errors double the ``tileScale`` (up to ``maxTileScale``), then split the regions and finally double the ``scale``.
+    - ``"pixels"`` errors set ``bestEffort`` to ``True``, then double the ``scale``.
+    - ``"timeout"`` errors split the regions, then double the ``scale``.
+
+    The regions can only be split if ``split`` is the name of a :py:class:`ee.FeatureCollection` parameter,
+    the 2 halves are then reduced independently and their outputs (dictionaries keyed by region) are merged.
+    Any other error is raised right away as well as the last error once ``budget`` retries are spent. The
+    budget is shared by the whole reduction: each half of a split counts as a retry so that ``func`` is
+    never evaluated more than ``budget + 1`` times.
+
+    Parameters:
+        func: The function building the reduction from the parameters.
+        params: The keyword arguments of ``func``.
+        budget: The maximum number of retries. Default to 3.
+        split: The name of the :py:class:`ee.FeatureCollection` parameter that can be split in halves. Default to no split.
+        maxTileScale: The maximum ``tileScale`` to use. Default to 16.
+
+    Returns:
+        The value of the reduction and the list of attempts. Each attempt records the ``tileScale``,
+        ``bestEffort``, ``scale`` and number of ``splits`` used and the ``error`` raised if any. The last
+        attempt is the one that worked.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            image = ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM")
+            region = ee.Geometry.Point([12, 41]).buffer(50000)
+            params = {"reducer": "mean", "geometry": region, "scale": 10, "tileScale": 1}
+            value, attempts = ee.geetools.escalate(lambda **p: image.reduceRegion(**p), params)
+            print(attempts[-1])
+    """
+    attempts: list[dict] = []
+    value, _ = _run(func, dict(params), budget, split, maxTileScale, 0, attempts)
+    return value, attempts
+
+
+def _run(
+    func: Callable,
+    params: dict,
+    budget: int,
+    split: str,
+    maxTileScale: float,
+    splits: int,
+    attempts: list,
+) -> tuple[Any, int]:
+    """Evaluate the reduction until it succeeds, splitting it in independent reductions if needed.
+
+    Returns the value of the reduction and the budget left for the rest of the reduction.
+    """
+    while True:
+        record = {k: params[k] for k in SETTINGS if k in params}
+        try:
+            value = cached_getInfo(func(**params))
+            attempts.append({**record, "splits": splits, "error": None})
+            return value, budget
+        except ee.EEException as e:
+            attempts.append({**record, "splits": splits, "error": str(e)})
+            category = _classify(str(e))
+            escalated = _escalate(params, category, split, maxTileScale, budget)
+            if category is None or escalated is None:
+                raise
+            budget -= len(escalated) if isinstance(escalated, list) else 1
+            if isinstance(escalated, list):
+                values = []
+                for p in escalated:
+                    value, budget = _run(func, p, budget, split, maxTileScale, splits + 1, attempts)
+                    values.append(value)
+                return _merge(*values), budget
+            params = escalated
+
+
+def _classify(message: str) -> str | None:
+    """Return the category of an error message or None if escalation cannot solve it."""
+    for category, patterns in ESCALATION_ERRORS.items():
+        if any(re.search(p, message, re.IGNORECASE) for p in patterns):
+            return category
+    return None
+
+
+def _escalate(
+    params: dict, category: str | None, split: str, maxTileScale: float, budget: int
+) -> dict | list | None:
+    """Return the next parameters to try, a list of parameters to split the reduction or None.
+
+    A split needs a retry for each half so it is skipped when less than 2 retries are left.
+    """
+    if budget < 1:
+        return None
+
+    def tileScale():
+        if params.get("tileScale") is not None and params["tileScale"] < maxTileScale:
+            return {**params, "tileScale": min(params["tileScale"] * 2, maxTileScale)}
+
+    def bestEffort():
+        if params.get("bestEffort") is False:
+            return {**params, "bestEffort": True}
+
+    def scale():
+        if isinstance(params.get("scale"), (int, float)):
+            return {**params, "scale": params["scale"] * 2}
+
+    def regions():
+        if split and budget > 1 and isinstance(params.get(split), ee.FeatureCollection):
+            fc = params[split]
+            size = cached_getInfo(fc.size())
+            if size > 1:
+                halves = [fc.toList(size // 2), fc.toList(size - size // 2, size // 2)]
+                return [{**params, split: ee.FeatureCollection(h)} for h in halves]
+
+    ladders = {
+        "memory": [tileScale, regions, scale],
+        "pixels": [bestEffort, scale],
+        "timeout": [regions, scale],
+    }
+    return next((e for e in (f() for f in ladders.get(category, [])) if e), None)
+
+
+def _merge(*values: dict) -> dict:
+    """Merge recursively the dictionaries returned by the reductions of the split regions."""
+    merged: dict = {}
+    for value in values:
+        for key, item in value.items():
+            both_dicts = isinstance(item, dict) and isinstance(merged.get(key), dict)
+            merged[key] = _merge(merged[key], item) if both_dicts else item
+    return merged
+
+
+def _auto_escalate(func: Callable, params: dict, budget: int, split: str = "") -> Any:
+    """Evaluate a geetools helper with escalation and warn the user about the settings that worked."""
+    value, attempts = escalate(func, params, budget, split)
+    if len(attempts) > 1:
+        settings = {k: v for k, v in attempts[-1].items() if k != "error"}
+        name = getattr(func, "__name__", "the reduction")
+        warnings.warn(
+            f"{name} succeeded after escalation with {settings}.", UserWarning, stacklevel=3
+        )
+    return value
@@ -0,0 +1,201 @@
+"""Evaluate many Earth Engine objects in batches or concurrently."""
+from __future__ import annotations
+
+import asyncio
+import json
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator
+
+import ee
+
+from .accessors import _register_extention
+from .ee_cache import cached_getInfo
+
+PAYLOAD_LIMIT = 8 * 2**20
+"The maximum size in bytes of the serialized expression graph sent in a single request."
+
+
+@_register_extention(ee.geetools)
+def evaluate_many(objs: list | dict, max_bytes: int = PAYLOAD_LIMIT) -> list | dict:
+    """Evaluate many objects with a minimal number of requests.
+
+    The objects are packed in a single :py:class:`ee.List` and evaluated at once instead of calling
+    :py:meth:`ee.ComputedObject.getInfo` on each of them. If the serialized objects exceed ``max_bytes``,
+    they are dispatched in several lists evaluated one after the other. Client-side values are left
+    untouched and the active :py:class:`Cache <geetools.ee_cache.Cache>` is used if any.
+
+    Parameters:
+        objs: The objects to evaluate as a list or a dictionary.
+        max_bytes: The maximum size of the serialized objects evaluated in a single request. Default to 8MB.
+
+    Returns:
+        The values of the objects in the same container as the input.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            collection = ee.ImageCollection("COPERNICUS/S2")
+            size, bands = ee.geetools.evaluate_many([collection.size(), collection.first().bandNames()])
+    """
+    keys, values = _unpack(objs)
+
+    # only the computed objects are sent to the server
+    computed = [i for i, v in enumerate(values) if isinstance(v, ee.ComputedObject)]
+    results = list(values)
+    for batch in _batches(computed, [values[i] for i in computed], max_bytes):
+        evaluated = cached_getInfo(ee.List([values[i] for i in batch]))
+        for i, value in zip(batch, evaluated):
+            results[i] = value
+
+    return _pack(keys, results)
+
+
+@_register_extention(ee.geetools)
+class Evaluator:
+    """Evaluate many independent objects concurrently.
+
+    Each object is evaluated in its own request, the requests being run on a pool of at most
+    ``max_workers`` threads. The values can be retrieved in order with :py:meth:`map`, as soon as they
+    are computed with :py:meth:`as_completed` or awaited from an asyncio event loop with
+    :py:meth:`evaluate` and :py:meth:`gather`. Client-side values are left untouched and the active
+    :py:class:`Cache <geetools.ee_cache.Cache>` is used if any.
+
+    Note:
+        Prefer :py:func:`evaluate_many <geetools.ee_evaluate.evaluate_many>` for small objects that
+        can be computed in a single request, the evaluator is meant for heavy computations like
+        statistics over thousands of regions where each request can fail or time out on its own.
+
+    Parameters:
+        max_workers: The maximum number of requests sent at the same time. Default to 8.
+        return_exceptions: If ``True``, the errors raised by the evaluation of an object are returned in
+            place of its value instead of being raised. Default to ``False``.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            image = ee.Image("COPERNICUS/S2_HARMONIZED/20230101T000239_20230101T000240_T56LRL")
+            regions = ee.FeatureCollection("FAO/GAUL/2015/level2").limit(100)
+            stats = [
+                image.reduceRegion(ee.Reducer.mean(), regions.toList(100).get(i).geometry(), 100)
+                for i in range(100)
+            ]
+
+            evaluator = ee.geetools.Evaluator(max_workers=16, return_exceptions=True)
+            for i, value in evaluator.as_completed(stats):
+                print(i, value)
+    """
+
+    def __init__(self, max_workers: int = 8, return_exceptions: bool = False):
+        """Initialize the evaluator."""
+        self.max_workers, self.return_exceptions = max_workers, return_exceptions
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def map(self, objs: list | dict) -> list | dict:
+        """Evaluate the objects concurrently and return their values in order.
+
+        Parameters:
+            objs: The objects to evaluate as a list or a dictionary.
+
+        Returns:
+            The values of the objects in the same container as the input.
+        """
+        keys, values = _unpack(objs)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            results = list(executor.map(self._evaluate, values))
+        return _pack(keys, results)
+
+    def as_completed(self, objs: list | dict) -> Iterator[tuple[Any, Any]]:
+        """Evaluate the objects concurrently and yield their values as soon as they are computed.
+
+        Parameters:
+            objs: The objects to evaluate as a list or a dictionary.
+
+        Returns:
+            An iterator of (index, value) pairs or (key, value) pairs if ``objs`` is a dictionary.
+        """
+        keys, values = _unpack(objs)
+        keys = keys if keys is not None else list(range(len(values)))
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {executor.submit(self._evaluate, v): k for k, v in zip(keys, values)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    async def evaluate(self, obj: Any) -> Any:
+        """Evaluate a single object without blocking the event loop.
+
+        The request is run in the default executor of the loop and at most ``max_workers`` objects are
+        evaluated at the same time for a given loop.
+
+        Parameters:
+            obj: The object to evaluate.
+
+        Returns:
+            The value of the object.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_workers)
+        async with self._semaphores[loop]:
+            return await loop.run_in_executor(None, self._evaluate, obj)
+
+    async def gather(self, objs: list | dict) -> list | dict:
+        """Evaluate the objects concurrently from an asyncio event loop.
+
+        Parameters:
+            objs: The objects to evaluate as a list or a dictionary.
+
+        Returns:
+            The values of the objects in the same container as the input.
+        """
+        keys, values = _unpack(objs)
+        results = await asyncio.gather(*(self.evaluate(v) for v in values))
+        return _pack(keys, list(results))
+
+    def _evaluate(self, obj: Any) -> Any:
+        """Evaluate an object, returning the error instead of raising it if requested."""
+        try:
+            return cached_getInfo(obj) if isinstance(obj, ee.ComputedObject) else obj
+        except Exception as e:
+            if not self.return_exceptions:
+                raise
+            return e
+
+
+def _unpack(objs: list | dict) -> tuple[list | None, list]:
+    """Split the objects in their keys (None for a list) and their values."""
+    keys = list(objs) if isinstance(objs, dict) else None
+    values = [objs[k] for k in keys] if keys is not None else list(objs)
+    return keys, values
+
+
+def _pack(keys: list | None, values: list) -> list | dict:
+    """Rebuild the container of the objects from their keys and values."""
+    return dict(zip(keys, values)) if keys is not None else values
+
+
+def _batches(indices: list[int], objs: list[ee.ComputedObject], max_bytes: int) -> list[list[int]]:
+    """Group the objects greedily in batches whose serialized size stays below max_bytes."""
+    batches: list[list[int]] = []
+    size = 0
+    for i, obj in zip(indices, objs):
+        obj_size = _payload_size(obj)
+        if not batches or size + obj_size > max_bytes:
+            batches.append([])
+            size = 0
+        batches[-1].append(i)
+        size += obj_size
+    return batches
+
+
+def _payload_size(obj: Any) -> int:
+    """Return the size in bytes of the serialized expression graph of an object."""
+    return len(json.dumps(ee.serializer.encode(obj, for_cloud_api=True)))
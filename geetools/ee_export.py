@@ -1,11 +1,23 @@
 """Toolbox for the ``ee.Export`` class."""
 from __future__ import annotations
 
+import json
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
 import ee
 
 from .accessors import register_class_accessor
+from .ee_limiter import _limited
 from .utils import format_asset_id, format_description
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @register_class_accessor(ee.batch.Export, "geetools")
 class ExportAccessor:
@@ -69,16 +81,18 @@ class ExportAccessor:
             aid = ee.Asset(assetId) if assetId else ee.Asset("~").expanduser() / description
 
             # create the ImageCollection asset
-            ee.data.createAsset({"type": "IMAGE_COLLECTION"}, aid.as_posix())
+            _limited(
+                "createAsset", ee.data.createAsset, {"type": "IMAGE_COLLECTION"}, aid.as_posix()
+            )
 
             # loop over the collection and export each image
-            nb_images = imagecollection.size().getInfo()
+            nb_images = _limited("computeValue", imagecollection.size().getInfo)
             imageList = imagecollection.toList(nb_images)
             task_list = []
             for i in range(nb_images):
                 # extract image information
                 locImage = ee.Image(imageList.get(i))
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = _limited("computeValue", locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 kwargs["image"] = locImage
@@ -135,13 +149,13 @@ class ExportAccessor:
             fid = folder if folder else description
 
             # loop over the collection and export each image
-            nb_images = imagecollection.size().getInfo()
+            nb_images = _limited("computeValue", imagecollection.size().getInfo)
             imageList = imagecollection.toList(nb_images)
             task_list = []
             for i in range(nb_images):
                 # extract image information
                 locImage = ee.Image(imageList.get(i))
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = _limited("computeValue", locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 # the folder will be created by the first task
@@ -199,13 +213,13 @@ class ExportAccessor:
             fid = folder if folder else description
 
             # loop over the collection and export each image
-            nb_images = imagecollection.size().getInfo()
+            nb_images = _limited("computeValue", imagecollection.size().getInfo)
             imageList = imagecollection.toList(nb_images)
             task_list = []
             for i in range(nb_images):
                 # extract image information
                 locImage = ee.Image(imageList.get(i))
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = _limited("computeValue", locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 # the folder will be created by the first task
@@ -217,3 +231,503 @@ class ExportAccessor:
                 task_list.append(ee.batch.Export.image.toCloudStorage(**kwargs))
 
             return task_list
+
+        @staticmethod
+        def reduceRegions(
+            imagecollection: ee.ImageCollection,
+            collection: ee.FeatureCollection,
+            reducer: str | ee.Reducer,
+            description: str,
+            chunk: str | int = "month",
+            destination: str = "drive",
+            start: str | datetime | None = None,
+            end: str | datetime | None = None,
+            idProperty: str = "system:index",
+            scale: int | float | None = None,
+            crs: str | None = None,
+            tileScale: float = 1,
+            manifest: os.PathLike | None = None,
+            **kwargs,
+        ) -> list[ee.batch.Task]:
+            """Creates a list of table export tasks computing zonal statistics window by window.
+
+            The collection is split in time windows and the regions are reduced on every image of each window.
+            Each window is exported as an independent table so that the tasks can be run in parallel without hitting
+            the interactive limits of :py:meth:`ee.ImageCollection.geetools.reduceRegions <geetools.ee_image_collection.ImageCollectionAccessor.reduceRegions>`.
+            The tables are in long format: one row per image and region with the ``image_id`` and ``feature_id``
+            properties to identify them, the region properties and the reduced band values.
+
+            If a ``manifest`` file is provided, the list of windows and their exported file names is saved in it.
+            Once all the tasks are completed and the files downloaded,
+            use :py:meth:`ee.batch.Export.geetools.mergeManifest <geetools.ee_export.ExportAccessor.mergeManifest>` to gather all the results in a single table.
+
+            Parameters:
+                imagecollection: The image collection to reduce.
+                collection: The regions to reduce the data on.
+                reducer: The reducer to apply.
+                description: The description of the tasks. It is used as prefix for each window task and file.
+                chunk: The size of the windows. ``"month"`` and ``"year"`` split the collection by calendar period while an integer splits it every N images.
+                destination: The destination of the tables, one of ``"drive"``, ``"cloudStorage"`` or ``"asset"``.
+                start: The start date of the first window if ``chunk`` is a calendar period. If not set, the date of the first image is used.
+                end: The end date of the last window if ``chunk`` is a calendar period. If not set, the date of the last image is used.
+                idProperty: The image property to use as ``image_id``. Default is ``"system:index"``.
+                scale: A nominal scale in meters to work in.
+                crs: The projection to work in.
+                tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size.
+                manifest: The path of the json file to save the manifest to.
+                **kwargs: every parameter that you would use for the vanilla table export of the selected destination (e.g. ``folder``, ``bucket``, ``fileFormat``, ``assetId`` ...)
+
+            Returns:
+                The list of created tasks, one per window.
+
+            Examples:
+                .. code-block:: python
+
+                    import ee
+                    import geetools
+
+                    ee.Initialize()
+
+                    collection = ee.ImageCollection("MODIS/061/MOD13A1").filterDate("2010", "2020").select("NDVI")
+                    regions = ee.FeatureCollection("projects/google/charts_feature_example")
+
+                    tasks = ee.batch.Export.geetools.imagecollection.reduceRegions(
+                        imagecollection=collection,
+                        collection=regions,
+                        reducer="mean",
+                        description="ndvi_stats",
+                        chunk="year",
+                        scale=500,
+                        folder="ndvi_stats",
+                        manifest="ndvi_stats.json",
+                    )
+                    [t.start() for t in tasks]
+            """
+            exports = {
+                "drive": ee.batch.Export.table.toDrive,
+                "cloudStorage": ee.batch.Export.table.toCloudStorage,
+                "asset": ee.batch.Export.table.toAsset,
+            }
+            if destination not in exports:
+                msg = f"Destination {destination} is not supported, use one of {list(exports)}."
+                raise ValueError(msg)
+
+            red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
+
+            def reduceImage(image: ee.Image) -> ee.FeatureCollection:
+                reduced = image.reduceRegions(
+                    collection=collection, reducer=red, scale=scale, crs=crs, tileScale=tileScale
+                )
+                props = {"image_id": image.get(idProperty), "image_date": image.date().millis()}
+                return reduced.map(
+                    lambda f: f.setGeometry(None).set(props).set("feature_id", f.id())
+                )
+
+            windows = _time_windows(imagecollection, chunk, start, end)
+            fileFormat = kwargs.get("fileFormat", "CSV").lower()
+            assetId = ee.Asset(kwargs.pop("assetId", "")) if destination == "asset" else None
+            task_list, chunks = [], []
+            for i, (window, label) in enumerate(windows):
+                table = ee.FeatureCollection(window.map(reduceImage)).flatten()
+                desc = format_description(f"{description}_{label}")
+                kwargs["collection"], kwargs["description"] = table, desc
+                if destination == "asset":
+                    kwargs["assetId"] = (assetId / format_asset_id(desc)).as_posix()
+                else:
+                    kwargs["fileNamePrefix"] = format_asset_id(desc)
+                task_list.append(exports[destination](**kwargs))
+                file = kwargs.get("assetId") or f"{kwargs['fileNamePrefix']}.{fileFormat}"
+                chunks.append({"index": i, "window": label, "description": desc, "file": file})
+
+            if manifest is not None:
+                content = {"description": description, "destination": destination, "chunk": chunk}
+                content.update(fileFormat=fileFormat, chunks=chunks)
+                Path(manifest).write_text(json.dumps(content, indent=2))
+
+            return task_list
+
+    @staticmethod
+    def mergeManifest(manifest: os.PathLike, folder: os.PathLike = ".") -> pd.DataFrame:
+        """Merge the tables exported by a chunked export pipeline in a single table.
+
+        Parameters:
+            manifest: The path to the manifest json file written by :py:meth:`imagecollection.reduceRegions`.
+            folder: The local folder where the exported files were downloaded. Default to the current directory.
+
+        Returns:
+            A DataFrame with the rows of all the windows and an extra ``window`` column.
+
+        Raises:
+            ValueError: If the tables were exported to assets or are not in csv format.
+            FileNotFoundError: If the file of one of the windows is missing.
+
+        Examples:
+            .. code-block:: python
+
+                import ee
+                import geetools
+
+                df = ee.batch.Export.geetools.mergeManifest("ndvi_stats.json", "~/Downloads/ndvi_stats")
+        """
+        import pandas as pd
+
+        content = json.loads(Path(manifest).read_text())
+        if content["destination"] == "asset" or content["fileFormat"] != "csv":
+            raise ValueError("Only the tables exported as csv files can be merged locally.")
+
+        frames, folder = [], Path(folder).expanduser()
+        for chunk in content["chunks"]:
+            # large tables can be sharded by the server in multiple files sharing the same prefix
+            files = sorted(folder.glob(f"{Path(chunk['file']).stem}*.csv"))
+            if len(files) == 0:
+                raise FileNotFoundError(f"No file found for window {chunk['window']} in {folder}")
+            frames += [pd.read_csv(f).assign(window=chunk["window"]) for f in files]
+
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def startWithRetry(
+        factory: Callable[..., ee.batch.Task],
+        params: list[dict],
+        budget: int = 3,
+        backoff: float = 60,
+        poll: float = 30,
+        maxTileScale: float = 16,
+        minShardSize: int = 32,
+    ) -> pd.DataFrame:
+        """Start export tasks and automatically resubmit the failed ones.
+
+        Each element of ``params`` is passed to ``factory`` to create a task that is started right away.
+        The method then polls the tasks until they are all finished. When a task fails, its error message
+        is classified and the task is resubmitted after an exponential backoff with escalated parameters:
+
+        - ``"memory"`` errors (memory limit exceeded, too many concurrent aggregations...) double the ``tileScale``, then halve the ``shardSize`` (smaller tiles) and finally split the ``region`` in two.
+        - ``"timeout"`` errors split the ``region`` in two, then halve the ``shardSize``.
+        - ``"transient"`` errors (internal errors, unavailable backend, quota...) are resubmitted with the same parameters.
+        - other errors are considered ``"fatal"`` and never resubmitted.
+
+        Only the parameters present in the ``params`` dictionaries are escalated so the factory should expose them
+        (e.g. ``tileScale`` in the reduction of a table export). A job gives up when it was resubmitted ``budget``
+        times or when no parameter can be escalated anymore.
+
+        Parameters:
+            factory: A function taking the parameters as keyword arguments and returning a :py:class:`ee.batch.Task`.
+            params: The list of parameters of each job.
+            budget: The maximum number of resubmissions of a job.
+            backoff: The delay in seconds before the first resubmission. It doubles at each attempt.
+            poll: The delay in seconds between 2 status checks.
+            maxTileScale: The maximum ``tileScale`` to use when escalating.
+            minShardSize: The minimum ``shardSize`` to use when escalating.
+
+        Returns:
+            A DataFrame with one row per attempt with the following columns: ``job``, ``attempt``, ``task_id``, ``state``, ``category``, ``error`` and ``params``.
+
+        Examples:
+            .. code-block:: python
+
+                import ee
+                import geetools
+
+                ee.Initialize()
+
+                image = ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM")
+
+                def factory(region, shardSize):
+                    return ee.batch.Export.image.toDrive(image, region=region, shardSize=shardSize, scale=10)
+
+                regions = [ee.Geometry.Point([12, 41]).buffer(5000), ee.Geometry.Point([12, 42]).buffer(5000)]
+                params = [{"region": r, "shardSize": 256} for r in regions]
+                attempts = ee.batch.Export.geetools.startWithRetry(factory, params, budget=2)
+        """
+        import pandas as pd
+
+        jobs = [{"job": i, "attempt": 0, "params": p, "due": 0.0} for i, p in enumerate(params)]
+        pending, running, records = jobs, [], []
+        while pending or running:
+            now = time.monotonic()
+
+            # start all the jobs that are due
+            for job in [j for j in pending if j["due"] <= now]:
+                job["task"] = factory(**job["params"])
+                _limited("startTask", job["task"].start)
+                pending.remove(job)
+                running.append(job)
+
+            # check the running jobs and resubmit the failed ones
+            for job in list(running):
+                status = _limited("getOperation", job["task"].status)
+                if ee.batch.Task.State.active(status["state"]):
+                    continue
+                running.remove(job)
+                error = status.get("error_message")
+                failed = status["state"] == ee.batch.Task.State.FAILED
+                category = _classify_error(error) if failed else None
+                record = {k: job[k] for k in ["job", "attempt", "params"]}
+                record.update(task_id=job["task"].id, state=status["state"])
+                records.append({**record, "category": category, "error": error})
+                if not failed or category == "fatal" or job["attempt"] >= budget:
+                    continue
+                escalated = _escalate(job["params"], category, maxTileScale, minShardSize)
+                due, attempt = now + backoff * 2 ** job["attempt"], job["attempt"] + 1
+                pending += [
+                    {"job": job["job"], "attempt": attempt, "params": p, "due": due}
+                    for p in escalated
+                ]
+
+            if pending or running:
+                time.sleep(poll)
+
+        columns = ["job", "attempt", "task_id", "state", "category", "error", "params"]
+        return pd.DataFrame(records, columns=columns)
+
+    @staticmethod
+    def operations(tasks: list | None = None) -> pd.DataFrame:
+        """Gather the accounting metadata of a batch of export tasks in a table.
+
+        Each row of the table is an operation with its description, state, timing and
+        ``batchEecuUsageSeconds`` as reported by the Earth Engine server. Timings are given in seconds.
+
+        Parameters:
+            tasks: The tasks to describe. They can be :py:class:`ee.batch.Task`, operation names or the operation dictionaries returned by :py:func:`ee.data.getOperation`. If not set, all the operations of the current project are used.
+
+        Returns:
+            A DataFrame indexed by operation name with the following columns: ``description``, ``type``, ``state``, ``eecu``, ``create_time``, ``start_time``, ``end_time``, ``queued``, ``runtime`` and ``error``.
+
+        Examples:
+            .. code-block:: python
+
+                import ee
+                import geetools
+
+                ee.Initialize()
+
+                tasks = ee.batch.Export.geetools.imagecollection.toDrive(collection, "system:index", "test")
+                [t.start() for t in tasks]
+
+                # once the tasks are finished
+                df = ee.batch.Export.geetools.operations(tasks)
+        """
+        import pandas as pd
+
+        operations = _limited("listOperations", ee.data.listOperations) if tasks is None else tasks
+        rows = [_operation_row(_get_operation(o)) for o in operations]
+        columns = ["name", "description", "type", "state", "eecu", "create_time", "start_time"]
+        columns += ["end_time", "queued", "runtime", "error"]
+        return pd.DataFrame(rows, columns=columns).set_index("name")
+
+    @staticmethod
+    def report(
+        tasks: list | None = None,
+        by: str | Callable = "prefix",
+        separator: str = "_",
+        tags: dict | None = None,
+    ) -> pd.DataFrame:
+        """Aggregate the EECU and runtime accounting of a batch of export tasks.
+
+        The tasks are grouped and for each group the method reports the number of tasks, the number
+        of completed and failed ones, the total, mean and max EECU seconds and the mean and max runtime.
+        The most expensive groups are listed first.
+
+        Parameters:
+            tasks: The tasks to describe. They can be :py:class:`ee.batch.Task`, operation names or the operation dictionaries returned by :py:func:`ee.data.getOperation`. If not set, all the operations of the current project are used.
+            by: How to group the tasks. ``"prefix"`` uses the part of the description before the last ``separator`` (e.g. the collection name for the tasks created by :py:meth:`imagecollection.toDrive`), ``"description"`` keeps one group per task, ``"tag"`` uses the ``tags`` mapping. A callable receiving the description and returning the group name can also be used.
+            separator: The separator used to split the description when grouping by ``"prefix"``.
+            tags: A mapping of task description to custom tag. Only used if ``by`` is ``"tag"``. Descriptions missing from the mapping are tagged ``"untagged"``.
+
+        Returns:
+            A DataFrame indexed by group.
+
+        Examples:
+            .. code-block:: python
+
+                import ee
+                import geetools
+
+                ee.Initialize()
+
+                tasks = ee.batch.Export.geetools.imagecollection.toDrive(collection, "system:index", "test")
+                [t.start() for t in tasks]
+
+                # once the tasks are finished
+                report = ee.batch.Export.geetools.report(tasks, by="prefix")
+        """
+        groupers = {
+            "prefix": lambda d: d.rsplit(separator, 1)[0],
+            "description": lambda d: d,
+            "tag": lambda d: (tags or {}).get(d, "untagged"),
+        }
+        if not (callable(by) or by in groupers):
+            msg = f"Grouping {by} is not supported, use prefix, description, tag or a callable."
+            raise ValueError(msg)
+        group = by if callable(by) else groupers[by]
+
+        df = ExportAccessor.operations(tasks)
+        df["group"] = df.description.fillna("").map(group)
+        df["completed"] = df.state == "SUCCEEDED"
+        df["failed"] = df.state == "FAILED"
+        report = df.groupby("group").agg(
+            tasks=("state", "size"),
+            completed=("completed", "sum"),
+            failed=("failed", "sum"),
+            eecu_total=("eecu", "sum"),
+            eecu_mean=("eecu", "mean"),
+            eecu_max=("eecu", "max"),
+            runtime_mean=("runtime", "mean"),
+            runtime_max=("runtime", "max"),
+        )
+        return report.sort_values("eecu_total", ascending=False)
+
+
+def _time_windows(
+    imagecollection: ee.ImageCollection,
+    chunk: str | int,
+    start: str | datetime | None,
+    end: str | datetime | None,
+) -> list[tuple[ee.ImageCollection, str]]:
+    """Split an image collection in time windows and label them."""
+    import pandas as pd
+
+    if isinstance(chunk, int):
+        ic = imagecollection.sort("system:time_start")
+        size = _limited("computeValue", ic.size().getInfo)
+        windows = [(i, min(i + chunk, size)) for i in range(0, size, chunk)]
+        return [(ee.ImageCollection(ic.toList(b - a, a)), f"{a}-{b - 1}") for a, b in windows]
+
+    if chunk not in ["month", "year"]:
+        msg = f"Chunk {chunk} is not supported, use 'month', 'year' or a number of images."
+        raise ValueError(msg)
+
+    # fetch the collection extent only if the user didn't provide it
+    if start is None or end is None:
+        extent = ee.Dictionary(
+            {
+                "min": imagecollection.aggregate_min("system:time_start"),
+                "max": imagecollection.aggregate_max("system:time_start"),
+            }
+        )
+        extent = _limited("computeValue", extent.getInfo)
+        start = start or pd.Timestamp(extent["min"], unit="ms")
+        end = end or pd.Timestamp(extent["max"], unit="ms")
+    start = pd.Timestamp(start).to_period("M" if chunk == "month" else "Y")
+    end = pd.Timestamp(end).to_period("M" if chunk == "month" else "Y")
+
+    windows = []
+    for period in pd.period_range(start, end):
+        window_start = period.start_time.strftime("%Y-%m-%d")
+        window_end = (period + 1).start_time.strftime("%Y-%m-%d")
+        windows.append((imagecollection.filterDate(window_start, window_end), str(period)))
+    return windows
+
+
+ERROR_CATEGORIES = {
+    "memory": [
+        r"memory limit exceeded",
+        r"out of memory",
+        r"too many concurrent aggregations",
+        r"tile error:.*memory",
+    ],
+    "timeout": [r"timed out", r"deadline exceeded", r"time limit"],
+    "transient": [
+        r"internal error",
+        r"service unavailable",
+        r"backend error",
+        r"capacity exceeded",
+        r"too many requests",
+        r"quota",
+        r"try again",
+    ],
+}
+"The regex patterns used to classify the error messages of the failed tasks."
+
+
+def _classify_error(message: str | None) -> str:
+    """Classify a task error message as "memory", "timeout", "transient" or "fatal"."""
+    for category, patterns in ERROR_CATEGORIES.items():
+        if any(re.search(p, message or "", re.IGNORECASE) for p in patterns):
+            return category
+    return "fatal"
+
+
+def _escalate(params: dict, category: str, maxTileScale: float, minShardSize: int) -> list[dict]:
+    """Return the list of parameters to resubmit after a failure of the given category."""
+    if category == "transient":
+        return [params]
+
+    def tileScale():
+        if "tileScale" in params and params["tileScale"] < maxTileScale:
+            return [{**params, "tileScale": min(params["tileScale"] * 2, maxTileScale)}]
+
+    def shardSize():
+        if "shardSize" in params and params["shardSize"] > minShardSize:
+            return [{**params, "shardSize": max(params["shardSize"] // 2, minShardSize)}]
+
+    def region():
+        if "region" in params:
+            return [{**params, "region": r} for r in _split_region(params["region"])]
+
+    ladder = [tileScale, shardSize, region] if category == "memory" else [region, shardSize]
+    return next((e for e in (f() for f in ladder) if e), [])
+
+
+def _split_region(region: ee.Geometry) -> list[ee.Geometry]:
+    """Split a region in two halves along the longest side of its bounding box."""
+    region = ee.Geometry(region)
+    coords = _limited("computeValue", region.bounds(1).coordinates().get(0).getInfo)
+    xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+    (xmin, xmax), (ymin, ymax) = (min(xs), max(xs)), (min(ys), max(ys))
+    if xmax - xmin >= ymax - ymin:
+        xmid = (xmin + xmax) / 2
+        halves = [[xmin, ymin, xmid, ymax], [xmid, ymin, xmax, ymax]]
+    else:
+        ymid = (ymin + ymax) / 2
+        halves = [[xmin, ymin, xmax, ymid], [xmin, ymid, xmax, ymax]]
+    return [region.intersection(ee.Geometry.Rectangle(h), 1) for h in halves]
+
+
+def _get_operation(task: ee.batch.Task | str | dict) -> dict:
+    """Return the operation dictionary of a task, an operation name or an operation."""
+    if isinstance(task, dict):
+        return task
+    if isinstance(task, ee.batch.Task):
+        if task.operation_name is None:
+            raise ValueError(f"Task {task.id} has not been started yet.")
+        task = task.operation_name
+    return _limited("getOperation", ee.data.getOperation, task)
+
+
+def _operation_row(operation: dict) -> dict:
+    """Extract the accounting information from an operation dictionary."""
+    metadata = operation.get("metadata", {})
+    times = {k: _timestamp(metadata.get(k)) for k in ["createTime", "startTime", "endTime"]}
+    queued, runtime = None, None
+    if times["createTime"] and times["startTime"]:
+        queued = (times["startTime"] - times["createTime"]).total_seconds()
+    if times["startTime"] and times["endTime"]:
+        runtime = (times["endTime"] - times["startTime"]).total_seconds()
+    eecu = metadata.get("batchEecuUsageSeconds")
+    return {
+        "name": operation.get("name"),
+        "description": metadata.get("description"),
+        "type": metadata.get("type"),
+        "state": metadata.get("state"),
+        "eecu": None if eecu is None else float(eecu),
+        "create_time": times["createTime"],
+        "start_time": times["startTime"],
+        "end_time": times["endTime"],
+        "queued": queued,
+        "runtime": runtime,
+        "error": operation.get("error", {}).get("message"),
+    }
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    """Parse the RFC 3339 timestamps used in the operation metadata."""
+    if not value:
+        return None
+    # python < 3.11 cannot parse the "Z" suffix nor more than 6 digits of fractional seconds
+    value = value.replace("Z", "+00:00")
+    if "." in value:
+        main, rest = value.split(".", 1)
+        digits = rest[: len(rest) - 6]
+        value = f"{main}.{digits[:6].ljust(6, '0')}{rest[-6:]}"
+    return datetime.fromisoformat(value)
@@ -1,16 +1,20 @@
 """Toolbox for the :py:class:`ee.FeatureCollection` class."""
 from __future__ import annotations
 
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 import ee
-import geopandas as gpd
-from matplotlib import pyplot as plt
-from matplotlib.axes import Axes
 
 from .accessors import register_class_accessor
+from .ee_cache import cached_getInfo
+from .ee_evaluate import evaluate_many
+from .ee_limiter import _limited
 from .utils import plot_data
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+    from matplotlib.axes import Axes
+
 
 class GeoInterface(Protocol):
     """Protocol that implement at least a ``__geo_interface__`` property."""
@@ -267,6 +271,56 @@ class FeatureCollectionAccessor:
 
         return self._obj.map(removeNonPoly)
 
+    def toGeoDataFrame(self, pageSize: int = 1000) -> gpd.GeoDataFrame:
+        """Download the collection as a :py:class:`geopandas.GeoDataFrame` page by page.
+
+        Unlike :py:meth:`ee.FeatureCollection.getInfo`, the features are requested in pages of ``pageSize`` features
+        and each page is decoded straight into column buffers before the next one is requested. The nested GeoJSON
+        dictionary of the whole collection is thus never built and the peak memory stays close to the size of the
+        final frame.
+
+        Warning:
+            This method is client-side.
+
+        Parameters:
+            pageSize: The number of features requested at once. Default to 1000.
+
+        Returns:
+            The features of the collection with one column per property, in EPSG:4326.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                fc = ee.FeatureCollection("FAO/GAUL/2015/level2").filter(ee.Filter.eq("ADM0_NAME", "France"))
+                gdf = fc.geetools.toGeoDataFrame(pageSize=500)
+        """
+        import geopandas as gpd
+        from shapely.geometry import shape
+
+        columns: dict[str, list] = {}
+        geometries: list = []
+        params = {"expression": self._obj, "pageSize": pageSize}
+        while True:
+            page = _limited("computeFeatures", ee.data.computeFeatures, params)
+            for feature in page.get("features", []):
+                geometry = feature.get("geometry")
+                geometries.append(shape(geometry) if geometry else None)
+                for key, value in (feature.get("properties") or {}).items():
+                    columns.setdefault(key, [None] * (len(geometries) - 1)).append(value)
+                # properties missing from this feature are filled with None
+                for column in columns.values():
+                    if len(column) < len(geometries):
+                        column.append(None)
+            if "nextPageToken" not in page:
+                break
+            params = {**params, "pageToken": page["nextPageToken"]}
+
+        return gpd.GeoDataFrame(columns, geometry=geometries, crs="EPSG:4326")
+
     def byProperties(
         self,
         featureId: str | ee.String = "system:index",
@@ -453,14 +507,14 @@ class FeatureCollectionAccessor:
                     label.set_rotation(45)
         """
         # Get the features and properties
-        props = ee.List(properties) if properties else self._obj.first().propertyNames().getInfo()
+        props = ee.List(properties) if properties else self._obj.first().propertyNames()
         props = props.remove(featureId)
 
-        # get the data from server
-        data = self.byProperties(featureId, props, labels).getInfo()
+        # get the data and the property names from server in a single request
+        data, names = evaluate_many([self.byProperties(featureId, props, labels), props])
 
         # reorder the data according to the labels or properties set by the user
-        labels = labels if labels else props.getInfo()
+        labels = labels if labels else names
         data = {k: data[k] for k in labels}
 
         return plot_data(type=type, data=data, label_name=featureId, colors=colors, ax=ax, **kwargs)
@@ -519,11 +573,11 @@ class FeatureCollectionAccessor:
         props = ee.List(properties) if properties else fc.first().propertyNames()
         props = props.remove(featureId)
 
-        # get the data from server
-        data = self.byFeatures(featureId, props, labels).getInfo()
+        # get the data and the property names from server in a single request
+        data, names = evaluate_many([self.byFeatures(featureId, props, labels), props])
 
         # reorder the data according to the lapbes or properties set by the user
-        labels = labels if labels else props.getInfo()
+        labels = labels if labels else names
         data = {f: {k: data[f][k] for k in labels} for f in data.keys()}
 
         return plot_data(type=type, data=data, label_name=featureId, colors=colors, ax=ax, **kwargs)
@@ -576,11 +630,13 @@ class FeatureCollectionAccessor:
 
                 fig.show()
         """
+        from matplotlib import pyplot as plt
+
         # gather the data from parameters
         properties, labels = ee.List([property]), ee.List([label])
 
         # get the data from the server
-        data = self.byProperties(properties=properties, labels=labels).getInfo()
+        data = cached_getInfo(self.byProperties(properties=properties, labels=labels))
 
         # define the ax if not provided by the user
         if ax is None:
@@ -663,6 +719,8 @@ class FeatureCollectionAccessor:
 
                 fig.show()
         """
+        from matplotlib import pyplot as plt
+
         if ax is None:
             fig, ax = plt.subplots()
 
@@ -671,11 +729,11 @@ class FeatureCollectionAccessor:
         nonSystemNames = names.filter(ee.Filter.stringStartsWith("item", "system:").Not()).sort()
         systemNames = names.filter(ee.Filter.stringStartsWith("item", "system:")).sort()
         names = nonSystemNames.cat(systemNames)
-        property = property if property != "" else names.get(0).getInfo()
-        data = self._obj.select([property]).getInfo()
+        property = property if property != "" else cached_getInfo(names.get(0))
 
-        # transform the data to a geodataframe and reproject it to the destination crs
-        gdf = gpd.GeoDataFrame.from_features(data["features"]).set_crs(4326).to_crs(crs)
+        # stream the data to a geodataframe and reproject it to the destination crs
+        fc = ee.FeatureCollection(self._obj.select([property]))
+        gdf = fc.geetools.toGeoDataFrame().to_crs(crs)
 
         # plot the data on the map either as contours or a valued features
         if boundaries is True:
@@ -1,24 +1,20 @@
 """Toolbox for the :py:class:`ee.Image` class."""
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import ee
-import ee_extra
-import ee_extra.Algorithms.core
-import geopandas as gpd
-import numpy as np
-import requests
-import xarray
-from matplotlib import pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.colors import to_rgba
-from pyproj import CRS, Transformer
-from xee.ext import REQUEST_BYTE_LIMIT
 
 from .accessors import register_class_accessor
+from .ee_cache import cached_getInfo
+from .ee_escalate import _auto_escalate
+from .ee_evaluate import evaluate_many
+from .ee_transport import _get
 from .utils import plot_data
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 
 @register_class_accessor(ee.Image, "geetools")
 class ImageAccessor:
@@ -835,7 +831,7 @@ class ImageAccessor:
                 print(ind["reference"])
         """
         url = "https://raw.githubusercontent.com/awesome-spectral-indices/awesome-spectral-indices/main/output/spectral-indices-dict.json"
-        response = requests.get(url)
+        response = _get(url)
         response.raise_for_status()
         return response.json()["SpectralIndices"]
 
@@ -921,6 +917,8 @@ class ImageAccessor:
                 image = ee.Image('COPERNICUS/S2_SR/20190828T151811_20190828T151809_T18GYT')
                 image = image.geetools.spectralIndices(["NDVI", "NDFI"])
         """
+        import ee_extra
+
         # fmt: off
         return ee_extra.Spectral.core.spectralIndices(
             self._obj, index, G, C1, C2, L, cexp, nexp, alpha, slope, intercept, gamma, omega,
@@ -949,6 +947,8 @@ class ImageAccessor:
 
                 ee.ImageCollection('MODIS/006/MOD11A2').first().geetools.getScaleParams()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getScaleParams(self._obj)
 
     def getOffsetParams(self) -> dict[str, float]:
@@ -971,6 +971,8 @@ class ImageAccessor:
 
                 ee.ImageCollection('MODIS/006/MOD11A2').first().geetools.getOffsetParams()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getOffsetParams(self._obj)
 
     def scaleAndOffset(self) -> ee.Image:
@@ -992,6 +994,8 @@ class ImageAccessor:
 
                 S2 = ee.ImageCollection('COPERNICUS/S2_SR').first().geetools.scaleAndOffset()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.scaleAndOffset(self._obj)
 
     def preprocess(self, **kwargs) -> ee.Image:
@@ -1021,6 +1025,8 @@ class ImageAccessor:
                     .geetools.preprocess()
                 )
         """
+        import ee_extra
+
         return ee_extra.QA.pipelines.preprocess(self._obj, **kwargs)
 
     def getSTAC(self) -> dict[str, Any]:
@@ -1040,24 +1046,24 @@ class ImageAccessor:
                 ee.ImageCollection('COPERNICUS/S2_SR').first().geetools.getSTAC()
         """
         # extract the Asset id from the imagecollection
-        assetId = self._obj.get("system:id").getInfo()
+        assetId = cached_getInfo(self._obj.get("system:id"))
 
         # search for the project in the GEE catalog and extract the project catalog URL
         project = assetId.split("/")[0]
         catalog = "https://earthengine-stac.storage.googleapis.com/catalog/catalog.json"
-        links = requests.get(catalog).json()["links"]
+        links = _get(catalog).json()["links"]
         project_catalog = next((i["href"] for i in links if i.get("title") == project), None)
         if project_catalog is None:
             raise ValueError(f"Project {project} not found in the catalog")
 
         # search for the collection in the project catalog and extract the collection STAC URL
         collection = "_".join(assetId.split("/")[:-1])
-        links = requests.get(project_catalog).json()["links"]
+        links = _get(project_catalog).json()["links"]
         collection_stac = next((i["href"] for i in links if i.get("title") == collection), None)
         if collection_stac is None:
             raise ValueError(f"Collection {collection} not found in the {project} catalog")
 
-        return requests.get(collection_stac).json()
+        return _get(collection_stac).json()
 
     def getDOI(self) -> str:
         """Gets the DOI of the image, if available.
@@ -1130,6 +1136,8 @@ class ImageAccessor:
                 source = ee.Image("LANDSAT/LC08/C01/T1_TOA/LC08_047027_20160819")
                 sharp = source.geetools.panSharpen(method="HPFA", qa=["MSE", "RMSE"], maxPixels=1e13)
         """
+        import ee_extra.Algorithms.core
+
         return ee_extra.Algorithms.core.panSharpen(
             img=self._obj, method=method, qa=qa, prefix="geetools", **kwargs
         )
@@ -1192,6 +1200,8 @@ class ImageAccessor:
                 image = ee.Image('COPERNICUS/S2_SR/20190828T151811_20190828T151809_T18GYT')
                 img = img.geetools.tasseledCap()
         """
+        import ee_extra
+
         return ee_extra.Spectral.core.tasseledCap(self._obj)
 
     def matchHistogram(
@@ -1229,6 +1239,8 @@ class ImageAccessor:
                 }
                 matched = source.geetools.matchHistogram(target, bands)
         """
+        import ee_extra
+
         return ee_extra.Spectral.core.matchHistogram(
             source=self._obj,
             target=target,
@@ -1283,6 +1295,8 @@ class ImageAccessor:
                     .geetools.maskClouds(prob = 75,buffer = 300,cdi = -0.5)
                 )
         """
+        import ee_extra
+
         return ee_extra.QA.clouds.maskClouds(
             self._obj,
             method,
@@ -1392,6 +1406,7 @@ class ImageAccessor:
         scale: Optional[int | ee.Number] = None,
         band: Optional[str | ee.String] = None,
         proxyValue: int | ee.Number = -999,
+        autoEscalate: int = 0,
         **kwargs,
     ) -> ee.Number:
         """Compute the coverage of masked pixels inside a Geometry.
@@ -1401,6 +1416,7 @@ class ImageAccessor:
             scale: The scale of the computation. In case you need a rough estimation use a higher scale than the original from the image.
             band: The band to use. Defaults to the first band.
             proxyValue: the value to use for counting the mask and avoid confusing 0s to masked values. In most cases the user should not change this value, but in case of conflicts, choose a value that is out of the range of the image values.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
             **kwargs:
                 - ``maxPixels``: The maximum number of pixels to reduce.
                 - ``tileScale``: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
@@ -1419,6 +1435,18 @@ class ImageAccessor:
                 aoi = ee.Geometry.Point([11.880190936531116, 42.0159494554553]).buffer(2000)
                 image = image.geetools.maskCoverRegion(aoi)
         """
+        # evaluate the reduction right away, escalating its parameters on server errors
+        if autoEscalate:
+            params = {
+                "tileScale": 1,
+                **kwargs,
+                "region": region,
+                "scale": scale,
+                "band": band,
+                "proxyValue": proxyValue,
+            }
+            return ee.Number(_auto_escalate(self.maskCoverRegion, params, autoEscalate))
+
         # compute the mask cover
         image = self._obj.select(band or 0)
         scale = scale or image.projection().nominalScale()
@@ -1566,6 +1594,13 @@ class ImageAccessor:
                 fig, ax = plt.subplots()
                 image.geetools.plot(["B4", "B3", "B2"], image.geometry(), ax)
         """
+        import geopandas as gpd
+        import numpy as np
+        import xarray
+        from matplotlib import pyplot as plt
+        from pyproj import CRS, Transformer
+        from xee.ext import REQUEST_BYTE_LIMIT
+
         if ax is None:
             fig, ax = plt.subplots()
 
@@ -1584,8 +1619,9 @@ class ImageAccessor:
         bands_da = [ds[b][0, :, :].transpose() for b in bands]
 
         # compute the extend of the image so the unit displayed for x and y are matching the required crs
+        # the features to display (if any) are retrieved in the same request
         proj = Transformer.from_crs(CRS("EPSG:4326"), CRS(crs), always_xy=True)
-        region_bounds = region.bounds().coordinates().get(0).getInfo()
+        region_bounds, features = evaluate_many([region.bounds().coordinates().get(0), fc])
         min_x, min_y = proj.transform(*region_bounds[0])
         max_x, max_y = proj.transform(*region_bounds[2])
 
@@ -1605,7 +1641,7 @@ class ImageAccessor:
         # add the feature collection if provided
         # we need to extract the geometries and plot them
         if fc is not None:
-            gdf = gpd.GeoDataFrame.from_features(fc.getInfo()["features"])
+            gdf = gpd.GeoDataFrame.from_features(features["features"])
             gdf = gdf.set_crs("EPSG:4326").to_crs(crs)
             gdf.boundary.plot(ax=ax, color=color)
 
@@ -1674,6 +1710,7 @@ class ImageAccessor:
         crs: str | None = None,
         crsTransform: list | None = None,
         tileScale: float = 1,
+        autoEscalate: int = 0,
     ) -> ee.Dictionary:
         """Compute a reducer for each band of the image in each region.
 
@@ -1697,6 +1734,7 @@ class ImageAccessor:
             crs: The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale.
             crsTransform: The list of CRS transform values. This is a row-major ordering of the 3x2 transform matrix. This option is mutually exclusive with 'scale', and replaces any transform already set on the projection.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
 
         Returns:
             A dictionary with all the bands as keys and their values in each region as a list.
@@ -1717,6 +1755,11 @@ class ImageAccessor:
                 d = normClim.geetools.byBands(ecoregions, ee.Reducer.mean(), scale=10000)
                 print(d.getInfo())
         """
+        # evaluate the reduction right away, escalating its parameters on server errors
+        if autoEscalate:
+            params = {k: v for k, v in locals().items() if k not in ["self", "autoEscalate"]}
+            return ee.Dictionary(_auto_escalate(self.byBands, params, autoEscalate, "regions"))
+
         # get all the id values, they must be string so we are forced to cast them manually
         # the default casting is broken from Python side: https://issuetracker.google.com/issues/329106322
         features = regions.aggregate_array(regionId)
@@ -1906,7 +1949,7 @@ class ImageAccessor:
 
                 normClim.geetools.plot_by_regions(ecoregions, ee.Reducer.mean(), scale=10000)
         """
-        # get the data from the server
+        # build the data to retrieve from the server
         data = self.byBands(
             regions=regions,
             reducer=reducer,
@@ -1917,18 +1960,20 @@ class ImageAccessor:
             crs=crs,
             crsTransform=crsTransform,
             tileScale=tileScale,
-        ).getInfo()
+        )
 
         # get all the id values, they must be string so we are forced to cast them manually
         # the default casting is broken from Python side: https://issuetracker.google.com/issues/329106322
         features = regions.aggregate_array(regionId)
         isString = lambda i: ee.Algorithms.ObjectType(i).compareTo("String").eq(0)  # noqa: E731
         features = features.map(lambda i: ee.Algorithms.If(isString(i), i, ee.Number(i).format()))
-        features = features.getInfo()
 
         # extract the labels from the parameters
         eeBands = ee.List(bands) if len(bands) else self._obj.bandNames()
-        labels = labels if len(labels) else eeBands.getInfo()
+
+        # evaluate everything in a single request
+        data, features, names = evaluate_many([data, features, eeBands])
+        labels = labels if len(labels) else names
 
         # reorder the data according to the labels id set by the user
         data = {b: {f: data[b][f] for f in features} for b in labels}
@@ -1997,7 +2042,7 @@ class ImageAccessor:
 
                 normClim.geetools.plot_by_bands(ecoregions, ee.Reducer.mean(), scale=10000)
         """
-        # get the data from the server
+        # build the data to retrieve from the server
         data = self.byRegions(
             regions=regions,
             reducer=reducer,
@@ -2008,18 +2053,20 @@ class ImageAccessor:
             crs=crs,
             crsTransform=crsTransform,
             tileScale=tileScale,
-        ).getInfo()
+        )
 
         # get all the id values, they must be string so we are forced to cast them manually
         # the default casting is broken from Python side: https://issuetracker.google.com/issues/329106322
         features = regions.aggregate_array(regionId)
         isString = lambda i: ee.Algorithms.ObjectType(i).compareTo("String").eq(0)  # noqa: E731
         features = features.map(lambda i: ee.Algorithms.If(isString(i), i, ee.Number(i).format()))
-        features = features.getInfo()
 
         # extract the labels from the parameters
         eeBands = ee.List(bands) if len(bands) else self._obj.bandNames()
-        labels = labels if len(labels) else eeBands.getInfo()
+
+        # evaluate everything in a single request
+        data, features, names = evaluate_many([data, features, eeBands])
+        labels = labels if len(labels) else names
 
         # reorder the data according to the labels id set by the user
         data = {f: {b: data[f][b] for b in labels} for f in features}
@@ -2043,6 +2090,7 @@ class ImageAccessor:
         bestEffort: bool = False,
         maxPixels: int = 10**7,
         tileScale: float = 1,
+        autoEscalate: int = 0,
         **kwargs,
     ) -> Axes:
         """Plot the histogram of the image bands.
@@ -2061,6 +2109,7 @@ class ImageAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. default to 10**7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
             **kwargs: Keyword arguments passed to the `matplotlib.fill_between() <https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.fill_between.html>`_ function.
 
         Returns:
@@ -2083,10 +2132,12 @@ class ImageAccessor:
                 normClim = ee.ImageCollection('OREGONSTATE/PRISM/Norm91m').toBands()
                 normClim.geetools.plot_hist()
         """
+        from matplotlib import pyplot as plt
+        from matplotlib.colors import to_rgba
+
         # extract the bands from the image
         eeBands = ee.List(bands) if len(bands) == 0 else self._obj.bandNames()
         eeLabels = ee.List(labels).flatten() if len(labels) == 0 else eeBands
-        labels = eeLabels.getInfo()
 
         # retrieve the region from the parameters
         region = region if region else self._obj.geometry()
@@ -2094,6 +2145,19 @@ class ImageAccessor:
         # extract the data from the server
         image = self._obj.select(eeBands).rename(eeLabels).clip(region)
 
+        def histogram(**params) -> ee.List:
+            # compute the min and max values of the bands so w can scale the bins of the histogram
+            min = image.reduceRegion(**{"reducer": ee.Reducer.min(), **params})
+            min = min.values().reduce(ee.Reducer.min())
+
+            max = image.reduceRegion(**{"reducer": ee.Reducer.max(), **params})
+            max = max.values().reduce(ee.Reducer.max())
+
+            # compute the histogram. The result is a dictionary with each band as key and the histogram
+            # as values. The histograp is a list of [start of bin, value] pairs
+            reducer = ee.Reducer.fixedHistogram(min, max, bins)
+            return ee.List([eeLabels, image.reduceRegion(**{"reducer": reducer, **params})])
+
         # set the common parameters of the 3 reducers
         params = {
             "geometry": region,
@@ -2105,17 +2169,8 @@ class ImageAccessor:
             "tileScale": tileScale,
         }
 
-        # compute the min and max values of the bands so w can scale the bins of the histogram
-        min = image.reduceRegion(**{"reducer": ee.Reducer.min(), **params})
-        min = min.values().reduce(ee.Reducer.min())
-
-        max = image.reduceRegion(**{"reducer": ee.Reducer.max(), **params})
-        max = max.values().reduce(ee.Reducer.max())
-
-        # compute the histogram. The result is a dictionary with each band as key and the histogram
-        # as values. The histograp is a list of [start of bin, value] pairs
-        reducer = ee.Reducer.fixedHistogram(min, max, bins)
-        raw_data = image.reduceRegion(**{"reducer": reducer, **params}).getInfo()
+        # get the labels and the histogram in a single request, escalating the parameters on server errors
+        labels, raw_data = _auto_escalate(histogram, params, autoEscalate)
 
         # massage raw data to reshape them as usable source for an Axes plot
         # first extract the x coordinates of the plot as a list of bins borders
@@ -3,26 +3,30 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime as dt
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 import ee
-import ee_extra
-import requests
-import xarray
 from ee import apifunction
-from matplotlib.axes import Axes
-from xarray import Dataset
-from xee.ext import REQUEST_BYTE_LIMIT
 
 from .accessors import register_class_accessor
+from .ee_cache import cached_getInfo
+from .ee_escalate import _auto_escalate
+from .ee_transport import _get
 from .utils import plot_data
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from xarray import Dataset
+
 PY_DATE_FORMAT = "%Y-%m-%dT%H-%M-%S"
 "The python format to use to parse dates coming from GEE."
 
 EE_DATE_FORMAT = "YYYY-MM-dd'T'HH-mm-ss"
 "The javascript format to use to burn date object in GEE."
 
+REQUEST_BYTE_LIMIT = 48 * 2**20
+"The default byte limit of the requests of :py:meth:`ImageCollectionAccessor.to_xarray`, a copy of ``xee.ext.REQUEST_BYTE_LIMIT`` to not import xee with geetools."
+
 
 @register_class_accessor(ee.ImageCollection, "geetools")
 class ImageCollectionAccessor:
@@ -81,6 +85,8 @@ class ImageCollectionAccessor:
                 )
 
         """
+        import ee_extra
+
         return ee_extra.QA.clouds.maskClouds(
             self._obj,
             method,
@@ -123,6 +129,8 @@ class ImageCollectionAccessor:
                 )
                 s2.size().getInfo()
         """
+        import ee_extra
+
         return ee_extra.ImageCollection.core.closest(self._obj, date, tolerance, unit)
 
     def spectralIndices(
@@ -207,6 +215,8 @@ class ImageCollectionAccessor:
                 image = ee.Image('COPERNICUS/S2_SR/20190828T151811_20190828T151809_T18GYT')
                 image = image.geetools.spectralIndices(["NDVI", "NDFI"])
         """
+        import ee_extra
+
         # fmt: off
         return ee_extra.Spectral.core.spectralIndices(
             self._obj, index, G, C1, C2, L, cexp, nexp, alpha, slope, intercept, gamma, omega,
@@ -235,6 +245,8 @@ class ImageCollectionAccessor:
 
                 ee.ImageCollection('MODIS/006/MOD11A2').geetools.getScaleParams()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getScaleParams(self._obj)
 
     def getOffsetParams(self) -> dict[str, float]:
@@ -257,6 +269,8 @@ class ImageCollectionAccessor:
 
                 ee.ImageCollection('MODIS/006/MOD11A2').geetools.getOffsetParams()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getOffsetParams(self._obj)
 
     def scaleAndOffset(self) -> ee.ImageCollection:
@@ -278,6 +292,8 @@ class ImageCollectionAccessor:
 
                 S2 = ee.ImageCollection('COPERNICUS/S2_SR').scaleAndOffset()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.scaleAndOffset(self._obj)
 
     def preprocess(self, **kwargs) -> ee.ImageCollection:
@@ -304,6 +320,8 @@ class ImageCollectionAccessor:
                 ee.Initialize()
                 S2 = ee.ImageCollection('COPERNICUS/S2_SR').preprocess()
         """
+        import ee_extra
+
         return ee_extra.QA.pipelines.preprocess(self._obj, **kwargs)
 
     def getSTAC(self) -> dict[str, Any]:
@@ -323,24 +341,24 @@ class ImageCollectionAccessor:
                 ee.ImageCollection('COPERNICUS/S2_SR').geetools.getSTAC()
         """
         # extract the Asset id from the imagecollection
-        assetId = self._obj.get("system:id").getInfo()
+        assetId = cached_getInfo(self._obj.get("system:id"))
 
         # search for the project in the GEE catalog and extract the project catalog URL
         project = assetId.split("/")[0]
         catalog = "https://earthengine-stac.storage.googleapis.com/catalog/catalog.json"
-        links = requests.get(catalog).json()["links"]
+        links = _get(catalog).json()["links"]
         project_catalog = next((i["href"] for i in links if i.get("title") == project), None)
         if project_catalog is None:
             raise ValueError(f"Project {project} not found in the catalog")
 
         # search for the collection in the project catalog and extract the collection STAC URL
         collection = "_".join(assetId.split("/"))
-        links = requests.get(project_catalog).json()["links"]
+        links = _get(project_catalog).json()["links"]
         collection_stac = next((i["href"] for i in links if i.get("title") == collection), None)
         if collection_stac is None:
             raise ValueError(f"Collection {collection} not found in the {project} catalog")
 
-        return requests.get(collection_stac).json()
+        return _get(collection_stac).json()
 
     def getDOI(self) -> str:
         """Gets the DOI of the collection, if available.
@@ -361,6 +379,8 @@ class ImageCollectionAccessor:
 
                 ee.ImageCollection('NASA/GPM_L3/IMERG_V06').geetools.getDOI()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getDOI(self._obj)
 
     def getCitation(self) -> str:
@@ -382,6 +402,8 @@ class ImageCollectionAccessor:
 
                 ee.ImageCollection('NASA/GPM_L3/IMERG_V06').geetools.getCitation()
         """
+        import ee_extra
+
         return ee_extra.STAC.core.getCitation(self._obj)
 
     def panSharpen(self, method: str = "SFIM", qa: str = "", **kwargs) -> ee.ImageCollection:
@@ -409,6 +431,8 @@ class ImageCollectionAccessor:
                 source = ee.Image("LANDSAT/LC08/C01/T1_TOA/LC08_047027_20160819")
                 sharp = source.panSharpen(method="HPFA", qa=["MSE", "RMSE"], maxPixels=1e13)
         """
+        import ee_extra.Algorithms.core
+
         return ee_extra.Algorithms.core.panSharpen(
             img=self._obj, method=method, qa=qa or None, prefix="geetools", **kwargs
         )
@@ -472,6 +496,8 @@ class ImageCollectionAccessor:
                 ic = ee.ImageCollection("LANDSAT/LT05/C01/T1")
                 ic = ic.geetools.tasseledCap()
         """
+        import ee_extra
+
         return ee_extra.Spectral.core.tasseledCap(self._obj)
 
     def append(self, image: ee.Image) -> ee.ImageCollection:
@@ -592,7 +618,7 @@ class ImageCollectionAccessor:
         # initialize the sum with a 0 value initial item
         # all the properties of the first image of the collection are copied
         first = self._obj.first()
-        zero = ee.Image.constant(0).copyProperties(first, first.propertyNames())
+        zero = ee.Image.constant(0).copyProperties(first, self._propertyNames())
         s = ee.Image(zero).rename("integral").set("last", zero)
 
         # compute the approximation of the integral using the trapezoidal method
@@ -659,7 +685,7 @@ class ImageCollectionAccessor:
                 print(outliers.getInfo())
         """
         # cast parameters and compute the outlier band names
-        initBands = self._obj.first().bandNames()
+        initBands = self._bandNames()
         statBands = ee.List(bands) if bands else initBands
         outBands = statBands.map(lambda b: ee.String(b).cat("_outlier"))
 
@@ -731,6 +757,8 @@ class ImageCollectionAccessor:
         Returns:
             An ``xarray.Dataset`` that streams in remote data from Earth Engine.
         """
+        import xarray
+
         return xarray.open_dataset(
             self._obj,
             engine="ee",
@@ -778,7 +806,7 @@ class ImageCollectionAccessor:
                 print(valid.getInfo())
         """
         # compute the mask for the specified band
-        band = self._obj.first().bandNames().get(0) if band == "" else ee.String(band)
+        band = self._bandNames().get(0) if band == "" else ee.String(band)
         masks = self._obj.select([band]).map(lambda i: i.mask().eq(1))
         validPixel = masks.sum().rename("valid").clip(self._obj.geometry())
         validPct = validPixel.divide(self._obj.size()).multiply(100).rename("pct_valid")
@@ -883,6 +911,59 @@ class ImageCollectionAccessor:
         """
         return self.containsBandNames(bandNames, "ANY")
 
+    def schema(self, refresh: bool = False) -> dict:
+        """Fetch and cache the band names, data types, projections and property names of the collection.
+
+        The schema is read from the first image of the collection in a single request and cached on the
+        collection object. The methods of the accessor called afterward on the same object use the cached
+        names as literals instead of computing ``first().bandNames()`` or ``first().propertyNames()`` on
+        the server, making the graphs smaller. The collections derived from it (filtered, mapped...) may
+        have another first image so they don't share its schema.
+
+        Parameters:
+            refresh: Fetch the schema again even if it is already cached. Default to ``False``.
+
+        Returns:
+            A dictionary with the ``bandNames`` list, the ``bandTypes`` and ``projections``
+            dictionaries keyed by band name and the ``propertyNames`` list.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                collection = (
+                    ee.ImageCollection("LANDSAT/LC08/C01/T1_TOA")
+                    .filterBounds(ee.Geometry.Point(-122.262, 37.8719))
+                    .filterDate("2014-01-01", "2014-12-31")
+                )
+
+                schema = collection.geetools.schema()
+                print(schema["bandNames"])
+
+                # the band names are now embedded as literals in the graph
+                outliers = collection.geetools.outliers()
+        """
+        if not refresh and (schema := self._cached_schema()):
+            return schema
+
+        first = self._obj.first()
+        bandNames = first.bandNames()
+        projections = bandNames.map(lambda b: first.select([b]).projection())
+        schema = ee.Dictionary(
+            {
+                "bandNames": bandNames,
+                "bandTypes": first.bandTypes(),
+                "projections": ee.Dictionary.fromLists(bandNames, projections),
+                "propertyNames": first.propertyNames(),
+            }
+        )
+        schema = cached_getInfo(schema)
+        self._obj._geetools_schema = schema
+        return schema
+
     def aggregateArray(self, properties: list | ee.List | None = None) -> ee.Dictionary:
         """Aggregate the :py:class:`ee.ImageCollection` selected properties into a dictionary.
 
@@ -908,7 +989,7 @@ class ImageCollectionAccessor:
                 aggregated = collection.geetools.aggregateArray(["CLOUD_COVER", "system:time_start"])
                 print(aggregated.getInfo())
         """
-        keys = ee.List(properties) if properties is not None else self._obj.first().propertyNames()
+        keys = ee.List(properties) if properties is not None else self._propertyNames()
         values = keys.map(lambda p: self._obj.aggregate_array(p))
         return ee.Dictionary.fromLists(keys, values)
 
@@ -1039,6 +1120,41 @@ class ImageCollectionAccessor:
 
         return ee.ImageCollection(ic)
 
+    def reduceBy(self, property: str, reducer: str | ee.Reducer = "mean") -> ee.ImageCollection:
+        """Reduce together the images sharing the same value of a property using the provided reducer.
+
+        The images are grouped with a single :py:meth:`ee.Join.saveAll` of the distinct values of the property
+        against the collection, so each image is visited once whatever the number of groups. The images of a group
+        are reduced in the order of the collection and the result keeps its band names.
+
+        Args:
+            property: The name of the property to group the images by.
+            reducer: The name of the reducer to use or a Reducer object. Default is ``"mean"``.
+
+        Returns:
+            A new :py:class:`ee.ImageCollection` with one reduced image per value of the property, in the order of
+            their first appearance in the collection. Each image stores its value in ``property``.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                collection = (
+                    ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
+                    .filterBounds(ee.Geometry.Point(-122.262, 37.8719))
+                    .filterDate("2023-01-01", "2023-12-31")
+                )
+
+                mosaics = collection.geetools.reduceBy("MGRS_TILE", "median")
+                print(mosaics.aggregate_array("MGRS_TILE").getInfo())
+        """
+        red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
+        values = self._obj.aggregate_array(property).distinct()
+        return self._reduceGroups(self._obj, property, values, red, self._bandNames())
+
     def closestDate(self) -> ee.ImageCollection:
         """Fill masked pixels with the first valid pixel in the stack of images.
 
@@ -1106,7 +1222,7 @@ class ImageCollectionAccessor:
         sumOfDistancesName = uuid.uuid4().hex
 
         # discover bandname from the first image of the collection
-        bandNames = self._obj.first().bandNames()
+        bandNames = self._bandNames()
 
         # normalize the band used to compute the distance
         # first extract the min and max value of each band pixelwizse along the stac and then
@@ -1153,6 +1269,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = 10**7,
         tileScale: float = 1,
+        autoEscalate: int = 0,
     ) -> ee.Dictionary:
         """Reduce the data for each image in the collection by bands on a specific region.
 
@@ -1178,6 +1295,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. Defaults to 1e7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
 
         Returns:
             A dictionary with the reduced values for each band and each date.
@@ -1204,8 +1322,13 @@ class ImageCollectionAccessor:
                 reduced = collection.geetools.datesByBands(region, "mean", 10000, "system:time_start")
                 print(reduced.getInfo())
         """
+        # evaluate the reduction right away, escalating its parameters on server errors
+        if autoEscalate:
+            params = {k: v for k, v in locals().items() if k not in ["self", "autoEscalate"]}
+            return ee.Dictionary(_auto_escalate(self.datesByBands, params, autoEscalate))
+
         # cast parameters
-        eeBands = ee.List(bands) if len(bands) else self._obj.first().bandNames()
+        eeBands = ee.List(bands) if len(bands) else self._bandNames()
         eeLabels = ee.List(labels) if len(labels) else eeBands
 
         # recast band names as labels in the source collection
@@ -1375,7 +1498,7 @@ class ImageCollectionAccessor:
             - :docstring:`ee.ImageCollection.geetools.plot_doy_by_years`
         """
         # cast parameters
-        bands = ee.List(bands) if len(bands) else self._obj.first().bandNames()
+        bands = ee.List(bands) if len(bands) else self._bandNames()
         labels = ee.List(labels) if len(labels) else bands
 
         # recast band names as labels in the source collection
@@ -1450,6 +1573,7 @@ class ImageCollectionAccessor:
         crs: str | None = None,
         crsTransform: list | None = None,
         tileScale: float = 1,
+        autoEscalate: int = 0,
     ) -> ee.Dictionary:
         """Aggregate the images that occurs on the same day and then reduce a single band on multiple regions.
 
@@ -1474,6 +1598,7 @@ class ImageCollectionAccessor:
             crs: The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale.
             crsTransform: The list of CRS transform values. This is a row-major ordering of the 3x2 transform matrix. This option is mutually exclusive with 'scale', and replaces any transform already set on the projection.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
 
         Returns:
             A dictionary with the reduced values for each region and each day.
@@ -1487,6 +1612,11 @@ class ImageCollectionAccessor:
             - :docstring:`ee.ImageCollection.geetools.plot_doy_by_seasons`
             - :docstring:`ee.ImageCollection.geetools.plot_doy_by_years`
         """
+        # evaluate the reduction right away, escalating its parameters on server errors
+        if autoEscalate:
+            params = {k: v for k, v in locals().items() if k not in ["self", "autoEscalate"]}
+            return ee.Dictionary(_auto_escalate(self.doyByRegions, params, autoEscalate, "regions"))
+
         # create 2 metadata name as random string to avoid any risk of conflicts
         doy_metadata, size_metadata = uuid.uuid4().hex, uuid.uuid4().hex
 
@@ -1843,7 +1973,8 @@ class ImageCollectionAccessor:
             bestEffort=bestEffort,
             maxPixels=maxPixels,
             tileScale=tileScale,
-        ).getInfo()
+        )
+        raw_data = cached_getInfo(raw_data)
 
         # transform all the dates int datetime objects
         def to_date(dict):
@@ -1930,7 +2061,8 @@ class ImageCollectionAccessor:
             crs=crs,
             crsTransform=crsTransform,
             tileScale=tileScale,
-        ).getInfo()
+        )
+        raw_data = cached_getInfo(raw_data)
 
         # transform all the dates int datetime objects
         def to_date(dict):
@@ -2022,7 +2154,8 @@ class ImageCollectionAccessor:
             bestEffort=bestEffort,
             maxPixels=maxPixels,
             tileScale=tileScale,
-        ).getInfo()
+        )
+        raw_data = cached_getInfo(raw_data)
 
         # transform all the dates strings into int object and reorder the dictionary
         def to_int(d):
@@ -2112,7 +2245,8 @@ class ImageCollectionAccessor:
             crs=crs,
             crsTransform=crsTransform,
             tileScale=tileScale,
-        ).getInfo()
+        )
+        raw_data = cached_getInfo(raw_data)
 
         # transform all the dates strings into int object and reorder the dictionary
         def to_int(d):
@@ -2221,7 +2355,8 @@ class ImageCollectionAccessor:
             bestEffort=bestEffort,
             maxPixels=maxPixels,
             tileScale=tileScale,
-        ).getInfo()
+        )
+        raw_data = cached_getInfo(raw_data)
 
         # transform all the dates strings into int object and reorder the dictionary
         def to_int(d):
@@ -2340,6 +2475,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = None,
         tileScale: float = 1,
+        autoEscalate: int = 0,
     ) -> ee.Dictionary:
         """Apply a reducer to all the pixels in a specific region on each image of the collection.
 
@@ -2368,6 +2504,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            autoEscalate: If set, the reduction is evaluated right away and retried up to this number of times with escalated parameters when it fails on the server with a memory, pixel or timeout error (see :py:func:`escalate <geetools.ee_escalate.escalate>`). The settings that worked are reported in a warning. Default to 0 (lazy evaluation without retry).
 
         Returns:
             A dictionary with the reduced values for each image.
@@ -2408,6 +2545,11 @@ class ImageCollectionAccessor:
                 df = pd.DataFrame(data.getInfo()).transpose()
                 df.head(15)
         """
+        # evaluate the reduction right away, escalating its parameters on server errors
+        if autoEscalate:
+            params = {k: v for k, v in locals().items() if k not in ["self", "autoEscalate"]}
+            return ee.Dictionary(_auto_escalate(self.reduceRegion, params, autoEscalate))
+
         # filter the imageCollection with the region parameter to reduce the number of manipulated images and speed up the computation
         ic = self._obj.filterBounds(geometry)
 
@@ -2439,9 +2581,8 @@ class ImageCollectionAccessor:
         idRed = idReducer  # renaming of the variable to save space
         red = getattr(ee.Reducer, idRed)() if isinstance(idRed, str) else idRed
         pList = ic.aggregate_array(pname).distinct()
-        bands = ic.first().bandNames()
-        iList = pList.map(lambda p: ic.filter(ee.Filter.eq(pname, p)).reduce(red).rename(bands))
-        ic = ee.ImageCollection(iList)
+        bands = self._bandNames(ic)
+        ic = self._reduceGroups(ic, pname, pList, red, bands)
 
         # The tobands method will produce an image with the following band names: <system:index>_<bandName>
         # What we want is: <idProperty>_<bandName> so we can make more advance filtering downstream.
@@ -2590,9 +2731,8 @@ class ImageCollectionAccessor:
         idRed = idReducer  # renaming of the variable to save space
         red = getattr(ee.Reducer, idRed)() if isinstance(idRed, str) else idRed
         pList = ic.aggregate_array(pname).distinct()
-        bands = ic.first().bandNames()
-        iList = pList.map(lambda p: ic.filter(ee.Filter.eq(pname, p)).reduce(red).rename(bands))
-        ic = ee.ImageCollection(iList)
+        bands = self._bandNames(ic)
+        ic = self._reduceGroups(ic, pname, pList, red, bands)
 
         # The tobands method will produce an image with the following band names: <system:index>_<bandName>
         # What we want is: <idProperty>_<bandName> so we can make more advance filtering downstream.
@@ -2641,3 +2781,43 @@ class ImageCollectionAccessor:
         fclist = reduced.toList(reduced.size()).map(splitFeatures).flatten()
 
         return ee.FeatureCollection(fclist)
+
+    def _bandNames(self, ic: ee.ImageCollection | None = None) -> ee.List:
+        """Return the band names of the first image of ``ic``, as literals if its schema is cached."""
+        ic = self._obj if ic is None else ic
+        schema = getattr(ic, "_geetools_schema", None)
+        return ee.List(schema["bandNames"]) if schema else ic.first().bandNames()
+
+    def _propertyNames(self) -> ee.List:
+        """Return the property names of the first image, as literals if the schema is cached."""
+        schema = self._cached_schema()
+        return ee.List(schema["propertyNames"]) if schema else self._obj.first().propertyNames()
+
+    @staticmethod
+    def _reduceGroups(
+        ic: ee.ImageCollection,
+        property: str,
+        values: ee.List,
+        reducer: ee.Reducer,
+        bands: ee.List,
+    ) -> ee.ImageCollection:
+        """Reduce the images of ``ic`` sharing the same ``property`` value with a single join.
+
+        Each value of ``values`` becomes a feature of a primary table joined to the collection: every image
+        is visited once instead of filtering the whole collection for each value.
+        """
+        matches = "__geetools_group__"
+        groups = ee.FeatureCollection(values.map(lambda v: ee.Feature(None, {property: v})))
+        sameValue = ee.Filter.equals(leftField=property, rightField=property)
+        joined = ee.Join.saveAll(matches).apply(groups, ic, sameValue)
+
+        def reduce(group: ee.Feature) -> ee.Image:
+            group = ee.Feature(group)
+            images = ee.ImageCollection.fromImages(group.get(matches))
+            return images.reduce(reducer).rename(bands).set(property, group.get(property))
+
+        return ee.ImageCollection(joined.toList(joined.size()).map(reduce))
+
+    def _cached_schema(self) -> dict | None:
+        """Return the schema of the collection if it was fetched before."""
+        return getattr(self._obj, "_geetools_schema", None)
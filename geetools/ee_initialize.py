@@ -1,26 +1,36 @@
 """Tools for the :py:func:`ee.Initialize` function."""
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import os
 import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
 import ee
-import httplib2
 from google.oauth2.credentials import Credentials
 
 from .accessors import register_function_accessor
+from .ee_transport import _http
 
 _project_id: str | None = None
 "The project Id used by the current user."
 
+TOKEN_MARGIN = timedelta(minutes=5)
+"The remaining lifetime below which a cached access token is refreshed."
+
 
 @register_function_accessor(ee.Initialize, "geetools")
 class InitializeAccessor:
     """Toolbox for the ``ee.Initialize`` function."""
 
     @staticmethod
-    def from_user(name: str = "", credential_pathname: str = "", project: str = "") -> None:
+    def from_user(
+        name: str = "", credential_pathname: str = "", project: str = "", cache_token: bool = False
+    ) -> None:
         """Initialize Earthengine API using a specific user.
 
         Equivalent to the :py:func:`ee.Initialize` function but with a specific credential file stored in
@@ -31,6 +41,9 @@ class InitializeAccessor:
             name: The name of the user as saved when created. use default if not set
             credential_pathname: The path to the folder where the credentials are stored. If not set, it uses the default path
             project: The project_id to use. If not set, it uses the default project_id of the saved credentials.
+            cache_token: Share the access token with the other processes of the machine using this user.
+                The token is cached next to the credential file and reused until it expires, it is refreshed
+                by a single process at a time. Default to ``False``.
 
         Example:
             .. code-block:: python
@@ -39,32 +52,16 @@ class InitializeAccessor:
                 import geetools
 
                 ee.Initialize.from_user("<name of the saved user>")
+
+                # in short-lived workers, reuse the access token of the other workers
+                ee.Initialize.geetools.from_user("<name of the saved user>", cache_token=True)
         """
         # gather global variable to be modified
         global _project_id
 
-        # set the user profile information
-        name = f"credentials{name}"
-        credential_pathname = credential_pathname or ee.oauth.get_credentials_path()
-        credential_folder = Path(credential_pathname).parent
-        credential_path = credential_folder / name
-
-        # check if the user exists
-        if not credential_path.exists():
-            msg = "Please register this user first by using geetools.User.create first"
-            raise ee.EEException(msg)
-
         # Set the credential object and Init GEE API
-        tokens = json.loads((credential_path / name).read_text())
-        credentials = Credentials(
-            None,
-            refresh_token=tokens["refresh_token"],
-            token_uri=ee.oauth.TOKEN_URI,
-            client_id=tokens["client_id"],
-            client_secret=tokens["client_secret"],
-            scopes=ee.oauth.SCOPES,
-        )
-        ee.Initialize(credentials)
+        credentials, tokens = _user_credentials(name, credential_pathname, cache_token)
+        ee.Initialize(credentials, http_transport=_http())
 
         # save the project_id in a dedicated global variable as it's not saved
         # from GEE side
@@ -92,14 +89,8 @@ class InitializeAccessor:
         # gather global variable to be modified
         global _project_id
 
-        # connect to GEE using a temp file to avoid writing the key to disk
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file = Path(temp_dir) / "private_key.json"
-            file.write_text(private_key)
-            ee_user = json.loads(private_key)["client_email"]
-            _project_id = json.loads(private_key)["project_id"]
-            credentials = ee.ServiceAccountCredentials(ee_user, str(file))
-            ee.Initialize(credentials=credentials, http_transport=httplib2.Http())
+        credentials, _project_id = _service_account_credentials(private_key)
+        ee.Initialize(credentials=credentials, http_transport=_http())
 
     @staticmethod
     def project_id() -> str:
@@ -118,6 +109,153 @@ class InitializeAccessor:
 
                 ee.Initialize.geetools.project_id()
         """
+        from .ee_session import _session
+
+        # the requests sent within a session of a pool use the project of the session
+        if (session := _session.get()) is not None:
+            return session.project
         if _project_id is None:
             raise RuntimeError("The GEE account is not initialized")
         return _project_id
+
+
+def _user_credentials(
+    name: str = "", credential_pathname: str = "", cache_token: bool = False
+) -> tuple[Credentials, dict]:
+    """Load the credentials of a user saved by ``ee.Authenticate.geetools.new_user``.
+
+    If ``cache_token`` is set, the access token is shared through a cache next to the credential file.
+
+    Returns:
+        The credentials and the tokens read from the credential file.
+    """
+    # set the user profile information
+    name = f"credentials{name}"
+    credential_pathname = credential_pathname or ee.oauth.get_credentials_path()
+    credential_folder = Path(credential_pathname).parent
+    credential_path = credential_folder / name
+
+    # check if the user exists
+    if not credential_path.exists():
+        msg = "Please register this user first by using geetools.User.create first"
+        raise ee.EEException(msg)
+
+    tokens = json.loads((credential_path / name).read_text())
+    credentials = _CachedCredentials(
+        None,
+        cache=_token_cache(credential_folder, name) if cache_token else None,
+        refresh_token=tokens["refresh_token"],
+        token_uri=ee.oauth.TOKEN_URI,
+        client_id=tokens["client_id"],
+        client_secret=tokens["client_secret"],
+        scopes=ee.oauth.SCOPES,
+    )
+    return credentials, tokens
+
+
+def _service_account_credentials(private_key: str) -> tuple[ee.ServiceAccountCredentials, str]:
+    """Build the credentials of a service account from its json key.
+
+    Returns:
+        The credentials and the project_id of the service account.
+    """
+    # connect to GEE using a temp file to avoid writing the key to disk
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir) / "private_key.json"
+        file.write_text(private_key)
+        ee_user = json.loads(private_key)["client_email"]
+        project_id = json.loads(private_key)["project_id"]
+        credentials = ee.ServiceAccountCredentials(ee_user, str(file))
+    return credentials, project_id
+
+
+class _CachedCredentials(Credentials):
+    """User credentials sharing their access token with the other processes through a file cache.
+
+    The cache stores the access token, its expiry and the fingerprint of the refresh token it was
+    granted for. It is read before any refresh and written after it, both under an exclusive file lock
+    so that concurrent workers wait for the one refreshing the token instead of refreshing it again.
+    """
+
+    _cache: Path | None = None
+
+    def __init__(self, *args, cache: Path | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = cache
+        if cache is not None:
+            self._load()
+
+    def refresh(self, request):
+        """Refresh the access token unless another process already did it."""
+        if self._cache is None:
+            return super().refresh(request)
+        with _file_lock(self._cache.with_suffix(".lock")):
+            if not self._load():
+                super().refresh(request)
+                self._save()
+
+    def _fingerprint(self) -> str:
+        """Return the fingerprint of the refresh token."""
+        return hashlib.sha256((self.refresh_token or "").encode()).hexdigest()
+
+    def _load(self) -> bool:
+        """Use the cached access token if it was granted for this user and is still valid."""
+        try:
+            entry = json.loads(self._cache.read_text())  # type: ignore[union-attr]
+            expiry = datetime.fromisoformat(entry["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if entry.get("fingerprint") != self._fingerprint() or expiry - TOKEN_MARGIN <= now:
+            return False
+        self.token, self.expiry = entry["token"], expiry
+        return True
+
+    def _save(self):
+        """Write the access token in the cache, readable only by the current user."""
+        cache = self._cache
+        if cache is None or self.expiry is None:
+            return
+        entry = {"token": self.token, "expiry": self.expiry.isoformat()}
+        entry["fingerprint"] = self._fingerprint()
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=cache.name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, cache)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _token_cache(credential_folder: Path, name: str) -> Path:
+    """Return the path of the access token cache of a credential file.
+
+    The file is hidden so that it's not listed as a user by ``ee.Authenticate.geetools.list_user``.
+    """
+    return credential_folder / f".{name}.token"
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file shared by all the processes of the machine."""
+    with open(path, "a+") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,227 @@
+"""Adaptive concurrency and rate limiting of the requests sent to the Earth Engine servers."""
+from __future__ import annotations
+
+import contextlib
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+import ee
+
+from .accessors import _register_extention
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+THROTTLING_ERRORS = [
+    r"\b429\b",
+    r"too many requests",
+    r"too many concurrent",
+    r"rate limit",
+    r"quota",
+    r"resource exhausted",
+]
+"The regex patterns of the error messages showing that the servers are throttling the requests."
+
+METRICS = ["calls", "errors", "throttled", "wait", "time"]
+"The metrics recorded for each endpoint."
+
+
+@_register_extention(ee.geetools)
+class Limiter:
+    """A process-wide adaptive limiter of the requests sent by geetools.
+
+    Once active, every request sent by geetools (asset operations, task start and polling, evaluation
+    of the client-side methods) goes through the limiter. The number of concurrent requests is
+    controlled with an AIMD (additive increase, multiplicative decrease) algorithm: each successful
+    request increases the limit by ``1 / limit`` (i.e. by 1 once all the requests in flight have
+    succeeded) and each throttling error (``429``, quota, rate limit...) or request slower than
+    ``latency`` multiplies it by ``backoff``. Only the requests sent after the last decrease can decrease
+    it again so a burst of errors only counts once. On top of that, each endpoint can be limited to a
+    number of requests per second with a token bucket.
+
+    The limiter is opt-in: the requests are only limited within its context or once :py:meth:`enable`
+    is called.
+
+    Parameters:
+        concurrency: The initial number of concurrent requests. Default to 16.
+        min_concurrency: The minimum number of concurrent requests. Default to 1.
+        max_concurrency: The maximum number of concurrent requests. Default to 64.
+        rates: The maximum number of requests per second of some endpoints (e.g. ``{"startTask": 1}``).
+            The endpoints are named after the :py:mod:`ee.data` functions. Default to no rate limit.
+        burst: The number of requests that can be sent at once before the rates apply. Default to 10.
+        latency: The duration in seconds above which a request is considered slow. Default to ``None``
+            (only the errors decrease the limit).
+        backoff: The factor applied to the limit on throttling. Default to 0.5.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            limiter = ee.geetools.Limiter(concurrency=4, rates={"computeValue": 10}).enable()
+            regions = [ee.Geometry.Point([i, 0]).buffer(1000) for i in range(100)]
+            stats = ee.geetools.Evaluator(max_workers=32).map([r.area() for r in regions])
+
+            print(limiter.metrics())
+    """
+
+    current: Limiter | None = None
+    "The limiter used by all the requests of geetools, if any."
+
+    def __init__(
+        self,
+        concurrency: int = 16,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        rates: dict[str, float] | None = None,
+        burst: int = 10,
+        latency: float | None = None,
+        backoff: float = 0.5,
+    ):
+        """Initialize the limiter."""
+        if not min_concurrency <= concurrency <= max_concurrency:
+            raise ValueError("concurrency must be between min_concurrency and max_concurrency.")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1.")
+        self.limit = float(concurrency)
+        self.min_concurrency, self.max_concurrency = min_concurrency, max_concurrency
+        self.latency, self.backoff = latency, backoff
+        self.buckets = {e: _TokenBucket(r, burst) for e, r in (rates or {}).items()}
+        self.active = 0
+        self._decreased = time.monotonic()
+        self._metrics: dict[str, dict[str, float]] = {}
+        self._condition = threading.Condition()
+        self._previous: list[Limiter | None] = []
+
+    def __enter__(self):
+        """Use this limiter within the context."""
+        self._previous.append(Limiter.current)
+        Limiter.current = self
+        return self
+
+    def __exit__(self, *args):
+        """Restore the previous limiter."""
+        Limiter.current = self._previous.pop()
+
+    def enable(self) -> Limiter:
+        """Use this limiter for the rest of the session.
+
+        Returns:
+            The limiter itself.
+        """
+        Limiter.current = self
+        return self
+
+    @staticmethod
+    def disable():
+        """Stop limiting the requests for the rest of the session."""
+        Limiter.current = None
+
+    @contextlib.contextmanager
+    def request(self, endpoint: str) -> Iterator[None]:
+        """Wait for a token and a free slot to send a request within the context.
+
+        Parameters:
+            endpoint: The name of the endpoint called in the context.
+        """
+        start = time.monotonic()
+        if endpoint in self.buckets:
+            self.buckets[endpoint].acquire()
+        with self._condition:
+            self._condition.wait_for(lambda: self.active < int(self.limit))
+            self.active += 1
+        sent = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._release(endpoint, start, sent, e)
+            raise
+        self._release(endpoint, start, sent, None)
+
+    def call(self, endpoint: str, func: Callable, *args, **kwargs) -> Any:
+        """Call a function sending a request through the limiter.
+
+        Parameters:
+            endpoint: The name of the endpoint called by the function.
+            func: The function to call.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            The output of the function.
+        """
+        with self.request(endpoint):
+            return func(*args, **kwargs)
+
+    def metrics(self) -> pd.DataFrame:
+        """Return the metrics of the requests sent through the limiter.
+
+        Returns:
+            A DataFrame with one row per endpoint and the following columns: ``calls``, ``errors``,
+            ``throttled``, ``wait`` (the total time spent waiting for the limiter) and ``time``
+            (the total duration of the requests).
+        """
+        import pandas as pd
+
+        with self._condition:
+            rows = {endpoint: dict(metrics) for endpoint, metrics in self._metrics.items()}
+        return pd.DataFrame.from_dict(rows, orient="index", columns=METRICS)
+
+    def _release(self, endpoint: str, start: float, sent: float, error: Exception | None):
+        """Free the slot of a request and adapt the limit to its outcome."""
+        now = time.monotonic()
+        throttled = error is not None and _is_throttling(error)
+        slow = error is None and self.latency is not None and now - sent > self.latency
+        with self._condition:
+            self.active -= 1
+            if (throttled or slow) and sent >= self._decreased:
+                self.limit = max(self.min_concurrency, self.limit * self.backoff)
+                self._decreased = now
+            elif error is None and not slow:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            metrics = self._metrics.setdefault(endpoint, dict.fromkeys(METRICS, 0))
+            metrics["calls"] += 1
+            metrics["errors"] += error is not None
+            metrics["throttled"] += throttled
+            metrics["wait"] += sent - start
+            metrics["time"] += now - sent
+            self._condition.notify_all()
+
+
+class _TokenBucket:
+    """A token bucket allowing ``rate`` requests per second with bursts of ``capacity`` requests."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate, self.capacity = rate, capacity
+        self.tokens, self.updated = float(capacity), time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting for one to be available if needed."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+def _is_throttling(error: Exception) -> bool:
+    """Check if an error means that the servers are throttling the requests."""
+    return any(re.search(p, str(error), re.IGNORECASE) for p in THROTTLING_ERRORS)
+
+
+def _limited(endpoint: str, func: Callable, *args, **kwargs) -> Any:
+    """Call a function sending a request through the active limiter if any."""
+    limiter = Limiter.current
+    if limiter is None:
+        return func(*args, **kwargs)
+    return limiter.call(endpoint, func, *args, **kwargs)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_constant import MAX_FOLDED_SIZE, _constants, _is_number
 
 
 @register_class_accessor(ee.List, "geetools")
@@ -38,6 +39,10 @@ class ListAccessor:
 
                 l1.geetools.product(l2).getInfo()
         """
+        if (values := _constants(self._obj, other)) and _all(str, *values):
+            if len(values[0]) * len(values[1]) <= MAX_FOLDED_SIZE:
+                return ee.List([e + f for e in values[0] for f in values[1]])
+
         l1 = ee.List(self._obj).map(lambda e: ee.String(e))
         l2 = ee.List(other).map(lambda e: ee.String(e))
         product = l1.map(
@@ -69,6 +74,10 @@ class ListAccessor:
 
                 l1.geetools.complement(l2).getInfo()
         """
+        if (values := _constants(self._obj, other)) and _all((str, int, float), *values):
+            (v1, s1), (v2, s2) = [(v, set(v)) for v in values]
+            return ee.List([e for e in v1 if e not in s2] + [e for e in v2 if e not in s1])
+
         l1, l2 = ee.List(self._obj), ee.List(other)
         return l1.removeAll(l2).cat(l2.removeAll(l1))
 
@@ -96,6 +105,10 @@ class ListAccessor:
 
                 l1.geetools.intersection(l2).getInfo()
         """
+        if (values := _constants(self._obj, other)) and _all((str, int, float), *values):
+            other_set = set(values[1])
+            return ee.List([e for e in values[0] if e in other_set])
+
         l1, l2 = ee.List(self._obj), ee.List(other)
         return l1.removeAll(l1.removeAll(l2))
 
@@ -123,6 +136,9 @@ class ListAccessor:
 
                 l1.geetools.union(l2).getInfo()
         """
+        if (values := _constants(self._obj, other)) and _all((str, int, float), *values):
+            return ee.List(list(dict.fromkeys(values[0] + values[1])))
+
         l1, l2 = ee.List(self._obj), ee.List(other)
         return l1.cat(l2).distinct()
 
@@ -180,6 +196,13 @@ class ListAccessor:
                 l = ee.List.geetools.sequence(0, 11, 2)
                 l.getInfo()
         """
+        if (values := _constants(ini, end, step)) and all(_is_number(v) for v in values):
+            ini, end, step = values[0], values[1], max(int(values[2]), 1)
+            count = int((end - ini) // step) + 1 if end >= ini else 0
+            if count < MAX_FOLDED_SIZE:
+                seq = [ini + i * step for i in range(count)]
+                return ee.List(seq if seq and seq[-1] == end else [*seq, end])
+
         ini, end = ee.Number(ini), ee.Number(end)
         step = ee.Number(step).toInt().max(1)
         return ee.List.sequence(ini, end, step).add(end.toFloat()).distinct()
@@ -285,5 +308,21 @@ class ListAccessor:
                 l = l.geetools.zip()
                 l.getInfo()
         """
+        values = _constants(self._obj)
+        if values and values[0] and _all(list, values[0]):
+            if (
+                len({len(v) for v in values[0]}) == 1
+                and sum(map(len, values[0])) <= MAX_FOLDED_SIZE
+            ):
+                return ee.List([list(e) for e in zip(*values[0])])
+
         indices = ee.List.sequence(0, ee.List(self._obj.get(0)).size().subtract(1))
         return indices.map(lambda i: self._obj.map(lambda j: ee.List(j).get(i)))
+
+
+def _all(types: type | tuple, *lists: list) -> bool:
+    """Check if all the items of constant lists are instances of ``types`` (booleans excluded)."""
+    return all(
+        isinstance(lst, list) and all(isinstance(e, types) and not isinstance(e, bool) for e in lst)
+        for lst in lists
+    )
@@ -1,13 +1,28 @@
 """A profiler context manager for Earth Engine Python API."""
 from __future__ import annotations
 
-import io
+import contextlib
+import functools
+import json
+import os
 import re
+import threading
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import ee
 from anyascii import anyascii
 
 from .accessors import _register_extention
+from .ee_limiter import _limited
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PROFILE_RETRIES = 5
+"The number of attempts to fetch a profile from the server."
 
 
 @_register_extention(ee.geetools)
@@ -26,37 +41,143 @@ class Profiler:
                 ee.Number(3.14).add(0.00159).getInfo()
                 res = p.profile
             res
-    """
 
-    _output_capture: io.StringIO | None = None
-    "The output of the profiler."
+        The results can also be explored as a :py:class:`pandas.DataFrame`:
+
+        .. jupyter-execute::
+
+            p.top(3, by="EECU-s")
 
-    _profile_context: ee.profilePrinting | None = None
-    "The raw profile context."
+        The Earth Engine profiling hook only covers the thread that opened the context. To profile
+        evaluations run concurrently, wrap each of them in :py:meth:`record <geetools.ee_profiler.Profiler.record>`
+        (or use :py:meth:`getInfo <geetools.ee_profiler.Profiler.getInfo>`) with a label. Every evaluation is
+        recorded with its label and thread and the profiles can be explored per label:
+
+        .. code-block:: python
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            numbers = {f"number_{i}": ee.Number(i).add(1) for i in range(4)}
+            with ee.geetools.Profiler() as p:
+                with ThreadPoolExecutor(4) as executor:
+                    list(executor.map(p.getInfo, numbers.values(), numbers.keys()))
+
+            p.byLabel()
+    """
 
     profile: dict | None = None
-    "The profile data as a dictionary."
+    "The profile data of all the recorded evaluations as a dictionary."
+
+    calls: list[dict]
+    "The recorded evaluations with their ``label``, ``thread`` and profile ``id``."
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.calls = []
+        self._lock = threading.Lock()
+        self._recording: contextlib.AbstractContextManager | None = None
 
     def __enter__(self):
         """Enter the context manager."""
-        self._output_capture = io.StringIO()
-        self._profile_context = ee.profilePrinting(destination=self._output_capture)
-        self._profile_context.__enter__()
+        self._recording = self.record()
+        self._recording.__enter__()
         return self
 
     def __exit__(self, *args):
         """Exit the context manager."""
-        self._profile_context.__exit__(*args)
-
-        # Check if there's anything captured
-        profile_output = self._output_capture.getvalue()
-        if profile_output:
-            self.profile = self._to_dict(profile_output)
-        else:
-            self.profile = None  # Handle the case where no output is captured
+        self._recording.__exit__(*args)
+        self.profile = self._fetch([c["id"] for c in self.calls])
+        if self.profile is None:
             print("Warning: No profile output was captured.")
 
-        self._output_capture.close()
+    @contextlib.contextmanager
+    def record(self, label: str = "") -> Iterator[None]:
+        """Record the profile of the evaluations made in the current thread under a label.
+
+        It can be used in any thread, including the ones of a pool running concurrently with the thread
+        that opened the profiler. The profiles of all the recorded evaluations are fetched from the server
+        when the profiler is closed.
+
+        .. note::
+
+            An evaluation waiting for an identical request already in flight in another thread (see
+            :py:func:`cached_getInfo <geetools.ee_cache.cached_getInfo>`) sends no request of its own,
+            its cost is only recorded under the label of the thread that sent the request.
+            :py:meth:`getInfo <geetools.ee_profiler.Profiler.getInfo>` always sends its own request.
+
+        Parameters:
+            label: The label of the evaluations.
+
+        Examples:
+            .. code-block:: python
+
+                from concurrent.futures import ThreadPoolExecutor
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                def evaluate(i):
+                    with p.record(f"number_{i}"):
+                        return ee.Number(i).add(1).getInfo()
+
+                with ee.geetools.Profiler() as p:
+                    with ThreadPoolExecutor(4) as executor:
+                        list(executor.map(evaluate, range(4)))
+        """
+        thread = threading.current_thread().name
+
+        def hook(profile_id: str):
+            with self._lock:
+                self.calls.append({"label": label, "thread": thread, "id": profile_id})
+
+        with ee.data.profiling(hook):
+            yield
+
+    def getInfo(self, obj: ee.ComputedObject, label: str = "") -> Any:
+        """Evaluate an object and record its profile under a label.
+
+        Parameters:
+            obj: The object to evaluate.
+            label: The label of the evaluation.
+
+        Returns:
+            The value of the object.
+        """
+        with self.record(label):
+            return _limited("computeValue", obj.getInfo)
+
+    def byLabel(self) -> pd.DataFrame:
+        """Return the profile of each label as a single :py:class:`pandas.DataFrame`.
+
+        The profiles of all the evaluations of a label are merged by the server and stacked with an extra ``Label`` column.
+
+        Returns:
+            The profile rows of every label as in :py:attr:`dataframe <geetools.ee_profiler.Profiler.dataframe>` with a ``Label`` column.
+        """
+        import pandas as pd
+
+        dfs = []
+        for label in dict.fromkeys(c["label"] for c in self.calls):
+            profile = self._fetch([c["id"] for c in self.calls if c["label"] == label])
+            if profile is not None:
+                dfs.append(_to_dataframe(profile).assign(Label=label))
+        if len(dfs) == 0:
+            raise ValueError("No profile was captured.")
+        return pd.concat(dfs, ignore_index=True)
+
+    def _fetch(self, ids: list[str]) -> dict | None:
+        """Fetch the merged profile of a list of profile ids from the server."""
+        # Profile.getProfiles is hidden from the API, it needs to be called explicitly
+        get_profiles = ee.ApiFunction.lookup("Profile.getProfiles").call
+        for attempt in range(PROFILE_RETRIES):
+            try:
+                output = _limited("computeValue", get_profiles(ids=ids).getInfo)
+                break
+            except ee.EEException:
+                if attempt == PROFILE_RETRIES - 1:
+                    raise
+        return self._to_dict(output) if output else None
 
     def _memory(self, mem_str: str) -> int:
         """Transform a memory string to an integer."""
@@ -84,21 +205,238 @@ class Profiler:
         # functions to process/format each header
         process = {
             "EECU-s": lambda eecus: float(eecus) if eecus != "-" else None,
-            "CurrMem": lambda mem: self._memory(mem),  # Mem is a string to convert
-            "PeakMem": lambda mem: self._memory(mem),  # Mem is a string to convert
-            "Count": lambda count: int(count),  # Count is an integer
-            "Description": lambda desc: " ".join(desc)
-            if isinstance(desc, list)
-            else desc,  # Description can have multiple words
+            "CurrMem": lambda mem: self._memory(mem) if mem != "-" else None,
+            "PeakMem": lambda mem: self._memory(mem) if mem != "-" else None,
+            "Count": lambda count: int(count) if count != "-" else None,
+            "Description": lambda desc: desc.strip(),
         }
 
         # Process each line of data after the header
         for line in lines[1:]:
             # Split the line by spaces, considering multiple spaces as a separator
-            # Handle missing values denoted by "-"
-            parts = line.split()
+            # only the first columns are split so that multi-words descriptions are kept whole
+            parts = line.split(maxsplit=len(headers) - 1)
+            if len(parts) == 0:
+                continue
+            parts += [""] * (len(headers) - len(parts))
             part_result = dict(zip(headers, parts))
             # Populate the dictionary with values for each column
             for head in headers:
-                result[head].append(process[head](part_result[head]))
+                result[head].append(process.get(head, str)(part_result[head]))
         return result
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """The profile data as a typed :py:class:`pandas.DataFrame`.
+
+        Memory columns are given in bytes and an extra ``Algorithm`` column extracts the name
+        of the algorithm (or the step) from the description so that rows can be grouped.
+        """
+        if self.profile is None:
+            raise ValueError("No profile was captured.")
+        return _to_dataframe(self.profile)
+
+    def top(self, n: int = 10, by: str = "EECU-s") -> pd.DataFrame:
+        """Return the most expensive operations of the profile.
+
+        Parameters:
+            n: The number of operations to return.
+            by: The column used to rank the operations. Either ``"EECU-s"`` or ``"PeakMem"``.
+
+        Returns:
+            The ``n`` first rows of the profile sorted by the ``by`` column.
+        """
+        if by not in ["EECU-s", "PeakMem"]:
+            raise ValueError(f"Cannot rank the profile by {by}, use 'EECU-s' or 'PeakMem'.")
+        return self.dataframe.sort_values(by, ascending=False).head(n)
+
+    def byAlgorithm(self) -> pd.DataFrame:
+        """Aggregate the profile by algorithm name.
+
+        Returns:
+            A DataFrame indexed by algorithm with the total EECU seconds, the maximum peak memory and the total count sorted by EECU seconds.
+        """
+        return _by_algorithm(self.dataframe)
+
+    @staticmethod
+    def diff(a: Profiler | pd.DataFrame, b: Profiler | pd.DataFrame) -> pd.DataFrame:
+        """Compare 2 profiles and show which operations got more expensive.
+
+        Operations are matched by description. An operation missing from one of the profiles is considered to have cost 0.
+
+        Parameters:
+            a: The reference profile.
+            b: The new profile.
+
+        Returns:
+            A DataFrame indexed by description with the ``EECU-s``, ``PeakMem`` and ``Count`` of both profiles (suffixed by ``_a`` and ``_b``) and the ``EECU-s_diff`` and ``PeakMem_diff`` columns, sorted by decreasing ``EECU-s_diff``.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                with ee.geetools.Profiler() as a:
+                    ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM").reduceRegion("mean", scale=100).getInfo()
+
+                with ee.geetools.Profiler() as b:
+                    ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM").reduceRegion("mean", scale=10).getInfo()
+
+                ee.geetools.Profiler.diff(a, b).head()
+        """
+        dfs = [p.dataframe if isinstance(p, Profiler) else p for p in [a, b]]
+        aggregations = {"EECU-s": "sum", "PeakMem": "max", "Count": "sum"}
+        dfs = [df.groupby("Description").agg(aggregations) for df in dfs]
+        result = dfs[0].join(dfs[1], how="outer", lsuffix="_a", rsuffix="_b").fillna(0)
+        for col in ["EECU-s", "PeakMem"]:
+            result[f"{col}_diff"] = result[f"{col}_b"] - result[f"{col}_a"]
+        return result.sort_values("EECU-s_diff", ascending=False)
+
+
+DEFAULT_HISTORY = Path("geetools_profile.jsonl")
+"The default file where the profile history is saved."
+
+
+@_register_extention(ee.geetools)
+def profile(
+    name: str = "",
+    history: os.PathLike = DEFAULT_HISTORY,
+    threshold: float | None = None,
+    window: int = 10,
+) -> Callable:
+    """Decorator profiling every call of a function and saving it in a history file.
+
+    Each call of the decorated function is run within a :py:class:`Profiler <geetools.ee_profiler.Profiler>`.
+    The captured profile is appended as one json line to the ``history`` file with the name of the run,
+    its timestamp, its total EECU seconds, its peak memory and the full profile.
+
+    Parameters:
+        name: The name of the run in the history. Default to the qualified name of the function.
+        history: The path to the jsonl history file. Default to ``geetools_profile.jsonl`` in the current directory.
+        threshold: If set, a :py:class:`UserWarning` is raised when the EECU cost of the run is more than ``threshold`` (e.g. ``0.2`` for 20%) above the rolling median of the previous runs.
+        window: The number of previous runs used to compute the rolling median.
+
+    Returns:
+        The decorated function.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            @ee.geetools.profile(name="mean_ndvi", history="profile.jsonl", threshold=0.2)
+            def mean_ndvi():
+                image = ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM")
+                return image.normalizedDifference(["B8", "B4"]).reduceRegion("mean", scale=100).getInfo()
+
+            mean_ndvi()
+            ee.geetools.compare_to_history("mean_ndvi", "profile.jsonl")
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            import pandas as pd
+
+            with Profiler() as p:
+                result = func(*args, **kwargs)
+
+            run_name = name or func.__qualname__
+            df = _to_dataframe(p.profile) if p.profile is not None else None
+            record = {
+                "name": run_name,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "eecu": float(df["EECU-s"].sum()) if df is not None else 0.0,
+                "peak_mem": 0 if df is None or pd.isna(peak := df["PeakMem"].max()) else int(peak),
+                "profile": p.profile,
+            }
+            with Path(history).open("a") as f:
+                f.write(json.dumps(record) + "\n")
+
+            if threshold is not None:
+                runs = compare_to_history(run_name, history, threshold, window)
+                if bool(runs["regression"].iloc[-1]):
+                    ratio = runs["ratio"].iloc[-1]
+                    msg = f"The EECU cost of {run_name} is {ratio:.0%} of its rolling median."
+                    warnings.warn(msg, UserWarning, stacklevel=2)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@_register_extention(ee.geetools)
+def compare_to_history(
+    name: str,
+    history: os.PathLike = DEFAULT_HISTORY,
+    threshold: float = 0.2,
+    window: int = 10,
+    metric: str = "eecu",
+) -> pd.DataFrame:
+    """Compare each run saved in a profile history to the rolling median of the previous ones.
+
+    Parameters:
+        name: The name of the runs to compare.
+        history: The path to the jsonl history file written by :py:func:`profile <geetools.ee_profiler.profile>`.
+        threshold: The relative increase above the rolling median (e.g. ``0.2`` for 20%) from which a run is flagged as a regression.
+        window: The number of previous runs used to compute the rolling median.
+        metric: The metric to compare, either ``"eecu"`` or ``"peak_mem"``.
+
+    Returns:
+        A DataFrame with one row per run with the ``timestamp``, the ``metric`` value, the rolling ``median`` of the previous runs, the ``ratio`` between them and a boolean ``regression`` column.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            runs = ee.geetools.compare_to_history("mean_ndvi", "profile.jsonl")
+            runs[runs.regression]
+    """
+    import pandas as pd
+
+    if metric not in ["eecu", "peak_mem"]:
+        raise ValueError(f"Cannot compare the runs on {metric}, use 'eecu' or 'peak_mem'.")
+
+    lines = Path(history).read_text().splitlines()
+    records = [r for r in (json.loads(line) for line in lines if line) if r["name"] == name]
+    df = pd.DataFrame(records, columns=["timestamp", metric])
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df["median"] = df[metric].shift(1).rolling(window, min_periods=1).median()
+    df["ratio"] = df[metric] / df["median"]
+    df["regression"] = df[metric] > df["median"] * (1 + threshold)
+    return df
+
+
+def _to_dataframe(profile: dict) -> pd.DataFrame:
+    """Transform a profile dictionary into a typed DataFrame."""
+    import pandas as pd
+
+    df = pd.DataFrame(profile)
+    types = {"EECU-s": "Float64", "CurrMem": "Int64", "PeakMem": "Int64", "Count": "Int64"}
+    df = df.astype({k: v for k, v in types.items() if k in df.columns})
+    df["Description"] = df["Description"].astype("string")
+    df["Algorithm"] = df["Description"].map(_algorithm_name).astype("string")
+    return df
+
+
+def _algorithm_name(description: str) -> str:
+    """Extract the algorithm (or step) name of a profile description.
+
+    ``"Algorithm Image.load"`` becomes ``"Image.load"`` and ``"Loading assets: foo"`` becomes ``"Loading assets"``.
+    """
+    if description.startswith("Algorithm "):
+        return description.split()[1]
+    return description.split(":")[0].strip()
+
+
+def _by_algorithm(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate a profile DataFrame by algorithm."""
+    aggregations = {"EECU-s": "sum", "PeakMem": "max", "Count": "sum"}
+    return df.groupby("Algorithm").agg(aggregations).sort_values("EECU-s", ascending=False)
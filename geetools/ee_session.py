@@ -0,0 +1,249 @@
+"""Spread the requests sent to the Earth Engine servers over several accounts and projects."""
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+
+import ee
+
+from .accessors import _register_extention
+from .ee_cache import cached_getInfo
+from .ee_initialize import _service_account_credentials, _user_credentials
+from .ee_transport import _http
+
+STRATEGIES = ["round_robin", "least_load"]
+"The strategies available to pick the session of a request."
+
+_session: contextvars.ContextVar[Session | None] = contextvars.ContextVar(
+    "geetools_session", default=None
+)
+"The session used by the requests of the current thread or task."
+
+
+class Session:
+    """An Earth Engine session bound to its own credentials and project.
+
+    The session holds its own copy of the state of the Earth Engine API so it can be used
+    at the same time as the default session (the one set by :py:func:`ee.Initialize`) and
+    the other sessions of the process. Sessions are created by :py:class:`SessionPool`.
+
+    Parameters:
+        name: The name of the session in the pool.
+        credentials: The credentials of the account.
+        project: The project used (and billed) by the requests of the session.
+    """
+
+    def __init__(self, name: str, credentials: Any, project: str):
+        """Initialize the Earth Engine API in a dedicated state."""
+        self.name, self.project = name, project
+        self.load = 0
+        self.state = _new_state()
+        with self.activate():
+            ee.Initialize(credentials, project=project, http_transport=_http())
+
+    def __repr__(self) -> str:
+        """Return the name and project of the session."""
+        return f"Session(name={self.name!r}, project={self.project!r})"
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Session]:
+        """Send the requests of the current thread or task through this session within the context."""
+        token = _session.set(self)
+        try:
+            yield self
+        finally:
+            _session.reset(token)
+
+
+@_register_extention(ee.geetools)
+class SessionPool:
+    """A pool of Earth Engine sessions to spread the workloads over the quotas of several projects.
+
+    Each saved user or service account added to the pool is initialized in its own session, with its
+    own credentials and project. The requests sent within :py:meth:`session` go through one of them,
+    picked in turn (``"round_robin"``) or as the one with the fewest requests in flight
+    (``"least_load"``). The scope is bound to the current thread (or asyncio task) so several
+    threads can use different sessions at the same time while the rest of the process keeps using
+    the default session.
+
+    .. note::
+
+        The operations started in a session (e.g. export tasks) belong to its project: their status
+        must be requested within the same session.
+
+    Parameters:
+        strategy: The strategy used to pick the session of a request. One of ``"round_robin"`` or
+            ``"least_load"``. Default to ``"round_robin"``.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            pool = (
+                ee.geetools.SessionPool(strategy="least_load")
+                .add_user("alice", project="project-a")
+                .add_user("bob", project="project-b")
+            )
+
+            areas = pool.map([ee.Geometry.Point([i, 0]).buffer(1000).area() for i in range(100)])
+
+            with pool.session("alice"):
+                print(ee.Initialize.geetools.project_id())
+    """
+
+    def __init__(self, strategy: str = "round_robin"):
+        """Create an empty pool."""
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of: {','.join(STRATEGIES)}")
+        self.strategy = strategy
+        self.sessions: dict[str, Session] = {}
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    def add_user(
+        self,
+        name: str = "",
+        credential_pathname: str = "",
+        project: str = "",
+        cache_token: bool = False,
+    ) -> SessionPool:
+        """Add a session using the credentials of a saved user.
+
+        The user needs to be saved first with :py:meth:`ee.Authenticate.geetools.new_user <geetools.ee_authenticate.AuthenticateAccessor.new_user>`.
+
+        Parameters:
+            name: The name of the user as saved when created. use default if not set.
+            credential_pathname: The path to the folder where the credentials are stored. If not set, it uses the default path.
+            project: The project_id to use. If not set, it uses the default project_id of the saved credentials.
+            cache_token: Share the access token with the other processes of the machine using this user. Default to ``False``.
+
+        Returns:
+            The pool itself.
+        """
+        credentials, tokens = _user_credentials(name, credential_pathname, cache_token)
+        return self._add(name or "default", credentials, project or tokens["project_id"])
+
+    def add_service_account(self, private_key: str, project: str = "") -> SessionPool:
+        """Add a session using the credentials of a service account.
+
+        Parameters:
+            private_key: The private key of the service account in json format.
+            project: The project_id to use. If not set, it uses the project_id of the service account.
+
+        Returns:
+            The pool itself.
+        """
+        credentials, project_id = _service_account_credentials(private_key)
+        name = credentials.service_account_email
+        project = project or project_id
+        return self._add(f"{name}:{project}", credentials, project)
+
+    @contextlib.contextmanager
+    def session(self, name: str = "") -> Iterator[Session]:
+        """Send the requests of the current thread or task through a session of the pool within the context.
+
+        Parameters:
+            name: The name of the session to use. If not set, the session is picked by the strategy of the pool.
+
+        Yields:
+            The session used within the context.
+        """
+        with self._lock:
+            if not self.sessions:
+                raise ValueError("The pool is empty, add a user or a service account first.")
+            if name and name not in self.sessions:
+                raise ValueError(f"No session named {name} in the pool: {','.join(self.sessions)}")
+            session = self.sessions[name] if name else self._pick()
+            session.load += 1
+        try:
+            with session.activate():
+                yield session
+        finally:
+            with self._lock:
+                session.load -= 1
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function within the next session of the pool.
+
+        Parameters:
+            func: The function to call.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            The output of the function.
+        """
+        with self.session():
+            return func(*args, **kwargs)
+
+    def map(self, objs: list, max_workers: int = 8) -> list:
+        """Evaluate many objects in parallel, spreading the requests over the sessions of the pool.
+
+        Parameters:
+            objs: The objects to evaluate.
+            max_workers: The maximum number of requests sent at the same time. Default to 8.
+
+        Returns:
+            The values of the objects in the same order.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda o: self.call(cached_getInfo, o), objs))
+
+    def start(self, tasks: list[ee.batch.Task]) -> list[str]:
+        """Start export tasks, spreading them over the sessions of the pool.
+
+        Parameters:
+            tasks: The tasks to start.
+
+        Returns:
+            The name of the session that started each task, the status of a task must be requested
+            within this session.
+        """
+        names = []
+        for task in tasks:
+            with self.session() as session:
+                task.start()
+            names.append(session.name)
+        return names
+
+    def _add(self, name: str, credentials: Any, project: str) -> SessionPool:
+        """Initialize a new session and add it to the pool."""
+        session = Session(name, credentials, project)
+        with self._lock:
+            self.sessions[name] = session
+        return self
+
+    def _pick(self) -> Session:
+        """Pick the session of the next request according to the strategy of the pool."""
+        sessions = list(self.sessions.values())
+        turn = next(self._turn) % len(sessions)
+        if self.strategy == "round_robin":
+            return sessions[turn]
+        # start from the next session in turn so that idle sessions are used evenly
+        return min(sessions[turn:] + sessions[:turn], key=lambda s: s.load)
+
+
+def _new_state() -> Any:
+    """Create a new state of the Earth Engine API and make it follow the active session."""
+    try:
+        from ee import _state
+    except ImportError:
+        msg = "Sessions require a version of earthengine-api storing its state in ee._state."
+        raise RuntimeError(msg) from None
+
+    if not getattr(_state.get_state, "_geetools", False):
+        get_default_state = _state.get_state
+
+        def get_state() -> _state.EEState:
+            session = _session.get()
+            return session.state if session is not None else get_default_state()
+
+        get_state._geetools = True  # type: ignore[attr-defined]
+        _state.get_state = get_state
+
+    return _state.EEState()
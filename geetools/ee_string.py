@@ -1,9 +1,13 @@
 """Extra methods for the :py:class:`ee.String` class."""
 from __future__ import annotations
 
+import re
+from typing import Any
+
 import ee
 
 from .accessors import register_class_accessor
+from .ee_constant import _constants
 
 
 @register_class_accessor(ee.String, "geetools")
@@ -59,6 +63,12 @@ class StringAccessor:
                 s = s.geetools.format({"greeting": "Hello", "name": "bob"})
                 s.getInfo()
         """
+        if (values := _constants(self._obj, template)) and _is_literal_template(*values):
+            string, template = values
+            for key in sorted(template):
+                string = string.replace("{" + key + "}", template[key], 1)
+            return ee.String(string)
+
         template = ee.Dictionary(template)
         templateList = template.keys().zip(template.values())
 
@@ -69,3 +79,17 @@ class StringAccessor:
             return ee.String(s).replace(pattern, value)
 
         return ee.String(templateList.iterate(replace_format, self._obj))
+
+
+def _is_literal_template(string: Any, template: Any) -> bool:
+    """Check if a constant string can be formatted client-side like the servers would do it.
+
+    The servers replace the first match of each ``{key}`` regex in the order of the sorted keys, the
+    result is the same as a plain replacement as long as the keys and values have no special characters.
+    """
+    return (
+        isinstance(string, str)
+        and isinstance(template, dict)
+        and all(re.fullmatch(r"[A-Za-z0-9_]+", k) for k in template)
+        and all(isinstance(v, str) and not re.search(r"[$\\]", v) for v in template.values())
+    )
@@ -0,0 +1,231 @@
+"""A client-side tracer of the server calls made through the Earth Engine Python API."""
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import ee
+import ee.data
+import requests
+
+from .accessors import _register_extention
+from .ee_transport import Transport
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TRACED_ENDPOINTS = [
+    "computeValue",
+    "computeFeatures",
+    "computeImages",
+    "computePixels",
+    "getAsset",
+    "getInfo",
+    "getList",
+    "listAssets",
+    "listImages",
+    "listFeatures",
+    "createAsset",
+    "createFolder",
+    "copyAsset",
+    "renameAsset",
+    "deleteAsset",
+    "updateAsset",
+    "startProcessing",
+    "exportImage",
+    "exportTable",
+    "exportMap",
+    "exportVideo",
+    "getOperation",
+    "listOperations",
+    "cancelOperation",
+    "getMapId",
+    "getDownloadId",
+    "getThumbId",
+    "getTableDownloadId",
+]
+"The :py:mod:`ee.data` functions wrapped by the tracer when available in the installed API version."
+
+_PACKAGE = Path(__file__).parent
+"The folder of the geetools package, used to find the calling geetools method."
+
+_local = threading.local()
+"Thread local storage used to only record the outermost traced call."
+
+
+@_register_extention(ee.geetools)
+class Tracer:
+    """A tracer context manager recording every server call made within its scope.
+
+    The tracer wraps the :py:mod:`ee.data` entry points (listed in :py:data:`TRACED_ENDPOINTS <geetools.ee_tracer.TRACED_ENDPOINTS>`)
+    and the HTTP requests made with ``requests``. For each call it records the endpoint, the latency,
+    the size of the payload sent and received and the geetools method that triggered it.
+
+    Examples:
+        .. jupyter-execute::
+
+            import ee, geetools
+            from geetools.utils import initialize_documentation
+
+            initialize_documentation()
+
+            with ee.geetools.Tracer() as t:
+                ee.Number(3.14).add(0.00159).getInfo()
+                ee.Asset("projects/google/charts_feature_example").exists()
+
+            t.summary()
+    """
+
+    calls: list[dict]
+    "The list of the recorded calls."
+
+    def __init__(self):
+        """Initialize the tracer."""
+        self.calls = []
+        self._originals: dict = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Enter the context manager and wrap the endpoints."""
+        for name in TRACED_ENDPOINTS:
+            if hasattr(ee.data, name):
+                self._patch(ee.data, name, name)
+        self._patch(requests, "get", "requests.get")
+        self._patch(requests, "post", "requests.post")
+        self._patch(Transport, "get", "requests.get")
+        return self
+
+    def __exit__(self, *args):
+        """Exit the context manager and restore the original endpoints."""
+        for (module, name), func in self._originals.items():
+            setattr(module, name, func)
+        self._originals = {}
+
+    def _patch(self, module: object, name: str, endpoint: str):
+        """Replace a function of a module by its traced version."""
+        func = getattr(module, name)
+        self._originals[(module, name)] = func
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            # only record the outermost call to avoid counting aliases twice (e.g. getInfo -> getAsset)
+            if getattr(_local, "active", False):
+                return func(*args, **kwargs)
+            _local.active = True
+            start, error, result = time.perf_counter(), None, None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                latency = time.perf_counter() - start
+                _local.active = False
+                record = {
+                    "endpoint": endpoint,
+                    "caller": _caller(),
+                    "thread": threading.current_thread().name,
+                    "latency": latency,
+                    "sent": _size(args, kwargs),
+                    "received": _size(result) if error is None else 0,
+                    "error": error,
+                }
+                with self._lock:
+                    self.calls.append(record)
+
+        setattr(module, name, traced)
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """The recorded calls as a :py:class:`pandas.DataFrame` with one row per call."""
+        import pandas as pd
+
+        columns = ["endpoint", "caller", "thread", "latency", "sent", "received", "error"]
+        return pd.DataFrame(self.calls, columns=columns)
+
+    def summary(self) -> pd.DataFrame:
+        """Aggregate the recorded calls by calling method and endpoint.
+
+        Returns:
+            A DataFrame indexed by caller and endpoint with the number of calls, the total and mean latency in seconds and the total bytes sent and received, sorted by total latency.
+        """
+        return (
+            self.dataframe.groupby(["caller", "endpoint"])
+            .agg(
+                count=("latency", "size"),
+                latency=("latency", "sum"),
+                mean_latency=("latency", "mean"),
+                sent=("sent", "sum"),
+                received=("received", "sum"),
+            )
+            .sort_values("latency", ascending=False)
+        )
+
+    def flame(self, width: int = 40) -> str:
+        """Return a flame-style text summary of where the wall time is spent.
+
+        Each calling method is displayed with its total latency and below it the endpoints it called.
+        The bars are proportional to the latency of the whole trace.
+
+        Parameters:
+            width: The width of the longest bar in characters.
+
+        Returns:
+            The summary as a multi-line string.
+        """
+        df = self.dataframe
+        total = df.latency.sum() or 1
+        by_caller = df.groupby("caller").latency.sum().sort_values(ascending=False)
+        lines = []
+        for caller, latency in by_caller.items():
+            bar = "█" * max(1, round(width * latency / total))
+            lines.append(f"{caller:<50} {latency:8.3f}s {bar}")
+            endpoints = df[df.caller == caller].groupby("endpoint").latency.agg(["size", "sum"])
+            for endpoint, row in endpoints.sort_values("sum", ascending=False).iterrows():
+                bar = "▒" * max(1, round(width * row["sum"] / total))
+                name = f"  {endpoint} x{int(row['size'])}"
+                lines.append(f"{name:<50} {row['sum']:8.3f}s {bar}")
+        return "\n".join(lines)
+
+
+def _caller() -> str:
+    """Return the qualified name of the geetools method that triggered the current call.
+
+    If the call was not made from geetools, ``"<user>"`` is returned.
+    """
+    frames = inspect.stack(0)[2:]
+    geetools_frames = [f for f in frames if _PACKAGE in Path(f.filename).parents]
+    geetools_frames = [f for f in geetools_frames if Path(f.filename).name != "ee_tracer.py"]
+    if len(geetools_frames) == 0:
+        return "<user>"
+
+    # use the outermost geetools frame: the public method called by the user
+    frame = geetools_frames[-1].frame
+    name = frame.f_code.co_name
+    obj = frame.f_locals.get("self")
+    return f"{type(obj).__name__}.{name}" if obj is not None else name
+
+
+def _size(*objects) -> int:
+    """Return the size in bytes of the json representation of the objects."""
+    try:
+        if isinstance(objects[0], requests.Response):
+            return len(objects[0].content)
+        return len(json.dumps(objects, cls=_Encoder))
+    except Exception:
+        return 0
+
+
+class _Encoder(json.JSONEncoder):
+    """Json encoder that serializes the Earth Engine objects as they are sent to the server."""
+
+    def default(self, o):
+        if isinstance(o, ee.ComputedObject):
+            return ee.serializer.encode(o, for_cloud_api=True)
+        return str(o)
@@ -0,0 +1,191 @@
+"""A shared HTTP transport for the requests sent by geetools and the Earth Engine client."""
+from __future__ import annotations
+
+from typing import Any
+
+import ee
+import httplib2
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .accessors import _register_extention
+
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+"The HTTP status codes of the responses that are retried."
+
+
+@_register_extention(ee.geetools)
+class Transport:
+    """A shared, keep-alive and thread-safe HTTP transport.
+
+    All the HTTP requests sent by geetools (STAC catalog, spectral indices list...) and, once
+    initialized with :py:meth:`ee.Initialize.geetools.from_user <geetools.ee_initialize.InitializeAccessor.from_user>`
+    or :py:meth:`ee.Initialize.geetools.from_service_account <geetools.ee_initialize.InitializeAccessor.from_service_account>`,
+    the requests of the Earth Engine client go through the connections pool of the active transport.
+    The connections are kept alive between requests, saving a TLS handshake each time, and the failed
+    connections are retried with an exponential backoff. The GET requests of geetools are also retried
+    when the response has a ``429`` or ``5xx`` status (respecting the ``Retry-After`` header of the
+    servers). The requests of the Earth Engine client are not: most of them are POST requests that
+    cannot be safely sent twice (e.g. starting a task) and the client already retries the ones that can.
+
+    The transport is opt-in: call :py:meth:`enable` before initializing Earth Engine to use it, the
+    requests are otherwise sent by ``requests`` and the default transport of the Earth Engine client.
+
+    Parameters:
+        pool_size: The maximum number of connections kept alive for each host. Default to 32.
+        timeout: The timeout of the requests in seconds, either a single value or a
+            ``(connect, read)`` tuple. ``None`` waits forever. Default to ``(10, 300)``.
+        retries: The maximum number of retries of a request. Default to 5.
+        backoff: The backoff factor in seconds, the n-th retry waits ``backoff * 2 ** (n - 1)``. Default to 0.5.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.geetools.Transport(pool_size=64, retries=10).enable()
+            ee.Initialize.geetools.from_user("secondary")
+
+            areas = ee.geetools.Evaluator(max_workers=64).map(
+                [ee.Geometry.Point([i, 0]).buffer(1000).area() for i in range(1000)]
+            )
+    """
+
+    current: Transport | None = None
+    "The transport used by all the HTTP requests of geetools, if any."
+
+    def __init__(
+        self,
+        pool_size: int = 32,
+        timeout: float | tuple | None = (10, 300),
+        retries: int = 5,
+        backoff: float = 0.5,
+    ):
+        """Create the session and its pool of connections."""
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive number.")
+        self.pool_size, self.timeout = pool_size, timeout
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = _session(pool_size, retry)
+        # only the connections that failed before sending anything are retried for the client
+        retry = Retry(
+            total=retries, connect=retries, read=0, status=0, other=0, backoff_factor=backoff
+        )
+        self.client_session = _session(pool_size, retry)
+
+    def enable(self) -> Transport:
+        """Use this transport for the rest of the session.
+
+        The Earth Engine client keeps the transport it was initialized with, initialize it again to
+        use the new one.
+
+        Returns:
+            The transport itself.
+        """
+        Transport.current = self
+        return self
+
+    @staticmethod
+    def disable():
+        """Stop using the transport for the rest of the session.
+
+        The Earth Engine client keeps the transport it was initialized with, initialize it again to
+        use its default one.
+        """
+        Transport.current = None
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the pool of connections.
+
+        Parameters:
+            url: The url to request.
+            **kwargs: Extra keyword arguments of :py:meth:`requests.Session.get`.
+
+        Returns:
+            The response of the server.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def http(self) -> _Http:
+        """Return an ``httplib2`` like object to use as ``http_transport`` in :py:func:`ee.Initialize`.
+
+        Returns:
+            The transport of the Earth Engine client.
+        """
+        return _Http(self.client_session, self.timeout)
+
+    def close(self):
+        """Close all the connections of the pool."""
+        self.session.close()
+        self.client_session.close()
+
+
+class _Http:
+    """An ``httplib2.Http`` like object sending the requests through a shared session."""
+
+    def __init__(self, session: requests.Session, timeout: float | tuple | None):
+        self.session, self.timeout = session, timeout
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: dict | None = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> tuple[httplib2.Response, bytes]:
+        """Send a request with the ``httplib2`` semantic used by the Google API client."""
+        # the google API client only retries the builtin connection errors
+        try:
+            response = self.session.request(
+                method,
+                uri,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=redirections > 0,
+            )
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            raise ConnectionError(e) from e
+        except requests.Timeout as e:
+            raise TimeoutError(e) from e
+
+        # the content is already decoded by requests, its original encoding and length are irrelevant
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        response_headers.pop("content-encoding", None)
+        response_headers.pop("content-length", None)
+        info = httplib2.Response({**response_headers, "status": response.status_code})
+        if response.is_redirect or len(response.history) > redirections:
+            msg = "Redirected more times than redirection_limit allows."
+            raise httplib2.RedirectLimit(msg, info, response.content)
+        return info, response.content
+
+
+def _session(pool_size: int, retry: Retry) -> requests.Session:
+    """Create a session keeping alive up to ``pool_size`` connections for each host."""
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request through the active transport or a new connection if there is none."""
+    transport = Transport.current
+    return transport.get(url, **kwargs) if transport else requests.get(url, **kwargs)
+
+
+def _http() -> _Http | None:
+    """Return the ``http_transport`` of the Earth Engine client for the active transport if any."""
+    transport = Transport.current
+    return transport.http() if transport else None
@@ -4,14 +4,15 @@ from __future__ import annotations
 import os
 import re
 from datetime import datetime as dt
+from typing import TYPE_CHECKING
 
 import ee
-import httplib2
-import numpy as np
 from anyascii import anyascii
-from matplotlib import pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.colors import to_rgba
+
+from .ee_transport import _http
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 def format_description(description: str) -> str:
@@ -100,6 +101,10 @@ def plot_data(
         ax: The matplotlib axes to use. If not provided, the plot will be sent to a new figure.
         kwargs: Additional arguments from the ``pyplot`` chat type selected.
     """
+    import numpy as np
+    from matplotlib import pyplot as plt
+    from matplotlib.colors import to_rgba
+
     # define the ax if not provided by the user
     if ax is None:
         _, ax = plt.subplots()
@@ -259,7 +264,7 @@ def initialize_documentation():
         ee.Initialize.geetools.from_service_account(private_key)
 
     elif "EARTHENGINE_PROJECT" in os.environ:
-        ee.Initialize(project=os.environ["EARTHENGINE_PROJECT"], http_transport=httplib2.Http())
+        ee.Initialize(project=os.environ["EARTHENGINE_PROJECT"], http_transport=_http())
 
     else:
         raise ValueError(
@@ -2,6 +2,7 @@
 
 The nox run are build in isolated environment that will be stored in .nox. to force the venv update, remove the .nox/xxx folder.
 """
+from pathlib import Path
 
 import nox
 
@@ -73,3 +74,17 @@ def stubgen(session):
     session.install("mypy")
     package = session.posargs or ["geetools"]
     session.run("stubgen", "-p", package[0], "-o", "stubs", "--include-private")
+
+
+@nox.session(reuse_venv=True)
+def bench(session):
+    """Run the offline benchmarks and save the report in the ``.benchmarks`` folder."""
+    session.install(".")
+    output = session.posargs[0] if session.posargs else ".benchmarks/graph.json"
+    session.run(
+        "python", "-c", f"import pathlib; pathlib.Path('{output}').parent.mkdir(exist_ok=True)"
+    )
+    session.run("python", "-m", "benchmarks.graph", "--output", output)
+    workflows = str(Path(output).with_name("workflows.json"))
+    session.run("python", "-m", "benchmarks.workflows", "--output", workflows)
+    session.run("python", "-m", "benchmarks.import_time")
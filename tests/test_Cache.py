@@ -0,0 +1,132 @@
+"""Test the ee_cache module."""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+class TestCache:
+    """Test the Cache class."""
+
+    def test_store(self, tmp_path):
+        cache = ee.geetools.Cache(tmp_path)
+        number = ee.Number(3.14).add(0.00159)
+        assert cache.getInfo(number) == number.getInfo()
+        assert (tmp_path / f"{cache.key(number)}.json").exists()
+
+    def test_hit(self, tmp_path):
+        cache = ee.geetools.Cache(tmp_path)
+        number = ee.Number(1).add(1)
+        cache.getInfo(number)
+        file = tmp_path / f"{cache.key(number)}.json"
+        file.write_text(json.dumps({"created": time.time(), "value": "cached"}))
+        assert cache.getInfo(ee.Number(1).add(1)) == "cached"
+
+    def test_ttl(self, tmp_path):
+        cache = ee.geetools.Cache(tmp_path, ttl=60)
+        number = ee.Number(1).add(1)
+        file = tmp_path / f"{cache.key(number)}.json"
+        file.write_text(json.dumps({"created": time.time() - 120, "value": "expired"}))
+        assert cache.getInfo(number) == 2
+
+    def test_eviction(self, tmp_path):
+        cache = ee.geetools.Cache(tmp_path, max_size=100)
+        [cache.getInfo(ee.String("a" * 40).cat(str(i))) for i in range(3)]
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        assert cache.size <= 100
+
+    def test_project_key(self, tmp_path, monkeypatch):
+        cache = ee.geetools.Cache(tmp_path)
+        number = ee.Number(1).add(1)
+        key = cache.key(number)
+        monkeypatch.setattr(ee.data._get_state(), "cloud_api_user_project", "other-project")
+        assert cache.key(number) != key
+
+
+class TestCachedGetInfo:
+    """Test the cached_getInfo function."""
+
+    def test_without_cache(self, tmp_path):
+        assert ee.geetools.cached_getInfo(ee.Number(1).add(1)) == 2
+        assert ee.geetools.Cache.current is None
+
+    def test_context(self, tmp_path):
+        with ee.geetools.Cache(tmp_path) as cache:
+            assert ee.geetools.Cache.current is cache
+            ee.geetools.cached_getInfo(ee.Number(1).add(1))
+        assert ee.geetools.Cache.current is None
+        assert cache.size > 0
+
+
+class TestCoalescing:
+    """Test the coalescing of concurrent identical requests."""
+
+    def test_shared_request(self):
+        started, release, calls = threading.Event(), threading.Event(), []
+
+        class SlowNumber(ee.Number):
+            def getInfo(self):
+                calls.append(self)
+                started.set()
+                release.wait()
+                return super().getInfo()
+
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(ee.geetools.cached_getInfo, SlowNumber(ee.Number(1).add(1)))
+            started.wait()
+            second = executor.submit(ee.geetools.cached_getInfo, SlowNumber(ee.Number(1).add(1)))
+            time.sleep(0.1)
+            release.set()
+            assert first.result() == second.result() == 2
+        assert len(calls) == 1
+
+    def test_not_shared_between_projects(self):
+        started, release, calls = threading.Event(), threading.Event(), []
+
+        class SlowNumber(ee.Number):
+            def getInfo(self):
+                calls.append(self)
+                started.set()
+                release.wait()
+                return super().getInfo()
+
+        state = ee.data._get_state()
+        pool = ee.geetools.SessionPool()
+        pool._add("other", state.credentials, "other-project")
+
+        def evaluate_in_pool(obj):
+            with pool.session("other"):
+                return ee.geetools.cached_getInfo(obj)
+
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(ee.geetools.cached_getInfo, SlowNumber(ee.Number(1).add(3)))
+            started.wait()
+            second = executor.submit(evaluate_in_pool, SlowNumber(ee.Number(1).add(3)))
+            time.sleep(0.1)
+            release.set()
+            assert first.result() == second.result() == 4
+        assert len(calls) == 2
+
+    def test_shared_error(self):
+        started, release = threading.Event(), threading.Event()
+
+        class FailingNumber(ee.Number):
+            def getInfo(self):
+                started.set()
+                release.wait()
+                raise ee.EEException("failed")
+
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(ee.geetools.cached_getInfo, FailingNumber(ee.Number(1).add(2)))
+            started.wait()
+            second = executor.submit(ee.geetools.cached_getInfo, FailingNumber(ee.Number(1).add(2)))
+            time.sleep(0.1)
+            release.set()
+            for future in [first, second]:
+                with pytest.raises(ee.EEException):
+                    future.result()
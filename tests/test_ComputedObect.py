@@ -1,5 +1,7 @@
 """Test the ComputedObject class methods."""
 
+import zipfile
+
 import ee
 import pytest
 
@@ -50,3 +52,62 @@ class TestOpen:
     def test_open_not_correct_suffix(self):
         with pytest.raises(ValueError):
             ee.Number.open("file.toto")
+
+
+class TestSaveMany:
+    """Test the ``save_many`` method."""
+
+    def test_save_many(self, tmp_path):
+        objs = {"number": ee.Number(1.1), "string": ee.String("a").cat("b")}
+        file = ee.ComputedObject.save_many(objs, tmp_path / "test.geez")
+        assert file.exists()
+        assert sorted(zipfile.ZipFile(file).namelist()) == ["number.json", "string.json"]
+
+    def test_save_many_error(self, tmp_path):
+        with pytest.raises(ee.EEException):
+            ee.ComputedObject.save_many({"wrong": object()}, tmp_path / "test.geez")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestOpenMany:
+    """Test the ``open_many`` method."""
+
+    def test_open_many(self, tmp_path):
+        objs = {"number": ee.Number(1.1), "string": ee.String("a").cat("b")}
+        file = ee.ComputedObject.save_many(objs, tmp_path / "a")
+        with ee.ComputedObject.open_many(file) as archive:
+            assert list(archive) == ["number", "string"]
+            assert ee.serializer.encode(archive["string"]) == ee.serializer.encode(objs["string"])
+
+    def test_open_many_missing(self, tmp_path):
+        file = ee.ComputedObject.save_many({}, tmp_path / "a")
+        with ee.ComputedObject.open_many(file) as archive, pytest.raises(KeyError):
+            archive["missing"]
+
+    def test_open_many_not_correct_suffix(self):
+        with pytest.raises(ValueError):
+            ee.ComputedObject.open_many("file.gee")
+
+
+class TestGraphStats:
+    """Test the ``geetools_graph_stats`` method."""
+
+    def test_graph_stats(self):
+        n = ee.Number(1).add(2)
+        stats = n.add(n).multiply(ee.List([1, 2, 3]).size()).geetools_graph_stats()
+        assert stats["nodes"] == 10
+        assert stats["distinct_nodes"] == 7
+        assert stats["depth"] == 4
+        assert stats["bytes"] > 0
+
+    def test_graph_stats_function(self):
+        stats = ee.List([1, 2]).map(lambda v: ee.Number(v).add(1)).geetools_graph_stats()
+        assert stats["nodes"] == 7
+        assert stats["depth"] == 4
+
+    def test_graph_stats_warning(self):
+        n = ee.Number(1)
+        for _ in range(20):
+            n = n.add(n)
+        with pytest.warns(UserWarning):
+            n.geetools_graph_stats(max_nodes=1000)
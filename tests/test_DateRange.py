@@ -29,3 +29,33 @@ class TestCheckUnit:
     def test_check_unit(self):
         with pytest.raises(ValueError):
             ee.DateRange.geetools.check_unit("toto")
+
+
+class TestConstantFolding:
+    """Test that the constant inputs are computed client-side like the server would."""
+
+    @pytest.mark.parametrize(
+        "start, end, interval, unit",
+        [
+            ("2020-01-01", "2020-01-31", 1, "day"),
+            ("2020-01-01", "2020-03-01T12:00", 1, "month"),
+            ("2020-01-01T00:00:00", "2020-01-01T05:30:00", 2, "hour"),
+            (0, 86400000, 7, "day"),
+        ],
+    )
+    def test_split(self, start, end, interval, unit):
+        folded = ee.DateRange(start, end).geetools.split(interval, unit)
+        computed = ee.DateRange(ee.Date(start).advance(0, "day"), end).geetools.split(
+            interval, unit
+        )
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    def test_split_size_cap(self):
+        split = ee.DateRange("2000-01-01", "2020-01-01").geetools.split(1, "hour")
+        assert split.func is not None
+        assert len(ee.serializer.toJSON(split)) < 10_000
+
+    def test_split_with_time_zone(self):
+        split = ee.DateRange("2020-01-01", "2020-01-31", "Europe/Paris").geetools.split(1, "day")
+        assert split.func is not None
@@ -1,5 +1,6 @@
 """Test the Dictionary class methods."""
 import ee
+import pytest
 
 
 class TestFromPairs:
@@ -28,3 +29,25 @@ class TestGetMany:
     def test_getMany(self):
         d = ee.Dictionary({"foo": 1, "bar": 2}).geetools.getMany(["foo"])
         assert d.getInfo() == [1]
+
+
+class TestConstantFolding:
+    """Test that the constant inputs are computed client-side like the server would."""
+
+    @pytest.mark.parametrize(
+        "pairs", [[["foo", 1], ["bar", [2, 3]]], [], [["b", "x"], ["a", None]]]
+    )
+    def test_from_pairs(self, pairs):
+        folded = ee.Dictionary.geetools.fromPairs(pairs)
+        computed = ee.Dictionary.geetools.fromPairs(ee.List(pairs).slice(0))
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    @pytest.mark.parametrize(
+        "d", [{"foo": 1, "bar": 2, "Baz": 3}, {}, {"b": {"d": 1, "c": 2}, "a": 0}]
+    )
+    def test_sort(self, d):
+        folded = ee.Dictionary(d).geetools.sort()
+        computed = ee.Dictionary(d).combine({}).geetools.sort()
+        assert folded.func is None
+        assert list(folded.getInfo()) == list(computed.getInfo())
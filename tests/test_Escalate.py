@@ -0,0 +1,77 @@
+"""Test the ee_escalate module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+def reduction(tileScale=1, bestEffort=False, scale=10):
+    """Mimic a reduction running out of memory below a tileScale of 4 and of pixels at 10m."""
+    if tileScale < 4:
+        raise ee.EEException("User memory limit exceeded.")
+    if scale == 10 and not bestEffort:
+        raise ee.EEException("Image.reduceRegion: Too many pixels in the region.")
+    return ee.Number(scale).add(tileScale)
+
+
+class TestEscalate:
+    """Test the escalate function."""
+
+    def test_no_escalation(self):
+        value, attempts = ee.geetools.escalate(reduction, {"tileScale": 4, "bestEffort": True})
+        assert value == 14
+        assert len(attempts) == 1
+
+    def test_tile_scale(self):
+        params = {"tileScale": 1, "bestEffort": True}
+        value, attempts = ee.geetools.escalate(reduction, params)
+        assert value == 14
+        assert [a["tileScale"] for a in attempts] == [1, 2, 4]
+        assert attempts[-1]["error"] is None
+
+    def test_best_effort(self):
+        params = {"tileScale": 4, "bestEffort": False}
+        value, attempts = ee.geetools.escalate(reduction, params)
+        assert value == 14
+        assert attempts[-1]["bestEffort"] is True
+
+    def test_scale(self):
+        value, attempts = ee.geetools.escalate(reduction, {"tileScale": 4, "scale": 10})
+        assert value == 24
+        assert attempts[-1]["scale"] == 20
+
+    def test_budget(self):
+        with pytest.raises(ee.EEException, match="memory"):
+            ee.geetools.escalate(reduction, {"tileScale": 1}, budget=1)
+
+    def test_fatal(self):
+        def fatal():
+            raise ee.EEException("Image.load: Image asset not found.")
+
+        with pytest.raises(ee.EEException, match="not found"):
+            ee.geetools.escalate(fatal, {})
+
+    def test_split(self):
+        def byRegions(regions):
+            if regions.size().getInfo() > 1:
+                raise ee.EEException("Computation timed out.")
+            return ee.Dictionary.fromLists(regions.aggregate_array("name"), [1])
+
+        features = [ee.Feature(None, {"name": n}) for n in ["a", "b", "c"]]
+        params = {"regions": ee.FeatureCollection(features)}
+        value, attempts = ee.geetools.escalate(byRegions, params, budget=4, split="regions")
+        assert value == {"a": 1, "b": 1, "c": 1}
+        assert max(a["splits"] for a in attempts) == 2
+
+    def test_split_budget(self):
+        calls = []
+
+        def byRegions(regions):
+            calls.append(regions)
+            raise ee.EEException("Computation timed out.")
+
+        features = [ee.Feature(None, {"name": str(i)}) for i in range(16)]
+        params = {"regions": ee.FeatureCollection(features)}
+        with pytest.raises(ee.EEException, match="timed out"):
+            ee.geetools.escalate(byRegions, params, budget=5, split="regions")
+        assert len(calls) <= 6
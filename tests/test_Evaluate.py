@@ -0,0 +1,66 @@
+"""Test the ee_evaluate module."""
+import asyncio
+
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+class TestEvaluateMany:
+    """Test the evaluate_many function."""
+
+    def test_list(self):
+        objs = [ee.Number(1).add(1), ee.String("a").cat("b"), ee.List([1, 2]).size()]
+        assert ee.geetools.evaluate_many(objs) == [2, "ab", 2]
+
+    def test_dict(self):
+        objs = {"number": ee.Number(1).add(1), "string": ee.String("a").cat("b")}
+        assert ee.geetools.evaluate_many(objs) == {"number": 2, "string": "ab"}
+
+    def test_client_values(self):
+        objs = [None, ee.Number(1).add(1), "client"]
+        assert ee.geetools.evaluate_many(objs) == [None, 2, "client"]
+
+    def test_single_request(self):
+        objs = [ee.Number(i).add(1) for i in range(5)]
+        with ee.geetools.Profiler() as p:
+            values = ee.geetools.evaluate_many(objs)
+        assert values == [1, 2, 3, 4, 5]
+        assert len(p.calls) == 1
+
+    def test_batches(self):
+        objs = [ee.Number(i).add(1) for i in range(5)]
+        with ee.geetools.Profiler() as p:
+            values = ee.geetools.evaluate_many(objs, max_bytes=1)
+        assert values == [1, 2, 3, 4, 5]
+        assert len(p.calls) == 5
+
+
+class TestEvaluator:
+    """Test the Evaluator class."""
+
+    def test_map(self):
+        objs = [ee.Number(i).add(1) for i in range(10)]
+        assert ee.geetools.Evaluator(max_workers=4).map(objs) == list(range(1, 11))
+
+    def test_as_completed(self):
+        objs = {"number": ee.Number(1).add(1), "string": ee.String("a").cat("b")}
+        values = dict(ee.geetools.Evaluator().as_completed(objs))
+        assert values == {"number": 2, "string": "ab"}
+
+    def test_gather(self):
+        objs = [ee.Number(i).add(1) for i in range(10)]
+        values = asyncio.run(ee.geetools.Evaluator(max_workers=2).gather(objs))
+        assert values == list(range(1, 11))
+
+    def test_errors(self):
+        objs = [ee.Number(1).add(1), ee.Dictionary({}).get("missing")]
+        values = ee.geetools.Evaluator(return_exceptions=True).map(objs)
+        assert values[0] == 2
+        assert isinstance(values[1], ee.EEException)
+
+    def test_raise_errors(self):
+        objs = [ee.Number(1).add(1), ee.Dictionary({}).get("missing")]
+        with pytest.raises(ee.EEException):
+            ee.geetools.Evaluator().map(objs)
@@ -1,4 +1,7 @@
 """Test the ``Export`` class."""
+import json
+from unittest.mock import MagicMock, patch
+
 import ee
 import pytest
 from ee.cli.utils import wait_for_task
@@ -25,8 +28,133 @@ class TestImageCollection:
         ic = ee.ImageCollection((gee_test_folder / "ic_to_asset").as_posix())
         assert ic.size().getInfo() == 2
 
+    def test_reduce_regions(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        task_list = ee.batch.Export.geetools.imagecollection.reduceRegions(
+            imagecollection=ee.ImageCollection("MODIS/061/MOD13A1").select("NDVI"),
+            collection=ee.FeatureCollection("projects/google/charts_feature_example"),
+            reducer="mean",
+            description="ndvi stats",
+            start="2020-01-15",
+            end="2020-03-02",
+            scale=500,
+            manifest=manifest,
+        )
+        assert [t.config["description"] for t in task_list] == [
+            "ndvi_stats_2020-01",
+            "ndvi_stats_2020-02",
+            "ndvi_stats_2020-03",
+        ]
+        content = json.loads(manifest.read_text())
+        assert content["chunks"][0]["file"] == "ndvi_stats_2020-01.csv"
+
+    def test_reduce_regions_wrong_chunk(self):
+        with pytest.raises(ValueError):
+            ee.batch.Export.geetools.imagecollection.reduceRegions(
+                self.ic, ee.FeatureCollection([]), "mean", "foo", chunk="week"
+            )
+
+    def test_merge_manifest(self, tmp_path):
+        chunks = [{"window": w, "file": f"foo_{w}.csv"} for w in ["2020-01", "2020-02"]]
+        content = {"destination": "drive", "fileFormat": "csv", "chunks": chunks}
+        (tmp_path / "manifest.json").write_text(json.dumps(content))
+        [(tmp_path / c["file"]).write_text("a,b\n1,2\n3,4\n") for c in chunks]
+        df = ee.batch.Export.geetools.mergeManifest(tmp_path / "manifest.json", tmp_path)
+        assert len(df) == 4
+        assert df.window.unique().tolist() == ["2020-01", "2020-02"]
+
     @property
     def ic(self):
         """Return a test image collection."""
         image_list = [ee.Image(i).set("index", f"image_{i}") for i in range(2)]
         return ee.ImageCollection(image_list)
+
+
+class TestReport:
+    """Test the accounting report of the export tasks."""
+
+    def test_operations(self):
+        df = ee.batch.Export.geetools.operations(self.operations)
+        assert df.loc["projects/foo/operations/A", "eecu"] == 120.5
+        assert df.loc["projects/foo/operations/A", "runtime"] == 600.5
+        assert df.loc["projects/foo/operations/A", "queued"] == 60
+        assert df.loc["projects/foo/operations/B", "error"] == "User memory limit exceeded."
+
+    def test_report_by_prefix(self):
+        df = ee.batch.Export.geetools.report(self.operations)
+        assert df.index.tolist() == ["s2_2020", "l8"]
+        assert df.loc["s2_2020", "tasks"] == 2
+        assert df.loc["s2_2020", "failed"] == 1
+        assert df.loc["s2_2020", "eecu_total"] == 120.5
+
+    def test_report_by_tag(self):
+        tags = {"l8_1": "landsat"}
+        df = ee.batch.Export.geetools.report(self.operations, by="tag", tags=tags)
+        assert sorted(df.index.tolist()) == ["landsat", "untagged"]
+
+    def test_report_wrong_grouping(self):
+        with pytest.raises(ValueError):
+            ee.batch.Export.geetools.report(self.operations, by="foo")
+
+    @property
+    def operations(self):
+        """Return a list of operations as returned by the server."""
+        A = {"description": "s2_2020_01", "state": "SUCCEEDED", "batchEecuUsageSeconds": 120.5}
+        A.update(createTime="2024-01-01T00:00:00Z", startTime="2024-01-01T00:01:00Z")
+        A.update(endTime="2024-01-01T00:11:00.5Z")
+        B = {"description": "s2_2020_02", "state": "FAILED", "createTime": "2024-01-01T00:00:00Z"}
+        C = {"description": "l8_1", "state": "RUNNING", "createTime": "2024-01-01T00:00:00Z"}
+        return [
+            {"name": "projects/foo/operations/A", "metadata": A},
+            {
+                "name": "projects/foo/operations/B",
+                "metadata": B,
+                "error": {"message": "User memory limit exceeded."},
+            },
+            {"name": "projects/foo/operations/C", "metadata": C},
+        ]
+
+
+class TestStartWithRetry:
+    """Test the automatic resubmission of the failed tasks."""
+
+    def test_escalate_tile_scale(self):
+        with patch("time.sleep"):
+            df = ee.batch.Export.geetools.startWithRetry(
+                self.factory, [{"tileScale": 1}], backoff=0
+            )
+        assert df.state.tolist() == ["FAILED", "FAILED", "COMPLETED"]
+        assert df.params.iloc[-1] == {"tileScale": 4}
+
+    def test_budget(self):
+        with patch("time.sleep"):
+            df = ee.batch.Export.geetools.startWithRetry(
+                self.factory, [{"tileScale": 1}], budget=1, backoff=0
+            )
+        assert df.state.tolist() == ["FAILED", "FAILED"]
+
+    def test_tile_error(self):
+        task = MagicMock(id="foo")
+        task.status.return_value = {"state": "FAILED", "error_message": "Tile error: Bad band."}
+        with patch("time.sleep"):
+            df = ee.batch.Export.geetools.startWithRetry(
+                lambda **kwargs: task, [{"tileScale": 1}], backoff=0
+            )
+        assert df.category.tolist() == ["fatal"]
+
+    def test_fatal(self):
+        with patch("time.sleep"):
+            df = ee.batch.Export.geetools.startWithRetry(self.factory, [{"foo": 1}], backoff=0)
+        assert df.category.tolist() == ["fatal"]
+
+    @staticmethod
+    def factory(**kwargs):
+        """Create a fake task that runs out of memory with a tileScale lower than 4."""
+        task = MagicMock(id="foo")
+        if "tileScale" not in kwargs:
+            task.status.return_value = {"state": "FAILED", "error_message": "Asset not found."}
+        elif kwargs["tileScale"] < 4:
+            task.status.return_value = {"state": "FAILED", "error_message": "Out of memory."}
+        else:
+            task.status.return_value = {"state": "COMPLETED"}
+        return task
@@ -77,6 +77,23 @@ class TestToPolygons:
         assert vertex.sum() == 66
 
 
+class TestToGeoDataFrame:
+    """Test the ``toGeoDataFrame`` method."""
+
+    def test_to_geodataframe(self, gaul_3_countries):
+        gdf = gaul_3_countries.geetools.toGeoDataFrame(pageSize=2)
+        expected = gpd.GeoDataFrame.from_features(gaul_3_countries.getInfo())
+        assert len(gdf) == 3
+        assert gdf.crs == "EPSG:4326"
+        assert sorted(gdf.ADM0_NAME) == sorted(expected.ADM0_NAME)
+
+    def test_missing_properties(self):
+        features = [ee.Feature(None, {"a": 1}), ee.Feature(None, {"b": 2})]
+        gdf = ee.FeatureCollection(features).geetools.toGeoDataFrame()
+        assert gdf.a.tolist()[0] == 1 and gdf.b.tolist()[1] == 2
+        assert gdf.a.isna().tolist()[1] and gdf.b.isna().tolist()[0]
+
+
 class TestByProperties:
     """Test the ``byProperties`` method."""
 
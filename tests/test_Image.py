@@ -577,6 +577,16 @@ class TestMaskCover:
         ratio = self.image.geetools.maskCoverRegion(aoi, scale=10)
         assert isclose(ratio.getInfo(), 9.99, abs_tol=0.01)
 
+    def test_mask_cover_region_auto_escalate(self):
+        aoi = ee.Geometry.Point([12.210900891755129, 41.928551351175386]).buffer(2200)
+        ratio = self.image.geetools.maskCoverRegion(aoi, scale=10, autoEscalate=2)
+        assert isclose(ratio.getInfo(), 9.99, abs_tol=0.01)
+
+    def test_mask_cover_region_auto_escalate_tile_scale(self):
+        aoi = ee.Geometry.Point([12.210900891755129, 41.928551351175386]).buffer(2200)
+        ratio = self.image.geetools.maskCoverRegion(aoi, scale=10, autoEscalate=2, tileScale=2)
+        assert isclose(ratio.getInfo(), 9.99, abs_tol=0.01)
+
     def test_mask_cover_region_zero(self):
         aoi = ee.Geometry.Point([11.880190936531116, 42.0159494554553]).buffer(1000)
         ratio = self.image.geetools.maskCoverRegion(aoi, scale=10)
@@ -203,6 +203,11 @@ class TestOutliers:
 class TestToXarray:
     """Test the ``toXarray`` method."""
 
+    def test_request_byte_limit(self):
+        from xee.ext import REQUEST_BYTE_LIMIT
+
+        assert geetools.ee_image_collection.REQUEST_BYTE_LIMIT == REQUEST_BYTE_LIMIT
+
     def test_to_xarray(self, s2_sr, data_regression):
         ds = s2_sr.geetools.to_xarray()
 
@@ -254,6 +259,37 @@ class TestContainsBandNames:
         assert ic.size().getInfo() == 0
 
 
+class TestSchema:
+    """Test the ``schema`` method."""
+
+    def test_schema(self, s2_sr):
+        schema = s2_sr.geetools.schema()
+        assert schema["bandNames"] == s2_sr.first().bandNames().getInfo()
+        assert list(schema["bandTypes"]) == schema["bandNames"]
+        assert list(schema["projections"]) == schema["bandNames"]
+        assert "system:index" in schema["propertyNames"]
+
+    def test_schema_is_cached(self, s2_sr):
+        schema = s2_sr.geetools.schema()
+        with ee.geetools.Profiler() as p:
+            assert s2_sr.geetools.schema() is schema
+        assert len(p.calls) == 0
+
+    def test_derived_collection(self, s2_sr):
+        s2_sr.geetools.schema()
+        outliers = s2_sr.limit(3).geetools.outliers()
+        assert "Collection.first" in str(ee.serializer.encode(outliers))
+
+    def test_literal_band_names(self, s2_sr):
+        schema = s2_sr.geetools.schema()
+        outliers = s2_sr.geetools.outliers()
+        assert (
+            outliers.first().bandNames().getInfo()[: len(schema["bandNames"])]
+            == schema["bandNames"]
+        )
+        assert "Collection.first" not in str(ee.serializer.encode(outliers))
+
+
 class TestAggregateArray:
     """Test the ``aggregateArray`` method."""
 
@@ -401,6 +437,20 @@ class TestReduceInterval:
             num_regression.check(values)
 
 
+class TestReduceBy:
+    """Test the ``reduceBy`` method."""
+
+    def test_reduce_by(self, s2_sr, amazonas):
+        ic = s2_sr.limit(10)
+        reduced = ic.geetools.reduceBy("SENSING_ORBIT_NUMBER", "max")
+        orbits = ic.aggregate_array("SENSING_ORBIT_NUMBER").distinct()
+        assert reduced.aggregate_array("SENSING_ORBIT_NUMBER").getInfo() == orbits.getInfo()
+        assert reduced.first().bandNames().getInfo() == ic.first().bandNames().getInfo()
+        expected = ic.filter(ee.Filter.eq("SENSING_ORBIT_NUMBER", orbits.get(0))).max()
+        expected = ee.ImageCollection([expected])
+        assert reduce(reduced, amazonas).getInfo() == reduce(expected, amazonas).getInfo()
+
+
 class TestClosestDate:
     """Test the ``closestDate`` method."""
 
@@ -0,0 +1,87 @@
+"""Test the ee_initialize module."""
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from geetools.ee_initialize import _user_credentials
+
+TOKENS = {"refresh_token": "r", "client_id": "c", "client_secret": "s", "project_id": "p"}
+
+
+def utcnow() -> datetime:
+    """Return the current naive UTC time like google-auth."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture
+def credential_pathname(tmp_path):
+    """Save a fake user named "test" and return the credential path."""
+    folder = tmp_path / "credentialstest"
+    folder.mkdir()
+    (folder / "credentialstest").write_text(json.dumps(TOKENS))
+    return str(tmp_path / "credentials")
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    """Replace the refresh of the credentials by a local one and return the list of refreshes."""
+    refreshes = []
+
+    def refresh(self, request):
+        refreshes.append(self.refresh_token)
+        self.token = f"token-{len(refreshes)}"
+        self.expiry = utcnow() + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+    return refreshes
+
+
+class TestTokenCache:
+    """Test the access token cache of the user credentials."""
+
+    def test_reuse_token(self, credential_pathname, refreshes):
+        first, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        first.refresh(None)
+        second, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        assert second.valid
+        assert second.token == first.token
+        assert len(refreshes) == 1
+
+    def test_refresh_once(self, credential_pathname, refreshes):
+        credentials = [_user_credentials("test", credential_pathname, True)[0] for _ in range(8)]
+        threads = [threading.Thread(target=c.refresh, args=(None,)) for c in credentials]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        assert len(refreshes) == 1
+        assert len({c.token for c in credentials}) == 1
+
+    def test_expired_token(self, credential_pathname, refreshes):
+        first, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        first.refresh(None)
+        cache = first._cache
+        entry = json.loads(cache.read_text())
+        entry["expiry"] = utcnow().isoformat()
+        cache.write_text(json.dumps(entry))
+        second, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        assert not second.valid
+        second.refresh(None)
+        assert second.token == "token-2"
+
+    def test_other_user(self, credential_pathname, refreshes):
+        first, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        first.refresh(None)
+        second, _ = _user_credentials("test", credential_pathname, cache_token=True)
+        second._refresh_token = "other"
+        second.token = None
+        second.refresh(None)
+        assert refreshes == ["r", "other"]
+
+    def test_no_cache(self, credential_pathname, refreshes):
+        credentials, _ = _user_credentials("test", credential_pathname)
+        credentials.refresh(None)
+        assert credentials._cache is None
+        assert not list(Path(credential_pathname).parent.glob(".*.token"))
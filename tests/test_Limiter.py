@@ -0,0 +1,80 @@
+"""Test the ee_limiter module."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+def throttle():
+    """Raise a throttling error like the server."""
+    raise ee.EEException("Too many requests: 429")
+
+
+class TestLimiter:
+    """Test the Limiter class."""
+
+    def test_call(self):
+        limiter = ee.geetools.Limiter()
+        assert limiter.call("computeValue", lambda x: x + 1, 1) == 2
+        assert limiter.metrics().loc["computeValue", "calls"] == 1
+
+    def test_increase(self):
+        limiter = ee.geetools.Limiter(concurrency=4)
+        [limiter.call("computeValue", lambda: None) for _ in range(4)]
+        assert 4.9 < limiter.limit < 5
+
+    def test_decrease(self):
+        limiter = ee.geetools.Limiter(concurrency=8)
+        with pytest.raises(ee.EEException):
+            limiter.call("computeValue", throttle)
+        assert limiter.limit == 4
+        assert limiter.metrics().loc["computeValue", "throttled"] == 1
+
+    def test_decrease_once(self):
+        limiter = ee.geetools.Limiter(concurrency=8, max_concurrency=8)
+        barrier = threading.Barrier(4)
+
+        def burst():
+            barrier.wait()
+            throttle()
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(limiter.call, "computeValue", burst) for _ in range(4)]
+        assert all(isinstance(f.exception(), ee.EEException) for f in futures)
+        assert limiter.limit == 4
+
+    def test_concurrency(self):
+        limiter = ee.geetools.Limiter(concurrency=2, max_concurrency=2)
+        active = []
+
+        def request():
+            active.append(limiter.active)
+            time.sleep(0.01)
+
+        with ThreadPoolExecutor(8) as executor:
+            [executor.submit(limiter.call, "computeValue", request) for _ in range(16)]
+        assert max(active) == 2
+
+    def test_rate(self):
+        limiter = ee.geetools.Limiter(rates={"startTask": 50}, burst=1)
+        start = time.monotonic()
+        [limiter.call("startTask", lambda: None) for _ in range(6)]
+        assert time.monotonic() - start >= 0.1
+
+    def test_context(self):
+        default = ee.geetools.Limiter.current
+        with ee.geetools.Limiter(concurrency=1, min_concurrency=1) as limiter:
+            ee.geetools.cached_getInfo(ee.Number(1).add(1))
+            assert limiter.metrics().loc["computeValue", "calls"] == 1
+        assert ee.geetools.Limiter.current is default
+
+    def test_opt_in(self):
+        assert ee.geetools.Limiter.current is None
+
+    def test_wrong_backoff(self):
+        with pytest.raises(ValueError):
+            ee.geetools.Limiter(backoff=2)
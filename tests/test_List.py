@@ -1,5 +1,6 @@
 """Test the List class methods."""
 import ee
+import pytest
 
 
 class TestProduct:
@@ -112,3 +113,57 @@ class TestJoin:
     def test_join_with_separator(self, mix_list):
         formatted = mix_list.geetools.join(separator="; ")
         assert formatted.getInfo() == "a; 1; Image"
+
+
+class TestConstantFolding:
+    """Test that the constant inputs are computed client-side like the server would."""
+
+    @pytest.mark.parametrize(
+        "l1, l2",
+        [
+            (["a", "b", "c"], ["b", "d"]),
+            ([1, 2, 2, 3], [2.0, 4]),
+            ([], ["a", "a"]),
+            (["1", 1], [1]),
+        ],
+    )
+    @pytest.mark.parametrize("method", ["complement", "intersection", "union"])
+    def test_set_operations(self, method, l1, l2):
+        folded = getattr(ee.List(l1).geetools, method)(l2)
+        computed = getattr(ee.List(l1).slice(0).geetools, method)(l2)
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    @pytest.mark.parametrize("l1, l2", [(["a", "b"], ["c", "d"]), ([], ["a"]), (["é"], ["", "ß"])])
+    def test_product(self, l1, l2):
+        folded = ee.List(l1).geetools.product(l2)
+        computed = ee.List(l1).slice(0).geetools.product(l2)
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    @pytest.mark.parametrize(
+        "ini, end, step",
+        [(1, 10, 3), (0, 11, 2), (1, 10, 0), (5, 1, 1), (-3, 3, -2), (0.5, 4, 1.7)],
+    )
+    def test_sequence(self, ini, end, step):
+        folded = ee.List.geetools.sequence(ini, end, step)
+        computed = ee.List.geetools.sequence(ee.Number(ini).add(0), end, step)
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    def test_size_cap(self):
+        strings = [str(i) for i in range(100)]
+        assert ee.List.geetools.sequence(0, 2_000_000).func is not None
+        assert ee.List(strings).geetools.product(strings).func is not None
+        assert ee.List([strings] * 20).geetools.zip().func is not None
+
+    @pytest.mark.parametrize("lists", [[[1, 2, 3], [4, 5, 6]], [["a"], ["b"], ["c"]], [[], []]])
+    def test_zip(self, lists):
+        folded = ee.List(lists).geetools.zip()
+        computed = ee.List(lists).slice(0).geetools.zip()
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    def test_computed_input(self):
+        union = ee.List(["a"]).geetools.union(ee.List(["b"]).add("c"))
+        assert union.func is not None
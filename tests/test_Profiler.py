@@ -1,4 +1,7 @@
 """Test the ee_profiler module."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import ee
 
 import geetools  # noqa: F401
@@ -13,3 +16,116 @@ class TestProfiler:
     with ee.geetools.Profiler() as p:
         ee.Number(3.14).add(0.00159).getInfo()
     assert [k for k in p.profile] == ["EECU-s", "PeakMem", "Count", "Description"]
+
+
+class TestConcurrentProfiler:
+    """Test the profiling of concurrent evaluations."""
+
+    def test_labels(self):
+        numbers = {f"number_{i}": ee.Number(i).add(1) for i in range(4)}
+        with ee.geetools.Profiler() as p:
+            with ThreadPoolExecutor(4) as executor:
+                values = list(executor.map(p.getInfo, numbers.values(), numbers.keys()))
+        assert values == [1, 2, 3, 4]
+        assert sorted(c["label"] for c in p.calls) == sorted(numbers)
+        assert all(c["thread"] != "MainThread" for c in p.calls)
+        assert p.profile is not None
+
+    def test_by_label(self):
+        with ee.geetools.Profiler() as p:
+            ee.Number(1).add(1).getInfo()
+            with ThreadPoolExecutor(1) as executor:
+                executor.submit(p.getInfo, ee.Number(2).add(1), "worker").result()
+        assert p.byLabel()["Label"].unique().tolist() == ["", "worker"]
+
+
+class TestProfileParsing:
+    """Test the parsing and exploration of the profile output."""
+
+    def test_multi_words_description(self):
+        p = self.profiler(self.output)
+        assert p.profile["Description"][0] == "Algorithm Image.load"
+        assert p.profile["Description"][3] == "Loading assets: COPERNICUS/S2"
+
+    def test_dataframe(self):
+        df = self.profiler(self.output).dataframe
+        assert str(df["PeakMem"].dtype) == "Int64"
+        assert df["Algorithm"].tolist()[:2] == ["Image.load", "(plumbing)"]
+
+    def test_top(self):
+        df = self.profiler(self.output).top(1, by="PeakMem")
+        assert df["Algorithm"].tolist() == ["Image.reduceRegion"]
+
+    def test_by_algorithm(self):
+        df = self.profiler(self.output).byAlgorithm()
+        assert df.loc["Image.load", "Count"] == 14
+
+    def test_diff(self):
+        a = self.profiler(self.output)
+        b = self.profiler(self.output.replace("1.20", "3.00"))
+        df = ee.geetools.Profiler.diff(a, b)
+        assert df.index[0] == "Algorithm Image.reduceRegion"
+        assert df["EECU-s_diff"].iloc[0] == 1.8
+
+    @staticmethod
+    def profiler(output: str):
+        """Create a profiler filled with the provided output."""
+        p = ee.geetools.Profiler()
+        p.profile = p._to_dict(output)
+        return p
+
+    @property
+    def output(self):
+        """A raw profile output as returned by the server."""
+        return (
+            "EECU·s PeakMem Count  Description\n"
+            "  0.38     45k    10  Algorithm Image.load\n"
+            "     -      5k     3  (plumbing)\n"
+            "  1.20    1.2M     2  Algorithm Image.reduceRegion\n"
+            "  0.10     12k     1  Loading assets: COPERNICUS/S2\n"
+            "  0.05     10k     4  Algorithm Image.load\n"
+        )
+
+
+class TestProfileDecorator:
+    """Test the profile decorator and the history comparison."""
+
+    def test_history(self, tmp_path):
+        history = tmp_path / "history.jsonl"
+
+        @ee.geetools.profile(name="foo", history=history)
+        def compute():
+            return ee.Number(3.14).add(0.00159).getInfo()
+
+        compute()
+        compute()
+        lines = history.read_text().splitlines()
+        assert len(lines) == 2
+        assert set(json.loads(lines[0])) == {"name", "timestamp", "eecu", "peak_mem", "profile"}
+
+    def test_history_without_memory(self, tmp_path, monkeypatch):
+        history = tmp_path / "history.jsonl"
+        output = "EECU·s PeakMem Count  Description\n  0.38       -    10  Algorithm Image.load\n"
+
+        def exit(self, *args):
+            self._recording.__exit__(*args)
+            self.profile = self._to_dict(output)
+
+        monkeypatch.setattr(ee.geetools.Profiler, "__exit__", exit)
+
+        @ee.geetools.profile(name="foo", history=history)
+        def compute():
+            return 1
+
+        compute()
+        assert json.loads(history.read_text())["peak_mem"] == 0
+
+    def test_compare_to_history(self, tmp_path):
+        history = tmp_path / "history.jsonl"
+        eecus = [1.0, 1.1, 0.9, 1.0, 2.0]
+        dates = [f"2024-01-0{i + 1}" for i in range(len(eecus))]
+        records = [{"name": "foo", "timestamp": d, "eecu": e} for d, e in zip(dates, eecus)]
+        history.write_text("\n".join(json.dumps(r) for r in records))
+        runs = ee.geetools.compare_to_history("foo", history, threshold=0.2)
+        assert runs["regression"].tolist() == [False, False, False, False, True]
+        assert runs["median"].iloc[-1] == 1.0
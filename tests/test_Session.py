@@ -0,0 +1,53 @@
+"""Test the ee_session module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+@pytest.fixture
+def pool():
+    """Return a pool of 2 sessions using the credentials of the default session."""
+    state = ee.data._get_state()
+    pool = ee.geetools.SessionPool()
+    pool._add("a", state.credentials, state.cloud_api_user_project)
+    pool._add("b", state.credentials, state.cloud_api_user_project)
+    return pool
+
+
+class TestSessionPool:
+    """Test the SessionPool class."""
+
+    def test_session(self, pool):
+        default = ee.data._get_state()
+        with pool.session("b") as session:
+            assert ee.data._get_state() is session.state
+            assert ee.Initialize.geetools.project_id() == session.project
+        assert ee.data._get_state() is default
+
+    def test_round_robin(self, pool):
+        names = []
+        for _ in range(4):
+            with pool.session() as session:
+                names.append(session.name)
+        assert names == ["a", "b", "a", "b"]
+
+    def test_least_load(self, pool):
+        pool.strategy = "least_load"
+        with pool.session() as s1, pool.session() as s2:
+            assert {s1.name, s2.name} == {"a", "b"}
+            assert s1.load == s2.load == 1
+
+    def test_map(self, pool):
+        objs = [ee.Number(i).add(1) for i in range(6)]
+        assert pool.map(objs, max_workers=3) == [1, 2, 3, 4, 5, 6]
+        assert all(s.load == 0 for s in pool.sessions.values())
+
+    def test_empty_pool(self):
+        with pytest.raises(ValueError):
+            with ee.geetools.SessionPool().session():
+                pass
+
+    def test_wrong_strategy(self):
+        with pytest.raises(ValueError):
+            ee.geetools.SessionPool(strategy="random")
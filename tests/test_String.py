@@ -1,5 +1,6 @@
 """Test the String class methods."""
 import ee
+import pytest
 
 
 class TestEq:
@@ -26,3 +27,25 @@ class TestFormat:
         params = {"greeting": "Hello", "name": ee.Number(1)}
         formatted_string = format_string_instance.geetools.format(params)
         assert formatted_string.getInfo() == "Hello 1 !"
+
+
+class TestConstantFolding:
+    """Test that the constant inputs are computed client-side like the server would."""
+
+    @pytest.mark.parametrize(
+        "string, template",
+        [
+            ("{greeting} {name} !", {"greeting": "Hello", "name": "bob"}),
+            ("{a}{a}{b}", {"a": "{b}", "b": "c"}),
+            ("{missing}", {"other": "value"}),
+        ],
+    )
+    def test_format(self, string, template):
+        folded = ee.String(string).geetools.format(template)
+        computed = ee.String(string).cat("").geetools.format(template)
+        assert folded.func is None
+        assert folded.getInfo() == computed.getInfo()
+
+    def test_format_with_special_characters(self):
+        formatted = ee.String("{name}").geetools.format({"name": "$1"})
+        assert formatted.func is not None
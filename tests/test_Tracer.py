@@ -0,0 +1,34 @@
+"""Test the ee_tracer module."""
+import ee
+
+import geetools  # noqa: F401
+
+
+class TestTracer:
+    """Test the Tracer class."""
+
+    def test_tracer(self):
+        with ee.geetools.Tracer() as t:
+            ee.Number(3.14).add(0.00159).getInfo()
+        assert t.dataframe.endpoint.tolist() == ["computeValue"]
+        assert t.dataframe.caller.tolist() == ["<user>"]
+        assert t.calls[0]["sent"] > 0
+
+    def test_restore(self):
+        computeValue = ee.data.computeValue
+        with ee.geetools.Tracer():
+            assert ee.data.computeValue is not computeValue
+        assert ee.data.computeValue is computeValue
+
+    def test_geetools_caller(self):
+        with ee.geetools.Tracer() as t:
+            ee.Asset("projects/google/charts_feature_example").exists()
+        assert t.dataframe.caller.tolist() == ["Asset.exists"]
+
+    def test_summary(self):
+        with ee.geetools.Tracer() as t:
+            ee.Number(1).getInfo()
+            ee.Number(2).getInfo()
+        summary = t.summary()
+        assert summary.loc[("<user>", "computeValue"), "count"] == 2
+        assert "computeValue x2" in t.flame()
@@ -0,0 +1,118 @@
+"""Test the ee_transport module."""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import ee
+import httplib2
+import pytest
+
+import geetools  # noqa: F401
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer with the next status of the server and count the requests and connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        content = gzip.compress(b"ok") if self.path == "/gzip" else b"ok"
+        self.send_response(status)
+        if self.path == "/gzip":
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Start a local server answering with the statuses listed in ``server.statuses``."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.statuses, server.requests, server.connections = [], 0, 0
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestTransport:
+    """Test the Transport class."""
+
+    def test_keep_alive(self, server):
+        transport = ee.geetools.Transport()
+        assert all(transport.get(server.url).ok for _ in range(5))
+        assert server.requests == 5
+        assert server.connections == 1
+
+    def test_retry(self, server):
+        server.statuses = [503, 429]
+        response = ee.geetools.Transport(backoff=0).get(server.url)
+        assert response.status_code == 200
+        assert server.requests == 3
+
+    def test_retries_exhausted(self, server):
+        server.statuses = [500] * 5
+        response = ee.geetools.Transport(retries=2, backoff=0).get(server.url)
+        assert response.status_code == 500
+        assert server.requests == 3
+
+    def test_http(self, server):
+        response, content = ee.geetools.Transport().http().request(server.url)
+        assert response.status == 200
+        assert content == b"ok"
+
+    def test_http_no_status_retry(self, server):
+        server.statuses = [503]
+        response, _ = ee.geetools.Transport(backoff=0).http().request(server.url, "POST", b"{}")
+        assert response.status == 503
+        assert server.requests == 1
+
+    def test_http_decoded_content(self, server):
+        response, content = ee.geetools.Transport().http().request(f"{server.url}/gzip")
+        assert content == b"ok"
+        assert "content-encoding" not in response
+        assert "content-length" not in response
+
+    def test_http_redirect(self, server):
+        response, _ = ee.geetools.Transport().http().request(f"{server.url}/redirect")
+        assert response.status == 200
+        assert server.requests == 2
+
+    def test_http_redirect_limit(self, server):
+        http = ee.geetools.Transport().http()
+        with pytest.raises(httplib2.RedirectLimit):
+            http.request(f"{server.url}/redirect", redirections=0)
+        assert server.requests == 1
+
+    def test_opt_in(self):
+        assert ee.geetools.Transport.current is None
+
+    def test_http_connection_error(self):
+        http = ee.geetools.Transport(retries=0).http()
+        with pytest.raises(ConnectionError):
+            http.request("http://127.0.0.1:1")
+
+    def test_wrong_pool_size(self):
+        with pytest.raises(ValueError):
+            ee.geetools.Transport(pool_size=0)